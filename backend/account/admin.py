@@ -31,6 +31,7 @@ class TeacherProfileAdmin(admin.ModelAdmin):
     list_filter = ('designation', 'department')
     search_fields = ('user__email', 'user__first_name', 'user__last_name', 'employee_id')
     autocomplete_fields = ['user', 'department']
+    list_select_related = ('user', 'department')
     list_per_page = 25
     readonly_fields = ('created_at', 'updated_at')
 
@@ -42,6 +43,7 @@ class StudentProfileAdmin(admin.ModelAdmin):
     search_fields = ('registration_number', 'user__email', 'user__first_name', 'user__last_name')
     autocomplete_fields = ['user', 'section', 'created_by', 'updated_by']
     readonly_fields = ('created_at', 'updated_at')
+    list_select_related = ('user', 'section')
     list_per_page = 25
 
 
@@ -52,4 +54,5 @@ class AdminProfileAdmin(admin.ModelAdmin):
     search_fields = ('user__email', 'user__first_name', 'user__last_name')
     autocomplete_fields = ['user', 'department', 'created_by', 'updated_by']
     readonly_fields = ('created_at', 'updated_at')
+    list_select_related = ('user', 'department')
     list_per_page = 25
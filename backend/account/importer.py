@@ -0,0 +1,286 @@
+import codecs
+import csv
+import json
+from collections import Counter
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+
+import django
+from django.contrib.auth.hashers import make_password
+from django.db import IntegrityError, router, transaction
+from django.db.models.functions import Lower
+from rest_framework import serializers
+
+from department.counters import adjust_enrollment, adjust_faculty
+from department.models import Department, Section
+
+from .models import StudentProfile, TeacherProfile, User, UserTypeEnum
+from .search import TEACHER_FIELDS, USER_FIELDS, build_document, get_search_backend
+
+FORMATS = ('csv', 'ndjson')
+
+
+class ImportRowSerializer(serializers.Serializer):
+    email = serializers.EmailField()
+    username = serializers.CharField(max_length=150, required=False, allow_blank=True)
+    first_name = serializers.CharField(max_length=150, required=False, allow_blank=True)
+    last_name = serializers.CharField(max_length=150, required=False, allow_blank=True)
+    user_type = serializers.ChoiceField(choices=[UserTypeEnum.STUDENT, UserTypeEnum.TEACHER])
+    password = serializers.CharField(required=False, allow_blank=True)
+
+    # StudentProfile
+    section_code = serializers.CharField(required=False, allow_blank=True)
+    registration_number = serializers.CharField(max_length=50, required=False, allow_blank=True)
+    admission_year = serializers.IntegerField(required=False, min_value=0)
+    batch_year = serializers.IntegerField(required=False, min_value=0)
+    current_semester = serializers.IntegerField(required=False, min_value=1)
+    program_type = serializers.CharField(max_length=50, required=False, allow_blank=True)
+    date_of_birth = serializers.DateField(required=False)
+
+    # TeacherProfile
+    employee_id = serializers.CharField(max_length=50, required=False, allow_blank=True)
+    designation = serializers.CharField(max_length=100, required=False, allow_blank=True)
+    qualification = serializers.CharField(max_length=100, required=False, allow_blank=True)
+    experience_years = serializers.FloatField(required=False, min_value=0)
+    department_code = serializers.CharField(required=False, allow_blank=True)
+    office_location = serializers.CharField(max_length=100, required=False, allow_blank=True)
+
+    STUDENT_REQUIRED = ('section_code', 'admission_year', 'batch_year', 'date_of_birth')
+    TEACHER_REQUIRED = ('designation', 'qualification')
+
+    def to_internal_value(self, data):
+        if not isinstance(data, Mapping):
+            # Let the serializer report an NDJSON line that is not an object.
+            return super().to_internal_value(data)
+        # CSV cells are always strings; treat empty cells as missing values.
+        data = {key: value for key, value in data.items() if value not in ('', None)}
+        return super().to_internal_value(data)
+
+    def validate(self, attrs):
+        required = self.STUDENT_REQUIRED if attrs['user_type'] == UserTypeEnum.STUDENT else self.TEACHER_REQUIRED
+        missing = {name: ["This field is required."] for name in required if not attrs.get(name)}
+        if missing:
+            raise serializers.ValidationError(missing)
+        attrs['email'] = attrs['email'].lower()
+        attrs.setdefault('username', attrs['email'])
+        return attrs
+
+
+class MalformedRow:
+    """Stands in for a row that could not be parsed, so the import reports it and carries on."""
+
+    def __init__(self, error):
+        self.error = error
+
+
+def _decode_lines(stream, undecodable):
+    """Decode ``stream`` line by line, counting lines that are not UTF-8 in ``undecodable``."""
+    for number, raw in enumerate(stream):
+        if number == 0 and raw.startswith(codecs.BOM_UTF8):
+            raw = raw[len(codecs.BOM_UTF8):]
+        try:
+            yield raw.decode('utf-8')
+        except UnicodeDecodeError:
+            undecodable.append(number)
+            yield raw.decode('utf-8', 'replace')
+
+
+def iter_rows(stream, file_format='csv'):
+    """
+    Yield dict rows from a binary stream of CSV (with a header line) or NDJSON, one
+    line at a time. Rows that cannot be decoded or parsed are yielded as
+    ``MalformedRow`` instead of ending the import.
+    """
+    if file_format not in FORMATS:
+        raise ValueError(f"Unsupported import format: {file_format}")
+    undecodable = []
+    lines = _decode_lines(stream, undecodable)
+    if file_format == 'csv':
+        reader = csv.DictReader(lines)
+        while True:
+            try:
+                row = next(reader)
+            except StopIteration:
+                return
+            except csv.Error as exc:
+                row = MalformedRow(f"Invalid CSV: {exc}")
+            # Lines are decoded as the reader asks for them, so any bad one belongs to this row.
+            if undecodable:
+                undecodable.clear()
+                row = MalformedRow("Not valid UTF-8.")
+            yield row
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        if undecodable:
+            undecodable.clear()
+            yield MalformedRow("Not valid UTF-8.")
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError as exc:
+            yield MalformedRow(f"Invalid JSON: {exc}")
+
+
+def _init_worker():
+    django.setup()
+
+
+class UserImporter:
+    """
+    Create ``User`` rows together with their student or teacher profile in chunks.
+
+    Each chunk is validated with a handful of set-based lookups, its passwords are
+    hashed on a process pool (hashing dominates the cost of an import), and it is
+    inserted with ``bulk_create`` in its own transaction, so a bad row only fails
+    itself and a crash loses at most one chunk.
+    """
+
+    def __init__(self, chunk_size=500, workers=1):
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self.created = 0
+        self.errors = []
+        self._seen = {'email': set(), 'username': set(), 'registration_number': set(), 'employee_id': set()}
+        self._sections = {}
+        self._departments = {}
+
+    def run(self, rows):
+        pool = ProcessPoolExecutor(self.workers, initializer=_init_worker) if self.workers > 1 else nullcontext()
+        with pool as executor:
+            self._executor = executor
+            chunk = []
+            for line, row in enumerate(rows, start=1):
+                chunk.append((line, row))
+                if len(chunk) >= self.chunk_size:
+                    self._import_chunk(chunk)
+                    chunk = []
+            if chunk:
+                self._import_chunk(chunk)
+        self.errors.sort(key=lambda error: error['row'])
+        return {'created': self.created, 'failed': len(self.errors), 'errors': self.errors}
+
+    def _import_chunk(self, chunk):
+        valid = []
+        for line, row in chunk:
+            if isinstance(row, MalformedRow):
+                self.errors.append({'row': line, 'errors': {'non_field_errors': [row.error]}})
+                continue
+            serializer = ImportRowSerializer(data=row)
+            if serializer.is_valid():
+                valid.append((line, serializer.validated_data))
+            else:
+                self.errors.append({'row': line, 'errors': serializer.errors})
+
+        valid = self._resolve_references(valid)
+        valid = self._check_uniqueness(valid)
+        if not valid:
+            return
+
+        passwords = [attrs.get('password') or None for _, attrs in valid]
+        if self._executor is not None:
+            hashes = list(self._executor.map(make_password, passwords, chunksize=max(1, len(passwords) // self.workers)))
+        else:
+            hashes = [make_password(password) for password in passwords]
+
+        users, students, teachers, documents = [], [], [], []
+        for (_, attrs), password in zip(valid, hashes):
+            user = User(
+                email=attrs['email'], username=attrs['username'], password=password,
+                first_name=attrs.get('first_name', ''), last_name=attrs.get('last_name', ''),
+                user_type=attrs['user_type'],
+            )
+            users.append(user)
+            if attrs['user_type'] == UserTypeEnum.STUDENT:
+                students.append(StudentProfile(
+                    user=user, section_id=attrs['section_id'],
+                    registration_number=attrs.get('registration_number'),
+                    admission_year=attrs['admission_year'], batch_year=attrs['batch_year'],
+                    current_semester=attrs.get('current_semester', 1),
+                    program_type=attrs.get('program_type', ''), date_of_birth=attrs['date_of_birth'],
+                ))
+            else:
+                teachers.append(TeacherProfile(
+                    user=user, department_id=attrs.get('department_id'),
+                    employee_id=attrs.get('employee_id'), designation=attrs['designation'],
+                    qualification=attrs['qualification'], experience_years=attrs.get('experience_years', 0),
+                    office_location=attrs.get('office_location', ''),
+                ))
+            documents.append((user.pk, build_document(
+                *(getattr(user, name) for name in USER_FIELDS),
+                *(attrs.get(name) for name in TEACHER_FIELDS),
+            )))
+
+        try:
+            with transaction.atomic():
+                User.objects.bulk_create(users)
+                StudentProfile.objects.bulk_create(students)
+                TeacherProfile.objects.bulk_create(teachers)
+                # bulk_create sends no post_save, so index the new users here.
+                get_search_backend(router.db_for_write(User)).add_documents(documents)
+                # Nor does it maintain the headcount counters.
+                for section_id, count in Counter(student.section_id for student in students).items():
+                    adjust_enrollment(section_id, count)
+                for department_id, count in Counter(teacher.department_id for teacher in teachers).items():
+                    adjust_faculty(department_id, count)
+        except IntegrityError as exc:
+            # Lost a race with a concurrent write; the whole chunk is rolled back.
+            self.errors.extend({'row': line, 'errors': {'non_field_errors': [str(exc)]}} for line, _ in valid)
+            return
+        self.created += len(users)
+
+    def _check_uniqueness(self, valid):
+        # Deleted rows still hold their unique values, so check them too.
+        existing = {
+            # Rows arrive lowercased, but users created elsewhere keep the case they were given.
+            'email': set(User.all_objects.annotate(lower_email=Lower('email')).filter(
+                lower_email__in=[a['email'] for _, a in valid]
+            ).values_list('lower_email', flat=True)),
+            'username': set(User.all_objects.filter(username__in=[a['username'] for _, a in valid]).values_list('username', flat=True)),
+            'registration_number': set(StudentProfile.all_objects.filter(
+                registration_number__in=[a['registration_number'] for _, a in valid if a.get('registration_number')]
+            ).values_list('registration_number', flat=True)),
+            'employee_id': set(TeacherProfile.all_objects.filter(
+                employee_id__in=[a['employee_id'] for _, a in valid if a.get('employee_id')]
+            ).values_list('employee_id', flat=True)),
+        }
+        accepted = []
+        for line, attrs in valid:
+            errors = {}
+            for name, seen in self._seen.items():
+                value = attrs.get(name)
+                if value and (value in seen or value in existing[name]):
+                    errors[name] = [f"{value} already exists."]
+            if errors:
+                self.errors.append({'row': line, 'errors': errors})
+                continue
+            for name, seen in self._seen.items():
+                if attrs.get(name):
+                    seen.add(attrs[name])
+            accepted.append((line, attrs))
+        return accepted
+
+    def _resolve_references(self, valid):
+        section_codes = {a['section_code'] for _, a in valid if a.get('section_code')} - self._sections.keys()
+        if section_codes:
+            self._sections.update(Section.objects.filter(section_code__in=section_codes).values_list('section_code', 'id'))
+        department_codes = {a['department_code'] for _, a in valid if a.get('department_code')} - self._departments.keys()
+        if department_codes:
+            self._departments.update(Department.objects.filter(department_code__in=department_codes).values_list('department_code', 'id'))
+
+        accepted = []
+        for line, attrs in valid:
+            if attrs['user_type'] == UserTypeEnum.STUDENT:
+                attrs['section_id'] = self._sections.get(attrs['section_code'])
+                if attrs['section_id'] is None:
+                    self.errors.append({'row': line, 'errors': {'section_code': ["Unknown section."]}})
+                    continue
+            elif attrs.get('department_code'):
+                attrs['department_id'] = self._departments.get(attrs['department_code'])
+                if attrs['department_id'] is None:
+                    self.errors.append({'row': line, 'errors': {'department_code': ["Unknown department."]}})
+                    continue
+            accepted.append((line, attrs))
+        return accepted
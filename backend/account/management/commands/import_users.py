@@ -0,0 +1,30 @@
+import json
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from account.importer import FORMATS, UserImporter, iter_rows
+
+
+class Command(BaseCommand):
+    help = "Bulk import students and teachers from a CSV or NDJSON file."
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument('--format', choices=FORMATS, help="Defaults to the file extension.")
+        parser.add_argument('--chunk-size', type=int, default=500)
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+
+    def handle(self, *args, **options):
+        path = options['path']
+        file_format = options['format'] or ('ndjson' if path.endswith(('.ndjson', '.jsonl')) else 'csv')
+        importer = UserImporter(chunk_size=options['chunk_size'], workers=options['workers'])
+        try:
+            with open(path, 'rb') as stream:
+                report = importer.run(iter_rows(stream, file_format))
+        except OSError as exc:
+            raise CommandError(f"Could not import {path}: {exc}")
+
+        for error in report['errors']:
+            self.stderr.write(f"row {error['row']}: {json.dumps(error['errors'])}")
+        self.stdout.write(self.style.SUCCESS(f"Created {report['created']} users, {report['failed']} rows failed."))
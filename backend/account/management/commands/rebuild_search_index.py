@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from account.search import get_search_backend
+
+
+class Command(BaseCommand):
+    help = "Rebuild the user/teacher search index from scratch."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default=None)
+        parser.add_argument('--chunk-size', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        backend = get_search_backend(options['database'])
+        count = backend.rebuild(chunk_size=options['chunk_size'])
+        self.stdout.write(self.style.SUCCESS(f"Indexed {count} users with {type(backend).__name__}."))
@@ -0,0 +1,55 @@
+from django.db import migrations
+
+
+def create_search_table(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor == 'sqlite':
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+            if not cursor.fetchone()[0]:
+                # No FTS5 in this build; searches fall back to icontains scans.
+                return
+        schema_editor.execute(
+            "CREATE VIRTUAL TABLE account_user_search USING fts5("
+            "user_id UNINDEXED, document, tokenize='unicode61 remove_diacritics 2')"
+        )
+    elif connection.vendor == 'postgresql':
+        schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        schema_editor.execute(
+            "CREATE TABLE account_user_search ("
+            "user_id uuid PRIMARY KEY REFERENCES account_user (id) ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED, "
+            "document text NOT NULL)"
+        )
+        schema_editor.execute(
+            "CREATE INDEX account_user_search_trgm ON account_user_search USING gin (document gin_trgm_ops)"
+        )
+    else:
+        return
+
+    from account.search import TEACHER_FIELDS, USER_FIELDS, build_document
+
+    User = apps.get_model('account', 'User')
+    TeacherProfile = apps.get_model('account', 'TeacherProfile')
+    teachers = {row[0]: row[1:] for row in TeacherProfile.objects.values_list('user_id', *TEACHER_FIELDS)}
+    rows = [
+        (user_id.hex if connection.vendor == 'sqlite' else user_id, build_document(*values, *teachers.get(user_id, ())))
+        for user_id, *values in User.objects.values_list('id', *USER_FIELDS)
+    ]
+    with connection.cursor() as cursor:
+        cursor.executemany("INSERT INTO account_user_search (user_id, document) VALUES (%s, %s)", rows)
+
+
+def drop_search_table(apps, schema_editor):
+    if schema_editor.connection.vendor in ('sqlite', 'postgresql'):
+        schema_editor.execute("DROP TABLE IF EXISTS account_user_search")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0003_studentprofile_gpa_dirty'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_table, drop_search_table),
+    ]
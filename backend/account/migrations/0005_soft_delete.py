@@ -0,0 +1,66 @@
+# Generated by Django 5.2.4 on 2026-10-18 18:36
+
+import account.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0004_user_search_index'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('department', '0003_soft_delete'),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name='user',
+            managers=[
+                ('objects', account.models.UserManager()),
+            ],
+        ),
+        migrations.RemoveIndex(
+            model_name='studentprofile',
+            name='account_stu_created_bcbdd4_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='teacherprofile',
+            name='account_tea_created_817fc6_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='user',
+            name='account_use_created_795bc3_idx',
+        ),
+        migrations.AddField(
+            model_name='adminprofile',
+            name='deleted_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='studentprofile',
+            name='deleted_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='teacherprofile',
+            name='deleted_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='deleted_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='studentprofile',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['created_at', 'id'], name='student_live_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='teacherprofile',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['created_at', 'id'], name='teacher_live_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['created_at', 'id'], name='user_live_created_idx'),
+        ),
+    ]
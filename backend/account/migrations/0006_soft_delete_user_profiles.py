@@ -0,0 +1,41 @@
+# Generated by Django 5.2.4 on 2026-10-18 19:10
+
+from django.db import migrations
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def _count(queryset, group_by):
+    rows = queryset.filter(**{group_by: OuterRef('pk')}).order_by().values(group_by).annotate(total=Count('pk')).values('total')
+    return Coalesce(Subquery(rows), Value(0), output_field=IntegerField())
+
+
+def delete_profiles_of_deleted_users(apps, schema_editor):
+    # Users deleted before the cascade existed left their profiles live and counted.
+    User = apps.get_model('account', 'User')
+    Department = apps.get_model('department', 'Department')
+    Section = apps.get_model('department', 'Section')
+    StudentProfile = apps.get_model('account', 'StudentProfile')
+    TeacherProfile = apps.get_model('account', 'TeacherProfile')
+    for model in (StudentProfile, TeacherProfile, apps.get_model('account', 'AdminProfile')):
+        model.objects.filter(deleted_at__isnull=True, user__deleted_at__isnull=False).update(
+            deleted_at=Subquery(User.objects.filter(pk=OuterRef('user_id')).values('deleted_at')),
+        )
+    students = StudentProfile.objects.filter(deleted_at__isnull=True)
+    Section.objects.update(enrolled_count=_count(students, 'section'))
+    Department.objects.update(
+        current_student_count=_count(students, 'section__department'),
+        total_faculty_count=_count(TeacherProfile.objects.filter(deleted_at__isnull=True), 'department'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0005_soft_delete'),
+        ('department', '0003_soft_delete'),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_profiles_of_deleted_users, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,65 @@
+from django.db import migrations
+
+# The FTS5 table keeps its name but reads its text from a plain table keyed by
+# user_id, so reindexing or removing one user is a lookup on that key and a
+# rowid delete in the index instead of a scan of the whole virtual table.
+TRIGGERS = (
+    "CREATE TRIGGER account_user_search_ai AFTER INSERT ON account_user_search_document BEGIN "
+    "INSERT INTO account_user_search (rowid, document) VALUES (new.id, new.document); END",
+    "CREATE TRIGGER account_user_search_ad AFTER DELETE ON account_user_search_document BEGIN "
+    "INSERT INTO account_user_search (account_user_search, rowid, document) VALUES ('delete', old.id, old.document); END",
+    "CREATE TRIGGER account_user_search_au AFTER UPDATE ON account_user_search_document BEGIN "
+    "INSERT INTO account_user_search (account_user_search, rowid, document) VALUES ('delete', old.id, old.document); "
+    "INSERT INTO account_user_search (rowid, document) VALUES (new.id, new.document); END",
+)
+
+
+def _has_search_table(schema_editor):
+    connection = schema_editor.connection
+    return connection.vendor == 'sqlite' and 'account_user_search' in connection.introspection.table_names()
+
+
+def use_document_table(apps, schema_editor):
+    if not _has_search_table(schema_editor):
+        return
+    schema_editor.execute(
+        "CREATE TABLE account_user_search_document ("
+        "id integer PRIMARY KEY AUTOINCREMENT, user_id char(32) NOT NULL UNIQUE, document text NOT NULL)"
+    )
+    schema_editor.execute(
+        "INSERT INTO account_user_search_document (user_id, document) SELECT user_id, document FROM account_user_search"
+    )
+    schema_editor.execute("DROP TABLE account_user_search")
+    schema_editor.execute(
+        "CREATE VIRTUAL TABLE account_user_search USING fts5("
+        "document, content='account_user_search_document', content_rowid='id', "
+        "tokenize='unicode61 remove_diacritics 2')"
+    )
+    schema_editor.execute("INSERT INTO account_user_search (account_user_search) VALUES ('rebuild')")
+    for trigger in TRIGGERS:
+        schema_editor.execute(trigger)
+
+
+def use_inline_table(apps, schema_editor):
+    if not _has_search_table(schema_editor):
+        return
+    schema_editor.execute("DROP TABLE account_user_search")
+    schema_editor.execute(
+        "CREATE VIRTUAL TABLE account_user_search USING fts5("
+        "user_id UNINDEXED, document, tokenize='unicode61 remove_diacritics 2')"
+    )
+    schema_editor.execute(
+        "INSERT INTO account_user_search (user_id, document) SELECT user_id, document FROM account_user_search_document"
+    )
+    schema_editor.execute("DROP TABLE account_user_search_document")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0006_soft_delete_user_profiles'),
+    ]
+
+    operations = [
+        migrations.RunPython(use_document_table, use_inline_table),
+    ]
@@ -1,16 +1,21 @@
 import uuid
 from django.db import models
-from django.contrib.auth.models import AbstractUser
+from django.contrib.auth.models import AbstractUser, UserManager as BaseUserManager
 from department.models import Department,Section
 from django.utils import timezone
 from decimal import Decimal
+from core.softdelete import SoftDeleteManager, SoftDeleteModel, live_index
 
 class UserTypeEnum(models.TextChoices):
     ADMIN = "Admin", "Admin"
     TEACHER = "Teacher", "Teacher"
     STUDENT = "Student", "Student"
 
-class User(AbstractUser):
+class UserManager(SoftDeleteManager, BaseUserManager):
+    pass
+
+
+class User(SoftDeleteModel, AbstractUser):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     email = models.EmailField(unique=True)
     
@@ -21,8 +26,19 @@ class User(AbstractUser):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = UserManager()
+
+    soft_delete_cascade = ('teacherprofile', 'student_profile', 'admin_profile')
+    # Columns read by __str__ and properties; compiled serializers project only these (see core.compiled).
+    attribute_fields = {'__str__': ('username',)}
+
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            live_index("created_at", "id", name="user_live_created_idx"),
+        ]
+
 
-class TeacherProfile(models.Model):
+class TeacherProfile(SoftDeleteModel):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     user = models.OneToOneField(User, on_delete=models.CASCADE)
     employee_id = models.CharField(max_length=50, unique=True, null=True, blank=True)
@@ -34,9 +50,13 @@ class TeacherProfile(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            live_index("created_at", "id", name="teacher_live_created_idx"),
+        ]
 
 
-class StudentProfile(models.Model):
+class StudentProfile(SoftDeleteModel):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name="student_profile")
     section = models.ForeignKey(Section, on_delete=models.PROTECT, related_name="student_profiles")
@@ -49,6 +69,7 @@ class StudentProfile(models.Model):
     sgpa_current = models.DecimalField(max_digits=4, decimal_places=2, default=Decimal("0.00"))
     total_credits_completed = models.PositiveIntegerField(default=0)
     total_credits_required = models.PositiveIntegerField(default=180)
+    gpa_dirty = models.BooleanField(default=True, db_index=True)
     date_of_birth = models.DateField()
     academic_status = models.CharField(max_length=20, default='active')
     enrollment_status = models.CharField(max_length=20, default='enrolled')
@@ -65,13 +86,14 @@ class StudentProfile(models.Model):
         ]
         indexes = [
             models.Index(fields=["user", "section", "admission_year", "is_active"]),
+            live_index("created_at", "id", name="student_live_created_idx"),
         ]
 
     def __str__(self):
         return f"{self.user.get_full_name()} - Reg: {self.registration_number}"
 
 
-class AdminProfile(models.Model):
+class AdminProfile(SoftDeleteModel):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name="admin_profile")
     department = models.ForeignKey(Department, on_delete=models.PROTECT, related_name="admin_profiles", null=True, blank=True)
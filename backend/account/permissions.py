@@ -1,8 +1,10 @@
 from rest_framework.permissions import BasePermission
 
+from .roles import get_role
+
 class IsTeacher(BasePermission):
     def has_permission(self, request, view):
-        return request.user.groups.filter(name='Teacher').exists()
+        return get_role(request).is_teacher
 
 class IsAdminUser(BasePermission):
     def has_permission(self, request, view):
@@ -0,0 +1,91 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.db.models import Exists, FilteredRelation, OuterRef, Q
+
+from core.db_router import primary_reads
+
+from .models import User, UserTypeEnum
+
+ROLE_CACHE_TIMEOUT = 300
+TEACHER_GROUP = 'Teacher'
+
+
+@dataclass(frozen=True)
+class Role:
+    user_type: str = ''
+    in_teacher_group: bool = False
+    teacher_profile_id: UUID | None = None
+    student_profile_id: UUID | None = None
+    student_section_id: UUID | None = None
+    admin_profile_id: UUID | None = None
+
+    @property
+    def is_teacher(self):
+        return self.user_type == UserTypeEnum.TEACHER or self.in_teacher_group
+
+
+ANONYMOUS = Role()
+
+
+def _cache_key(user_id):
+    return f'account:role:{user_id}'
+
+
+def _live(relation):
+    # Reverse one-to-one joins bypass the default manager, so deleted profiles must be filtered here.
+    return FilteredRelation(relation, condition=Q(**{f'{relation}__deleted_at__isnull': True}))
+
+
+def _load_role(user_id):
+    row = (
+        User.objects.filter(pk=user_id)
+        .annotate(
+            in_teacher_group=Exists(Group.objects.filter(user=OuterRef('pk'), name=TEACHER_GROUP)),
+            live_teacher=_live('teacherprofile'),
+            live_student=_live('student_profile'),
+            live_admin=_live('admin_profile'),
+        )
+        .values('user_type', 'in_teacher_group', 'live_teacher__id', 'live_student__id', 'live_student__section_id', 'live_admin__id')
+        .first()
+    )
+    if row is None:
+        return ANONYMOUS
+    return Role(
+        user_type=row['user_type'],
+        in_teacher_group=row['in_teacher_group'],
+        teacher_profile_id=row['live_teacher__id'],
+        student_profile_id=row['live_student__id'],
+        student_section_id=row['live_student__section_id'],
+        admin_profile_id=row['live_admin__id'],
+    )
+
+
+def get_role(request):
+    """
+    Resolve the role and profile ids of ``request.user`` with at most one query.
+
+    The result is memoized on the request and cached across requests until a
+    profile, group membership or the user itself changes.
+    """
+    role = getattr(request, '_role', None)
+    if role is not None:
+        return role
+    user = request.user
+    if not user.is_authenticated:
+        role = ANONYMOUS
+    else:
+        key = _cache_key(user.pk)
+        role = cache.get(key)
+        if role is None:
+            with primary_reads():
+                role = _load_role(user.pk)
+            cache.set(key, role, ROLE_CACHE_TIMEOUT)
+    request._role = role
+    return role
+
+
+def invalidate_role(user_id):
+    cache.delete(_cache_key(user_id))
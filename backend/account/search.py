@@ -0,0 +1,226 @@
+import re
+
+from django.conf import settings
+from django.db import connections, router, transaction
+from django.db.models import Case, IntegerField, Q, Value, When
+from django.db.models.signals import post_migrate
+from django.dispatch import receiver
+
+from .models import TeacherProfile, User
+
+SEARCH_TABLE = 'account_user_search'
+SEARCH_DOCUMENTS = 'account_user_search_document'
+USER_FIELDS = ('first_name', 'last_name', 'email', 'username')
+TEACHER_FIELDS = ('employee_id', 'designation', 'qualification')
+
+
+def build_document(*values):
+    return ' '.join(str(value) for value in values if value).lower()
+
+
+def _tokens(term):
+    return re.findall(r'\w+', term.lower())
+
+
+class BaseSearchBackend:
+    """Keeps one search document per user and answers ranked lookups over them."""
+
+    def __init__(self, using):
+        self.using = using
+
+    def index(self, user_id, document):
+        pass
+
+    def remove(self, user_id):
+        pass
+
+    def ranked_ids(self, term, limit):
+        raise NotImplementedError
+
+    def rebuild(self, chunk_size=2000):
+        """Reindex every user; returns the number of documents written."""
+        teachers = dict(
+            (row[0], row[1:]) for row in TeacherProfile.objects.using(self.using).values_list('user_id', *TEACHER_FIELDS)
+        )
+        count = 0
+        with transaction.atomic(using=self.using):
+            self._clear()
+            batch = []
+            for row in User.objects.using(self.using).values_list('id', *USER_FIELDS).iterator(chunk_size=chunk_size):
+                batch.append((row[0], build_document(*row[1:], *teachers.get(row[0], ()))))
+                if len(batch) >= chunk_size:
+                    count += self.add_documents(batch)
+                    batch = []
+            count += self.add_documents(batch)
+        return count
+
+    def add_documents(self, rows):
+        """Insert ``(user_id, document)`` pairs for users that are not indexed yet."""
+        return 0
+
+    def _clear(self):
+        pass
+
+
+class SQLiteFTSBackend(BaseSearchBackend):
+    """
+    FTS5 virtual table ranked with bm25; terms match as token prefixes.
+
+    The index takes its text from ``SEARCH_DOCUMENTS``, keyed by user id, and
+    triggers there keep it in step, so a reindex is one upsert by key.
+    """
+
+    def index(self, user_id, document):
+        with connections[self.using].cursor() as cursor:
+            cursor.execute(
+                f'INSERT INTO {SEARCH_DOCUMENTS} (user_id, document) VALUES (%s, %s) '
+                'ON CONFLICT (user_id) DO UPDATE SET document = excluded.document',
+                [user_id.hex, document],
+            )
+
+    def remove(self, user_id):
+        with connections[self.using].cursor() as cursor:
+            cursor.execute(f'DELETE FROM {SEARCH_DOCUMENTS} WHERE user_id = %s', [user_id.hex])
+
+    def ranked_ids(self, term, limit):
+        tokens = _tokens(term)
+        if not tokens:
+            return []
+        query = ' '.join('"%s"*' % token for token in tokens)
+        with connections[self.using].cursor() as cursor:
+            cursor.execute(
+                f'SELECT document.user_id FROM {SEARCH_TABLE} '
+                f'JOIN {SEARCH_DOCUMENTS} AS document ON document.id = {SEARCH_TABLE}.rowid '
+                f'WHERE {SEARCH_TABLE} MATCH %s ORDER BY rank LIMIT %s',
+                [query, limit],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+    def _clear(self):
+        with connections[self.using].cursor() as cursor:
+            cursor.execute(f'DELETE FROM {SEARCH_DOCUMENTS}')
+
+    def add_documents(self, rows):
+        with connections[self.using].cursor() as cursor:
+            cursor.executemany(
+                f'INSERT INTO {SEARCH_DOCUMENTS} (user_id, document) VALUES (%s, %s)',
+                [(user_id.hex, document) for user_id, document in rows],
+            )
+        return len(rows)
+
+
+class PostgresTrigramBackend(BaseSearchBackend):
+    """Plain table with a pg_trgm GIN index; every term must appear, ranked by similarity."""
+
+    def index(self, user_id, document):
+        with connections[self.using].cursor() as cursor:
+            cursor.execute(
+                f'INSERT INTO {SEARCH_TABLE} (user_id, document) VALUES (%s, %s) '
+                'ON CONFLICT (user_id) DO UPDATE SET document = EXCLUDED.document',
+                [user_id, document],
+            )
+
+    def remove(self, user_id):
+        with connections[self.using].cursor() as cursor:
+            cursor.execute(f'DELETE FROM {SEARCH_TABLE} WHERE user_id = %s', [user_id])
+
+    def ranked_ids(self, term, limit):
+        tokens = _tokens(term)
+        if not tokens:
+            return []
+        where = ' AND '.join(['document LIKE %s'] * len(tokens))
+        with connections[self.using].cursor() as cursor:
+            cursor.execute(
+                f'SELECT user_id FROM {SEARCH_TABLE} WHERE {where} '
+                'ORDER BY similarity(document, %s) DESC LIMIT %s',
+                [f'%{token}%' for token in tokens] + [' '.join(tokens), limit],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+    def _clear(self):
+        with connections[self.using].cursor() as cursor:
+            cursor.execute(f'TRUNCATE {SEARCH_TABLE}')
+
+    def add_documents(self, rows):
+        with connections[self.using].cursor() as cursor:
+            cursor.executemany(f'INSERT INTO {SEARCH_TABLE} (user_id, document) VALUES (%s, %s)', rows)
+        return len(rows)
+
+
+class FallbackSearchBackend(BaseSearchBackend):
+    """Unindexed ``icontains`` scan, used when the database has no search table."""
+
+    def ranked_ids(self, term, limit):
+        condition = Q()
+        for token in _tokens(term):
+            token_match = Q()
+            for name in USER_FIELDS:
+                token_match |= Q(**{f'{name}__icontains': token})
+            for name in TEACHER_FIELDS:
+                token_match |= Q(**{f'teacherprofile__{name}__icontains': token})
+            condition &= token_match
+        if not condition:
+            return []
+        return list(User.objects.using(self.using).filter(condition).values_list('id', flat=True).distinct()[:limit])
+
+
+_backends = {}
+
+
+def _backend_key(using):
+    # Tests and scripts may point an alias at another database, so key on where it leads.
+    connection = connections[using]
+    return using, connection.vendor, *(connection.settings_dict.get(name) for name in ('NAME', 'HOST', 'PORT'))
+
+
+def get_search_backend(using=None):
+    using = using or router.db_for_read(User)
+    key = _backend_key(using)
+    if key not in _backends:
+        connection = connections[using]
+        backend_class = FallbackSearchBackend
+        if SEARCH_TABLE in connection.introspection.table_names():
+            backend_class = {'sqlite': SQLiteFTSBackend, 'postgresql': PostgresTrigramBackend}.get(connection.vendor, backend_class)
+        _backends[key] = backend_class(using)
+    return _backends[key]
+
+
+@receiver(post_migrate)
+def forget_backends(sender, **kwargs):
+    # A migration may have created or dropped the search table.
+    _backends.clear()
+
+
+def index_user(user_id):
+    using = router.db_for_write(User)
+    user = User.objects.using(using).filter(pk=user_id).values_list(*USER_FIELDS).first()
+    backend = get_search_backend(using)
+    if user is None:
+        backend.remove(user_id)
+        return
+    teacher = TeacherProfile.objects.using(using).filter(user_id=user_id).values_list(*TEACHER_FIELDS).first() or ()
+    backend.index(user_id, build_document(*user, *teacher))
+
+
+def remove_user(user_id):
+    get_search_backend(router.db_for_write(User)).remove(user_id)
+
+
+def apply_search(queryset, term, user_field='id', limit=None):
+    """
+    Restrict ``queryset`` to the best ``limit`` matches for ``term``, annotated
+    with ``search_rank`` (0 is the best match).
+
+    ``limit`` defaults to ``SEARCH_RESULT_LIMIT``. Matches past it are dropped
+    before any other filter applies, so a paginated search ends after that
+    many rows at most, however many users match.
+    """
+    limit = limit or settings.SEARCH_RESULT_LIMIT
+    ids = get_search_backend(queryset.db).ranked_ids(term, limit)
+    if not ids:
+        return queryset.annotate(search_rank=Value(0, output_field=IntegerField())).none()
+    ranking = Case(
+        *(When(**{user_field: user_id}, then=Value(rank)) for rank, user_id in enumerate(ids)),
+        output_field=IntegerField(),
+    )
+    return queryset.filter(**{f'{user_field}__in': ids}).annotate(search_rank=ranking)
@@ -3,6 +3,7 @@ from rest_framework import serializers
 from .models import User
 from .models import StudentProfile, AdminProfile
 from .models import TeacherProfile, User
+from core.serializers import SparseFieldsMixin
 
 
 
@@ -17,18 +18,18 @@ class UserUpdateSerializer(serializers.ModelSerializer):
         model = User
         exclude = ['id', 'created_at', 'updated_at']
 
-class UserResponseSerializer(serializers.ModelSerializer):
+class UserResponseSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = User
         fields = '__all__'
 
-class UserSummarySerializer(serializers.ModelSerializer):
+class UserSummarySerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ['id', 'email', 'first_name', 'last_name', 'user_type']
 
 
-class TeacherProfileSerializer(serializers.ModelSerializer):
+class TeacherProfileSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = TeacherProfile
         fields = '__all__'
@@ -44,14 +45,14 @@ class TeacherProfileUpdateSerializer(serializers.ModelSerializer):
         model = TeacherProfile
         exclude = ['id', 'created_at']
 
-class TeacherProfileDetailSerializer(serializers.ModelSerializer):
+class TeacherProfileDetailSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     user = serializers.StringRelatedField()
 
     class Meta:
         model = TeacherProfile
         fields = '__all__'
 
-class TeacherProfileListItemSerializer(serializers.ModelSerializer):
+class TeacherProfileListItemSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = TeacherProfile
         fields = ['id', 'employee_id', 'designation', 'qualification', 'experience_years']
@@ -62,7 +63,7 @@ class TeacherProfileAPIResponseSerializer(serializers.Serializer):
     data = TeacherProfileDetailSerializer()
 
 
-class StudentProfileSerializer(serializers.ModelSerializer):
+class StudentProfileSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     user = serializers.StringRelatedField(read_only=True)
     section = serializers.StringRelatedField()
     created_by = serializers.StringRelatedField()
@@ -71,9 +72,11 @@ class StudentProfileSerializer(serializers.ModelSerializer):
     class Meta:
         model = StudentProfile
         fields = '__all__'
+        # Set by gradebook writes and cleared by recompute_gpa only.
+        read_only_fields = ['gpa_dirty']
 
 
-class AdminProfileSerializer(serializers.ModelSerializer):
+class AdminProfileSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     user = serializers.StringRelatedField(read_only=True)
     department = serializers.StringRelatedField()
     created_by = serializers.StringRelatedField()
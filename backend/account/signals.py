@@ -0,0 +1,118 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from department.counters import adjust_enrollment, adjust_faculty
+
+from .models import AdminProfile, StudentProfile, TeacherProfile, User
+from .roles import invalidate_role
+from .search import TEACHER_FIELDS, USER_FIELDS, index_user, remove_user
+
+
+def _touches(update_fields, indexed_fields):
+    return update_fields is None or not set(update_fields).isdisjoint(indexed_fields)
+
+
+@receiver(post_save, sender=User)
+def index_user_on_save(sender, instance, update_fields=None, **kwargs):
+    # Logins save last_login only; skip reindexing for writes that cannot change the document.
+    if _touches(update_fields, USER_FIELDS + ('deleted_at',)):
+        index_user(instance.pk)
+
+
+@receiver(post_delete, sender=User)
+def remove_user_on_delete(sender, instance, **kwargs):
+    remove_user(instance.pk)
+
+
+@receiver(post_save, sender=TeacherProfile)
+def index_teacher_on_save(sender, instance, update_fields=None, **kwargs):
+    if _touches(update_fields, TEACHER_FIELDS + ('user', 'deleted_at')):
+        index_user(instance.user_id)
+
+
+@receiver(post_delete, sender=TeacherProfile)
+def index_teacher_on_delete(sender, instance, **kwargs):
+    index_user(instance.user_id)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_role_for_user(sender, instance, **kwargs):
+    invalidate_role(instance.pk)
+
+
+@receiver(post_save, sender=TeacherProfile)
+@receiver(post_delete, sender=TeacherProfile)
+@receiver(post_save, sender=StudentProfile)
+@receiver(post_delete, sender=StudentProfile)
+@receiver(post_save, sender=AdminProfile)
+@receiver(post_delete, sender=AdminProfile)
+def invalidate_role_for_profile(sender, instance, **kwargs):
+    invalidate_role(instance.user_id)
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+def invalidate_role_for_groups(sender, instance, action, reverse, pk_set, **kwargs):
+    if reverse and action == 'pre_clear':
+        # group.user_set.clear() does not report which users it removes, and
+        # once it has run the memberships are gone; remember them beforehand.
+        instance._cleared_user_ids = list(User.all_objects.filter(groups=instance).values_list('pk', flat=True))
+        return
+    if not action.startswith('post_'):
+        return
+    if not reverse:
+        invalidate_role(instance.pk)
+    elif pk_set:
+        for user_id in pk_set:
+            invalidate_role(user_id)
+    else:
+        for user_id in getattr(instance, '_cleared_user_ids', ()):
+            invalidate_role(user_id)
+        instance._cleared_user_ids = []
+
+
+COUNTED_RELATIONS = {StudentProfile: 'section', TeacherProfile: 'department'}
+
+
+def _counted_id(instance, attname):
+    # Soft-deleted profiles no longer count towards their section or department.
+    return None if instance.deleted_at is not None else getattr(instance, attname)
+
+
+@receiver(pre_save, sender=StudentProfile)
+@receiver(pre_save, sender=TeacherProfile)
+def remember_counted_relation(sender, instance, update_fields=None, **kwargs):
+    field = sender._meta.get_field(COUNTED_RELATIONS[sender])
+    if instance._state.adding:
+        instance._counted_id = None
+    elif update_fields is not None and not {field.name, 'deleted_at'} & set(update_fields):
+        instance._counted_id = _counted_id(instance, field.attname)
+    else:
+        row = sender.all_objects.filter(pk=instance.pk).values_list(field.attname, 'deleted_at').first()
+        instance._counted_id = row[0] if row is not None and row[1] is None else None
+
+
+@receiver(post_save, sender=StudentProfile)
+def count_enrollment_on_save(sender, instance, **kwargs):
+    section_id = _counted_id(instance, 'section_id')
+    if instance._counted_id != section_id:
+        adjust_enrollment(instance._counted_id, -1)
+        adjust_enrollment(section_id, 1)
+
+
+@receiver(post_delete, sender=StudentProfile)
+def count_enrollment_on_delete(sender, instance, **kwargs):
+    adjust_enrollment(_counted_id(instance, 'section_id'), -1)
+
+
+@receiver(post_save, sender=TeacherProfile)
+def count_faculty_on_save(sender, instance, **kwargs):
+    department_id = _counted_id(instance, 'department_id')
+    if instance._counted_id != department_id:
+        adjust_faculty(instance._counted_id, -1)
+        adjust_faculty(department_id, 1)
+
+
+@receiver(post_delete, sender=TeacherProfile)
+def count_faculty_on_delete(sender, instance, **kwargs):
+    adjust_faculty(_counted_id(instance, 'department_id'), -1)
@@ -1,3 +1,304 @@
-from django.test import TestCase
+import csv
+import io
+import json
+from unittest.mock import patch
 
-# Create your tests here.
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.db import connection
+from django.test import RequestFactory, TestCase, override_settings
+from rest_framework.test import APIClient
+
+from assessment.seeding import seed_dataset
+from department.models import Department, Section
+
+from .importer import UserImporter, iter_rows
+from .models import StudentProfile, TeacherProfile, User
+from .roles import TEACHER_GROUP, get_role
+from .search import SEARCH_DOCUMENTS, SQLiteFTSBackend, apply_search, forget_backends, get_search_backend
+
+
+def student_row(number, **extra):
+    return {
+        'email': f'student{number}@example.com', 'user_type': 'Student', 'section_code': 'IMP-A',
+        'admission_year': 2025, 'batch_year': 2025, 'date_of_birth': '2007-01-01', **extra,
+    }
+
+
+class ImporterTests(TestCase):
+    """Malformed rows are reported one by one while the rest of the file is imported."""
+
+    @classmethod
+    def setUpTestData(cls):
+        department = Department.objects.create(department_code='IMP', department_name='Import')
+        Section.objects.create(section_code='IMP-A', section_name='A', department=department, academic_year='2025-2026', batch_year=2025)
+
+    def run_import(self, body, file_format):
+        return UserImporter().run(iter_rows(io.BytesIO(body), file_format))
+
+    def test_malformed_ndjson_lines(self):
+        body = b'\n'.join([
+            json.dumps(student_row(1)).encode(),
+            b'[1, 2]',
+            b'{"email": ',
+            json.dumps(student_row(2, first_name='Ren\xe9e'), ensure_ascii=False).encode('latin-1'),
+            json.dumps(student_row(3)).encode(),
+        ])
+        report = self.run_import(body, 'ndjson')
+        self.assertEqual(report['created'], 2)
+        self.assertEqual([error['row'] for error in report['errors']], [2, 3, 4])
+        self.assertIn('Expected a dictionary', report['errors'][0]['errors']['non_field_errors'][0])
+        self.assertIn('Invalid JSON', report['errors'][1]['errors']['non_field_errors'][0])
+        self.assertEqual(report['errors'][2]['errors']['non_field_errors'], ['Not valid UTF-8.'])
+
+    def test_malformed_csv_rows(self):
+        body = (
+            'email,user_type,section_code,admission_year,batch_year,date_of_birth,first_name\r\n'
+            'a@example.com,Student,IMP-A,2025,2025,2007-01-01,Ann\r\n'
+        ).encode() + 'b@example.com,Student,IMP-A,2025,2025,2007-01-01,Ren\xe9e\r\n'.encode('latin-1') + (
+            'c@example.com,Student,IMP-A,2025,2025,2007-01-01,Cy\r\n'
+        ).encode()
+        report = self.run_import(body, 'csv')
+        self.assertEqual(report['created'], 2)
+        self.assertEqual(report['errors'], [{'row': 2, 'errors': {'non_field_errors': ['Not valid UTF-8.']}}])
+
+    def test_deleted_user_email(self):
+        self.run_import(json.dumps(student_row(1)).encode(), 'ndjson')
+        User.objects.get(email='student1@example.com').delete()
+        body = b'\n'.join(json.dumps(student_row(number)).encode() for number in (1, 2))
+        report = self.run_import(body, 'ndjson')
+        self.assertEqual(report['created'], 1)
+        self.assertEqual(report['errors'][0]['row'], 1)
+        self.assertEqual(report['errors'][0]['errors']['email'], ['student1@example.com already exists.'])
+
+    def test_existing_email_other_case(self):
+        User.objects.create_user(username='mixed', email='Student1@Example.com', password='x', user_type='Student')
+        report = self.run_import(json.dumps(student_row(1)).encode(), 'ndjson')
+        self.assertEqual(report['created'], 0)
+        self.assertEqual(report['errors'][0]['errors']['email'], ['student1@example.com already exists.'])
+
+    def test_students_and_teachers(self):
+        rows = [
+            student_row(1, first_name='Grace', registration_number='REG-1'),
+            {'email': 'Teacher1@Example.com', 'user_type': 'Teacher', 'first_name': 'Ada', 'last_name': 'Lovelace',
+             'employee_id': 'EMP-1', 'designation': 'Lecturer', 'qualification': 'PhD', 'department_code': 'IMP'},
+            student_row(2),
+        ]
+        report = self.run_import('\n'.join(json.dumps(row) for row in rows).encode(), 'ndjson')
+        self.assertEqual(report, {'created': 3, 'failed': 0, 'errors': []})
+
+        student = StudentProfile.objects.select_related('user', 'section').get(registration_number='REG-1')
+        self.assertEqual((student.user.email, student.user.username, student.user.user_type), ('student1@example.com', 'student1@example.com', 'Student'))
+        self.assertFalse(student.user.has_usable_password())
+        teacher = TeacherProfile.objects.select_related('user').get(employee_id='EMP-1')
+        self.assertEqual((teacher.user.email, teacher.designation, teacher.department.department_code), ('teacher1@example.com', 'Lecturer', 'IMP'))
+
+        section = Section.objects.select_related('department').get(section_code='IMP-A')
+        self.assertEqual(section.enrolled_count, 2)
+        self.assertEqual((section.department.current_student_count, section.department.total_faculty_count), (2, 1))
+
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT user_id, document FROM {SEARCH_DOCUMENTS}')
+            documents = {user_id: document for user_id, document in cursor.fetchall()}
+        self.assertEqual(len(documents), 3)
+        self.assertIn('lovelace', documents[teacher.user_id.hex].lower())
+        self.assertIn('emp-1', documents[teacher.user_id.hex].lower())
+
+
+class RoleTests(TestCase):
+    """Cached roles follow group membership changes made from either side and deleted profiles."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.group = Group.objects.create(name=TEACHER_GROUP)
+        cls.user = User.objects.create_user(username='role', email='role@example.com', password='x', user_type='Student')
+
+    def setUp(self):
+        cache.clear()
+
+    def role(self):
+        request = RequestFactory().get('/')
+        request.user = self.user
+        return get_role(request)
+
+    def is_teacher(self):
+        return self.role().is_teacher
+
+    def test_group_changes(self):
+        self.assertFalse(self.is_teacher())
+        self.user.groups.add(self.group)
+        self.assertTrue(self.is_teacher())
+        self.group.user_set.remove(self.user)
+        self.assertFalse(self.is_teacher())
+        self.group.user_set.add(self.user)
+        self.assertTrue(self.is_teacher())
+        self.group.user_set.clear()
+        self.assertFalse(self.is_teacher())
+
+    def test_deleted_profile(self):
+        department = Department.objects.create(department_code='ROL', department_name='Roles')
+        section = Section.objects.create(section_code='ROL-A', section_name='A', department=department, academic_year='2025-2026', batch_year=2025)
+        profile = StudentProfile.objects.create(user=self.user, section=section, admission_year=2025, batch_year=2025, date_of_birth='2007-01-01')
+        client = APIClient()
+        client.force_authenticate(self.user)
+        self.assertEqual((self.role().student_profile_id, self.role().student_section_id), (profile.pk, section.pk))
+
+        profile.delete()
+        self.assertEqual((self.role().student_profile_id, self.role().student_section_id), (None, None))
+        self.assertEqual(client.get('/api/student-profiles/me/feed/').status_code, 404)
+
+        profile.restore()
+        self.assertEqual(self.role().student_profile_id, profile.pk)
+        self.assertEqual(client.get('/api/student-profiles/me/feed/').status_code, 200)
+
+
+class SearchIndexTests(TestCase):
+    """User and teacher writes keep the search index current with point updates."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='ada', email='ada@example.com', password='x', user_type='Teacher', first_name='Ada', last_name='Lovelace')
+
+    def setUp(self):
+        if not isinstance(get_search_backend(), SQLiteFTSBackend):
+            self.skipTest('Needs SQLite with FTS5.')
+
+    def search(self, term):
+        return apply_search(User.objects.all(), term).values_list('pk', flat=True)
+
+    def test_save_and_delete(self):
+        self.assertEqual(list(self.search('lovel')), [self.user.pk])
+        TeacherProfile.objects.create(user=self.user, employee_id='EMP-77', designation='Professor', qualification='PhD')
+        self.assertEqual(list(self.search('professor ada')), [self.user.pk])
+
+        self.user.last_name = 'Byron'
+        self.user.save()
+        self.assertFalse(self.search('lovelace').exists())
+        self.assertEqual(list(self.search('byron')), [self.user.pk])
+
+        self.user.delete()
+        self.assertFalse(get_search_backend().ranked_ids('byron', 10))
+
+    @override_settings(SEARCH_RESULT_LIMIT=1)
+    def test_result_limit(self):
+        User.objects.create_user(username='ada2', email='ada2@example.com', password='x', user_type='Teacher', first_name='Ada', last_name='Byron')
+        self.assertEqual(self.search('ada').count(), 1)
+        self.assertEqual(apply_search(User.objects.all(), 'ada', limit=5).count(), 2)
+
+    def test_backend_follows_database(self):
+        backend = get_search_backend()
+        self.assertIs(get_search_backend(), backend)
+        with patch.dict(connection.settings_dict, NAME='elsewhere.sqlite3'):
+            self.assertIsNot(get_search_backend(), backend)
+        forget_backends(sender=None)
+        self.assertIsNot(get_search_backend(), backend)
+
+    def test_point_updates(self):
+        for sql in (
+            f'DELETE FROM {SEARCH_DOCUMENTS} WHERE user_id = %s',
+            f'UPDATE {SEARCH_DOCUMENTS} SET document = %s WHERE user_id = %s',
+        ):
+            with connection.cursor() as cursor:
+                cursor.execute(f'EXPLAIN QUERY PLAN {sql}', ['x'] * sql.count('%s'))
+                plan = [row[-1] for row in cursor.fetchall()]
+            with self.subTest(sql=sql):
+                self.assertFalse([detail for detail in plan if detail.startswith('SCAN')], plan)
+
+
+class SoftDeleteTests(TestCase):
+    """Deleted users and profiles leave lists, exports and headcounts but stay in ``all_objects``."""
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_dataset(departments=1, sections_per_department=1, students_per_section=3, subjects_per_department=2)
+        cls.admin = User.objects.create_superuser(username='soft-admin', email='soft-admin@example.com', password='x', user_type='Admin')
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def test_profile_delete_and_restore(self):
+        student = StudentProfile.objects.select_related('section').first()
+        enrolled = student.section.enrolled_count
+        student.delete()
+        student.section.refresh_from_db()
+        self.assertEqual(student.section.enrolled_count, enrolled - 1)
+        self.assertFalse(StudentProfile.objects.filter(pk=student.pk).exists())
+        self.assertTrue(StudentProfile.all_objects.filter(pk=student.pk).exists())
+        ids = [row['id'] for row in self.client.get('/api/student-profiles/').json()['results']]
+        self.assertNotIn(str(student.pk), ids)
+
+        student.restore()
+        student.section.refresh_from_db()
+        self.assertEqual(student.section.enrolled_count, enrolled)
+
+    def test_user_delete(self):
+        profile = TeacherProfile.objects.select_related('user').first()
+        teacher = profile.user
+        self.assertEqual(self.client.delete(f'/api/users/{teacher.pk}/').status_code, 200)
+        self.assertEqual(User.objects.filter(pk=teacher.pk).count(), 0)
+        response = self.client.get('/api/teachers/')
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn(str(profile.pk), [row['id'] for row in response.json()['results']])
+        # The email stays taken by the deleted account.
+        response = self.client.post('/api/users/', {'email': teacher.email, 'username': 'new', 'password': 'x', 'user_type': 'Teacher'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_user_delete_cascades_to_profiles(self):
+        student = StudentProfile.objects.select_related('user', 'section').first()
+        enrolled = student.section.enrolled_count
+        self.assertEqual(student.user.delete(), (2, {'account.StudentProfile': 1, 'account.User': 1}))
+        self.assertTrue(StudentProfile.all_objects.dead().filter(pk=student.pk).exists())
+        student.section.refresh_from_db()
+        self.assertEqual(student.section.enrolled_count, enrolled - 1)
+        ids = [row['id'] for row in self.client.get('/api/student-profiles/').json()['results']]
+        self.assertNotIn(str(student.pk), ids)
+        export = b''.join(self.client.get('/api/student-profiles/export/').streaming_content).decode()
+        self.assertNotIn(str(student.pk), export)
+
+        student.user.restore()
+        self.assertTrue(StudentProfile.objects.filter(pk=student.pk).exists())
+        student.section.refresh_from_db()
+        self.assertEqual(student.section.enrolled_count, enrolled)
+
+
+class RosterExportTests(TestCase):
+    """Student and teacher rosters export the filtered profiles to admins only."""
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_dataset(departments=2, sections_per_department=1, students_per_section=3, teachers_per_department=2, subjects_per_department=1)
+        cls.admin = User.objects.create_superuser(username='roster-admin', email='roster-admin@example.com', password='x', user_type='Admin')
+        cls.section = Section.objects.order_by('section_code').first()
+        cls.department = cls.section.department
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def export(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response, b''.join(response.streaming_content).decode()
+
+    def test_students(self):
+        response, body = self.export(f'/api/student-profiles/export/?section={self.section.pk}')
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="student-profile.csv"')
+        rows = list(csv.DictReader(io.StringIO(body)))
+        students = StudentProfile.objects.filter(section=self.section)
+        self.assertEqual(sorted(row['id'] for row in rows), sorted(str(pk) for pk in students.values_list('pk', flat=True)))
+        self.assertEqual({row['section__section_code'] for row in rows}, {self.section.section_code})
+
+    def test_teachers(self):
+        response, body = self.export(f'/api/teachers/export/?department_id={self.department.pk}&export_format=ndjson')
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="teacher.ndjson"')
+        rows = [json.loads(line) for line in body.splitlines()]
+        teachers = TeacherProfile.objects.filter(department=self.department)
+        self.assertEqual(sorted(row['id'] for row in rows), sorted(str(pk) for pk in teachers.values_list('pk', flat=True)))
+        self.assertEqual({row['department__department_code'] for row in rows}, {self.department.department_code})
+
+    def test_admins_only(self):
+        self.client.force_authenticate(TeacherProfile.objects.select_related('user').first().user)
+        for url in ('/api/student-profiles/export/', '/api/teachers/export/'):
+            with self.subTest(url=url):
+                self.assertEqual(self.client.get(url).status_code, 403)
@@ -2,7 +2,8 @@ from rest_framework import viewsets, status
 from rest_framework.response import Response
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
-from django.db.models import Q
+from rest_framework.parsers import MultiPartParser
+from django.conf import settings
 
 from .models import (
     User, TeacherProfile,
@@ -15,9 +16,17 @@ from .serializers import (
     StudentProfileSerializer, AdminProfileSerializer
 )
 from .permissions import IsAdminUser, IsTeacher
+from .importer import UserImporter, iter_rows
+from .search import apply_search
+from .roles import get_role
+from assessment.feed import student_feed
+from core.mixins import ConditionalGetMixin, RelatedPlanMixin
+from core.compiled import FastListMixin
+from core.exports import StreamingExportMixin
+from django_filters.rest_framework import DjangoFilterBackend
 
 
-class UserViewSet(viewsets.ModelViewSet):
+class UserViewSet(ConditionalGetMixin, FastListMixin, RelatedPlanMixin, viewsets.ModelViewSet):
     queryset = User.objects.all()
     serializer_class = UserResponseSerializer  # default
 
@@ -31,7 +40,7 @@ class UserViewSet(viewsets.ModelViewSet):
         return UserResponseSerializer
 
     def get_queryset(self):
-        queryset = User.objects.all()
+        queryset = super().get_queryset()
         user_type = self.request.query_params.get("user_type")
         is_active = self.request.query_params.get("is_active")
         is_verified = self.request.query_params.get("is_verified")
@@ -44,28 +53,44 @@ class UserViewSet(viewsets.ModelViewSet):
         if is_verified is not None:
             queryset = queryset.filter(is_verified=is_verified.lower() == 'true')
         if search:
-            queryset = queryset.filter(
-                Q(first_name__icontains=search) |
-                Q(last_name__icontains=search) |
-                Q(email__icontains=search)
-            )
+            queryset = apply_search(queryset, search)
+            self.cursor_ordering = ('search_rank', 'id')
         return queryset
 
     def create(self, request, *args, **kwargs):
-        if User.objects.filter(email=request.data.get("email")).exists():
+        # Deleted users keep their email, so check them too.
+        if User.all_objects.filter(email=request.data.get("email")).exists():
             return Response({"detail": "Email already registered"}, status=status.HTTP_400_BAD_REQUEST)
         return super().create(request, *args, **kwargs)
 
+    @action(detail=False, methods=['post'], url_path='bulk-import', permission_classes=[IsAdminUser], parser_classes=[MultiPartParser])
+    def bulk_import(self, request):
+        upload = request.FILES.get("file")
+        if upload is None:
+            return Response({"detail": "Upload a CSV or NDJSON file as 'file'"}, status=status.HTTP_400_BAD_REQUEST)
+        file_format = request.data.get("file_format") or ("ndjson" if upload.name.endswith((".ndjson", ".jsonl")) else "csv")
+        if file_format not in ("csv", "ndjson"):
+            return Response({"detail": "file_format must be 'csv' or 'ndjson'"}, status=status.HTTP_400_BAD_REQUEST)
+
+        # Rows that cannot be parsed are reported in the result alongside the rows that were created.
+        importer = UserImporter(workers=settings.BULK_IMPORT_WORKERS)
+        report = importer.run(iter_rows(upload.file, file_format))
+        return Response(report, status=status.HTTP_200_OK)
+
     def destroy(self, request, *args, **kwargs):
         instance = self.get_object()
-        instance.is_active = False  # Soft delete
-        instance.save()
+        instance.delete()
         return Response({"id": str(instance.id)}, status=status.HTTP_200_OK)
 
 
-class TeacherProfileViewSet(viewsets.ModelViewSet):
+class TeacherProfileViewSet(ConditionalGetMixin, StreamingExportMixin, FastListMixin, RelatedPlanMixin, viewsets.ModelViewSet):
     queryset = TeacherProfile.objects.select_related('user', 'department')
     serializer_class = TeacherProfileDetailSerializer
+    export_fields = (
+        'id', 'user__email', 'user__first_name', 'user__last_name', 'employee_id', 'designation',
+        'qualification', 'experience_years', 'department__department_code', 'office_location', 'created_at',
+    )
+    export_permission_classes = [IsAdminUser]
 
     def get_permissions(self):
         if self.action in ['me', 'update_me']:
@@ -83,9 +108,9 @@ class TeacherProfileViewSet(viewsets.ModelViewSet):
             return TeacherProfileListItemSerializer
         return TeacherProfileDetailSerializer
 
-    def list(self, request):
-        query = self.get_queryset().filter(user__deleted_at__isnull=True)
-        filters = request.query_params
+    def filter_queryset(self, queryset):
+        query = super().filter_queryset(queryset)
+        filters = self.request.query_params
 
         if eid := filters.get("employee_id"):
             query = query.filter(employee_id__icontains=eid)
@@ -106,26 +131,26 @@ class TeacherProfileViewSet(viewsets.ModelViewSet):
         if created_before := filters.get("created_before"):
             query = query.filter(created_at__lte=created_before)
         if search := filters.get("search_query"):
-            query = query.filter(
-                Q(user__first_name__icontains=search) |
-                Q(user__last_name__icontains=search) |
-                Q(employee_id__icontains=search)
-            )
+            query = apply_search(query, search, user_field="user_id")
+            self.cursor_ordering = ('search_rank', 'id')
+        return query
 
-        page = self.paginate_queryset(query)
-        serializer = self.get_serializer(page, many=True)
-        return self.get_paginated_response(serializer.data)
+    def get_my_profile(self):
+        profile_id = get_role(self.request).teacher_profile_id
+        if profile_id is None:
+            return None
+        return self.get_queryset().filter(pk=profile_id).first()
 
     @action(detail=False, methods=['get'], permission_classes=[IsTeacher])
     def me(self, request):
-        profile = TeacherProfile.objects.filter(user=request.user).first()
+        profile = self.get_my_profile()
         if not profile:
             return Response({"detail": "Teacher profile not found"}, status=404)
         return Response(self.get_serializer(profile).data)
 
     @action(detail=False, methods=['put'], permission_classes=[IsTeacher])
     def update_me(self, request):
-        profile = TeacherProfile.objects.filter(user=request.user).first()
+        profile = self.get_my_profile()
         if not profile:
             return Response({"detail": "Teacher profile not found"}, status=404)
         serializer = TeacherProfileUpdateSerializer(profile, data=request.data, partial=True)
@@ -139,18 +164,34 @@ class TeacherProfileViewSet(viewsets.ModelViewSet):
 
     def destroy(self, request, *args, **kwargs):
         profile = self.get_object()
-        if TeacherAssignment.objects.filter(teacher=profile, is_active=True).exists():
+        if profile.subject_teacher_sections.filter(is_active=True).exists():
             return Response({"detail": "Cannot delete teacher profile with active assignments"}, status=400)
         profile.delete()
         return Response({"success": True, "message": "Teacher profile deleted"}, status=200)
 
 
-class StudentProfileViewSet(viewsets.ModelViewSet):
+class StudentProfileViewSet(ConditionalGetMixin, StreamingExportMixin, FastListMixin, RelatedPlanMixin, viewsets.ModelViewSet):
     queryset = StudentProfile.objects.select_related('user', 'section', 'created_by', 'updated_by')
     serializer_class = StudentProfileSerializer
-
-
-class AdminProfileViewSet(viewsets.ModelViewSet):
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = ['section', 'admission_year', 'batch_year', 'current_semester', 'academic_status', 'enrollment_status', 'is_active']
+    export_fields = (
+        'id', 'user__email', 'user__first_name', 'user__last_name', 'registration_number',
+        'section__section_code', 'admission_year', 'current_semester', 'batch_year', 'program_type',
+        'cgpa', 'sgpa_current', 'total_credits_completed', 'total_credits_required',
+        'academic_status', 'enrollment_status', 'is_active', 'created_at',
+    )
+    export_permission_classes = [IsAdminUser]
+
+    @action(detail=False, methods=['get'], url_path='me/feed', permission_classes=[IsAuthenticated])
+    def feed(self, request):
+        role = get_role(request)
+        if role.student_profile_id is None:
+            return Response({"detail": "Student profile not found"}, status=404)
+        return Response(student_feed(role.student_profile_id, role.student_section_id))
+
+
+class AdminProfileViewSet(ConditionalGetMixin, FastListMixin, RelatedPlanMixin, viewsets.ModelViewSet):
     queryset = AdminProfile.objects.select_related('user', 'department', 'created_by', 'updated_by')
     serializer_class = AdminProfileSerializer
 
@@ -1,6 +1,6 @@
 from django.contrib import admin
 from django.core.exceptions import ValidationError
-from .models import Assignment, Quiz, Test, Submission, SubjectTeacherSection
+from .models import Assignment, Quiz, Test, Submission, SubjectTeacherSection, GradebookEntry, ArchivedSubmission, SubmissionArchive
 
 @admin.register(Assignment)
 class AssignmentAdmin(admin.ModelAdmin):
@@ -8,6 +8,7 @@ class AssignmentAdmin(admin.ModelAdmin):
     list_filter = ('subject', 'teacher', 'section', 'is_active')
     search_fields = ('title', 'description')
     autocomplete_fields = ['subject', 'teacher', 'section']
+    list_select_related = ('subject', 'teacher', 'section')
     list_per_page = 25
 
 
@@ -17,6 +18,7 @@ class QuizAdmin(admin.ModelAdmin):
     list_filter = ('subject', 'teacher', 'section', 'is_active')
     search_fields = ('title',)
     autocomplete_fields = ['subject', 'teacher', 'section']
+    list_select_related = ('subject', 'teacher', 'section')
     list_per_page = 25
 
 
@@ -26,6 +28,7 @@ class TestAdmin(admin.ModelAdmin):
     list_filter = ('subject', 'teacher', 'section', 'is_active')
     search_fields = ('title',)
     autocomplete_fields = ['subject', 'teacher', 'section']
+    list_select_related = ('subject', 'teacher', 'section')
     list_per_page = 25
 
 
@@ -35,6 +38,7 @@ class SubmissionAdmin(admin.ModelAdmin):
     list_filter = ('type', 'is_evaluated')
     search_fields = ('student__user__email', 'type')
     autocomplete_fields = ['student', 'assignment', 'quiz', 'test']
+    list_select_related = ('student__user',)
     list_per_page = 25
 
     def save_model(self, request, obj, form, change):
@@ -51,4 +55,31 @@ class SubjectTeacherSectionAdmin(admin.ModelAdmin):
     list_filter = ('subject', 'teacher', 'section', 'is_active')
     search_fields = ('subject__subject_code', 'teacher__user__email', 'section__section_code')
     autocomplete_fields = ['subject', 'teacher', 'section']
+    list_select_related = ('subject', 'teacher', 'section')
     list_per_page = 25
+
+
+@admin.register(GradebookEntry)
+class GradebookEntryAdmin(admin.ModelAdmin):
+    list_display = ('student', 'subject', 'section', 'graded_count', 'marks_obtained', 'marks_possible', 'percentage')
+    list_filter = ('subject', 'section')
+    search_fields = ('student__registration_number', 'student__user__email', 'subject__subject_code')
+    list_select_related = ('student__user', 'subject', 'section')
+    readonly_fields = [field.name for field in GradebookEntry._meta.fields]
+    list_per_page = 25
+
+
+@admin.register(ArchivedSubmission)
+class ArchivedSubmissionAdmin(admin.ModelAdmin):
+    list_display = ('student', 'type', 'academic_year', 'submitted_at', 'is_evaluated', 'obtained_marks')
+    list_filter = ('academic_year', 'type')
+    search_fields = ('student__user__email', 'type')
+    list_select_related = ('student__user',)
+    readonly_fields = [field.name for field in ArchivedSubmission._meta.fields]
+    list_per_page = 25
+
+
+@admin.register(SubmissionArchive)
+class SubmissionArchiveAdmin(admin.ModelAdmin):
+    list_display = ('academic_year', 'submission_count', 'started_at', 'copied_at', 'completed_at')
+    readonly_fields = [field.name for field in SubmissionArchive._meta.fields]
@@ -0,0 +1,168 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from rest_framework.permissions import SAFE_METHODS
+
+from department.models import Section
+
+from .models import ArchivedSubmission, Submission, SubmissionArchive
+
+# The year of the section a submission is graded under in the gradebook, so a
+# gradebook row always reads from one table only.
+ACADEMIC_YEAR = Coalesce(
+    'assignment__section__academic_year', 'quiz__section__academic_year',
+    'test__section__academic_year', 'student__section__academic_year',
+)
+ARCHIVED_FIELDS = [field.attname for field in Submission._meta.concrete_fields]
+
+_archiving = ContextVar('archiving', default=False)
+
+
+@contextmanager
+def archiving():
+    """Suspend gradebook refreshes: moving rows to the archive leaves every total unchanged."""
+    token = _archiving.set(True)
+    try:
+        yield
+    finally:
+        _archiving.reset(token)
+
+
+def is_archiving():
+    return _archiving.get()
+
+
+def archived_years():
+    """
+    Academic years whose submissions are read from the archive.
+
+    Read from the ledger every time rather than cached: it holds one row per
+    year, and a per-process copy would outlive an archive run in another
+    process and make its gradebook refreshes count the wrong table.
+    """
+    return frozenset(SubmissionArchive.objects.filter(copied_at__isnull=False).values_list('academic_year', flat=True))
+
+
+def submission_sources(condition=Q()):
+    """
+    The querysets that together hold every live submission matching ``condition``
+    exactly once: the live table without the archived years, and the archive.
+    """
+    live = Submission.objects.filter(condition)
+    years = archived_years()
+    if not years:
+        return [live]
+    return [
+        live.alias(academic_year=ACADEMIC_YEAR).exclude(academic_year__in=years),
+        ArchivedSubmission.objects.filter(condition, academic_year__in=years),
+    ]
+
+
+def open_sections(academic_year):
+    return Section.all_objects.filter(academic_year=academic_year, academic_status='active')
+
+
+def _live_rows(academic_year):
+    return Submission.all_objects.alias(academic_year=ACADEMIC_YEAR).filter(academic_year=academic_year).order_by('pk')
+
+
+def archive_year(academic_year, chunk_size=2000):
+    """
+    Move the submissions of ``academic_year`` into ``ArchivedSubmission``,
+    yielding ``(phase, rows)`` after every chunk.
+
+    The rows are first copied in pk order, one transaction per chunk, skipping
+    ids that are already archived. The ledger then switches reads of the year
+    over to the archive, and the live rows are deleted chunk by chunk, upserting
+    each into the archive first so later writes are not lost. Every step is
+    idempotent, so an interrupted run resumes when started again.
+    """
+    ledger, _ = SubmissionArchive.objects.get_or_create(academic_year=academic_year)
+    if ledger.copied_at is None:
+        copied, last = 0, None
+        while True:
+            chunk = _live_rows(academic_year)
+            if last is not None:
+                chunk = chunk.filter(pk__gt=last)
+            rows = list(chunk.values(*ARCHIVED_FIELDS)[:chunk_size])
+            if not rows:
+                break
+            ArchivedSubmission.all_objects.bulk_create(
+                [ArchivedSubmission(academic_year=academic_year, **row) for row in rows], ignore_conflicts=True,
+            )
+            copied, last = copied + len(rows), rows[-1]['id']
+            yield 'copied', copied
+        ledger.copied_at = timezone.now()
+        ledger.submission_count = ArchivedSubmission.all_objects.filter(academic_year=academic_year).count()
+        ledger.save()
+
+    deleted = 0
+    updated = [name for name in ARCHIVED_FIELDS if name != 'id']
+    with archiving():
+        last = None
+        while True:
+            chunk = _live_rows(academic_year)
+            if last is not None:
+                chunk = chunk.filter(pk__gt=last)
+            rows = list(chunk.values(*ARCHIVED_FIELDS)[:chunk_size])
+            if not rows:
+                if last is None:
+                    break
+                # One more pass from the start for rows written behind the cursor meanwhile.
+                last = None
+                continue
+            with transaction.atomic():
+                ArchivedSubmission.all_objects.bulk_create(
+                    [ArchivedSubmission(academic_year=academic_year, **row) for row in rows],
+                    update_conflicts=True, unique_fields=['id'], update_fields=updated,
+                )
+                Submission.all_objects.filter(pk__in=[row['id'] for row in rows]).hard_delete()
+            deleted, last = deleted + len(rows), rows[-1]['id']
+            yield 'deleted', deleted
+    ledger.completed_at = timezone.now()
+    ledger.submission_count = ArchivedSubmission.all_objects.filter(academic_year=academic_year).count()
+    ledger.save()
+
+
+class ArchiveFallbackMixin:
+    """
+    Reads with ``?academic_year=`` of an archived year are served from
+    ``ArchivedSubmission`` through ``archive_serializer_class``, which renders the
+    same shape; other years are filtered on the live table. Writes always go to
+    the live table.
+
+    Must come after ``RelatedPlanMixin`` so the plan follows the archive serializer.
+    """
+    archive_serializer_class = None
+
+    def get_academic_year(self):
+        request = getattr(self, 'request', None)
+        if request is None or request.method not in SAFE_METHODS:
+            return None
+        return request.query_params.get('academic_year') or None
+
+    def get_archived_years(self):
+        if not hasattr(self, '_archived_years'):
+            self._archived_years = archived_years()
+        return self._archived_years
+
+    def reads_archive(self):
+        year = self.get_academic_year()
+        return year is not None and year in self.get_archived_years()
+
+    def get_serializer_class(self):
+        if self.reads_archive():
+            return self.archive_serializer_class
+        return super().get_serializer_class()
+
+    def get_queryset(self):
+        year = self.get_academic_year()
+        if year is None:
+            return super().get_queryset()
+        if year in self.get_archived_years():
+            return ArchivedSubmission.objects.filter(academic_year=year)
+        return super().get_queryset().alias(academic_year=ACADEMIC_YEAR).filter(academic_year=year)
@@ -0,0 +1,95 @@
+from django.core.cache import cache
+from django.db.models import F, Q
+from django.utils import timezone
+
+from core.cache import get_cache_versions
+from core.db_router import primary_reads
+from department.models import Subject
+
+from .models import Assignment, Submission, SubjectTeacherSection, Test
+
+FEED_LIMIT = 50
+FEED_CACHE_TIMEOUT = 5 * 60
+
+_SUBMISSION_FIELDS = ('id', 'submitted_at', 'is_evaluated', 'obtained_marks')
+_SUBJECT_COLUMNS = dict(subject_code=F('subject__subject_code'), subject_name=F('subject__subject_name'))
+
+
+def feed_key(section_id):
+    # Subject names are embedded, so a subject edit orphans every section's feed.
+    version, = get_cache_versions([Subject])
+    return f'assessment:feed:{section_id}:{version}'
+
+
+def invalidate_feed(*section_ids):
+    keys = [feed_key(section_id) for section_id in set(section_ids) if section_id is not None]
+    if keys:
+        cache.delete_many(keys)
+
+
+def _section_feed(section_id, now):
+    """Open assignments and upcoming tests of the subjects actively taught in the section, one query each."""
+    subjects = SubjectTeacherSection.objects.filter(section_id=section_id, is_active=True).values('subject_id')
+    open_work = dict(section_id=section_id, subject_id__in=subjects, is_active=True)
+    assignments = (
+        Assignment.objects.filter(due_date__gte=now, **open_work)
+        .order_by('due_date', 'id')
+        .values('id', 'title', 'description', 'due_date', 'subject_id', **_SUBJECT_COLUMNS)[:FEED_LIMIT]
+    )
+    tests = (
+        Test.objects.filter(scheduled_date__gte=now, **open_work)
+        .order_by('scheduled_date', 'id')
+        .values('id', 'title', 'scheduled_date', 'total_marks', 'subject_id', **_SUBJECT_COLUMNS)[:FEED_LIMIT]
+    )
+    return {'assignments': list(assignments), 'tests': list(tests)}
+
+
+def get_section_feed(section_id, now=None):
+    """
+    The section's part of the feed, shared by all of its students. It is cached
+    until an assignment, test or subject mapping of the section changes; items
+    that fall due while it is cached are dropped on read.
+    """
+    now = now or timezone.now()
+    key = feed_key(section_id)
+    feed = cache.get(key)
+    if feed is None:
+        with primary_reads():
+            feed = _section_feed(section_id, now)
+        cache.set(key, feed, FEED_CACHE_TIMEOUT)
+    return {
+        'assignments': [row for row in feed['assignments'] if row['due_date'] >= now],
+        'tests': [row for row in feed['tests'] if row['scheduled_date'] >= now],
+    }
+
+
+def student_feed(student_id, section_id, now=None):
+    """
+    Open assignments and upcoming tests for a student's section, each with the
+    student's latest submission or ``None``: the cached section feed plus one
+    query for the student's own submissions.
+    """
+    now = now or timezone.now()
+    if section_id is None:
+        return {'section': None, 'assignments': [], 'tests': []}
+    feed = get_section_feed(section_id, now)
+    assignment_ids = [row['id'] for row in feed['assignments']]
+    test_ids = [row['id'] for row in feed['tests']]
+
+    submissions = {}
+    if assignment_ids or test_ids:
+        rows = (
+            Submission.objects.filter(student_id=student_id)
+            .filter(Q(assignment_id__in=assignment_ids) | Q(test_id__in=test_ids))
+            .order_by('submitted_at', 'id')
+            .values('assignment_id', 'test_id', *_SUBMISSION_FIELDS)
+        )
+        for row in rows:
+            # Later submissions overwrite earlier ones.
+            submissions[row['assignment_id'] or row['test_id']] = {name: row[name] for name in _SUBMISSION_FIELDS}
+
+    return {
+        'section': section_id,
+        'assignments': [{**row, 'submission': submissions.get(row['id'])} for row in feed['assignments']],
+        'tests': [{**row, 'submission': submissions.get(row['id'])} for row in feed['tests']],
+    }
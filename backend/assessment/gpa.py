@@ -0,0 +1,127 @@
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+
+import django
+from django.db import connections, transaction
+from django.db.models import ExpressionWrapper, F, FloatField, Q, Sum
+from django.utils import timezone
+
+from account.models import StudentProfile
+
+from .models import GradebookEntry
+
+GRADE_SCALE = 10.0
+PASS_FRACTION = 0.4
+TWO_PLACES = Decimal("0.01")
+GPA_FIELDS = ['cgpa', 'sgpa_current', 'total_credits_completed', 'updated_at']
+
+
+def _gpa(weighted, credits):
+    if not credits:
+        return Decimal("0.00")
+    value = Decimal(str(weighted / credits)).quantize(TWO_PLACES)
+    return min(max(value, Decimal("0.00")), Decimal("10.00"))
+
+
+def compute_gpa(student_ids):
+    """
+    Return ``{student_id: (cgpa, sgpa_current, total_credits_completed)}``.
+
+    Each gradebook row is graded on a ten point scale from its percentage and
+    weighted by ``Subject.credits``; the per-student totals come out of one
+    grouped query. SGPA covers the student's current semester, and credits count
+    as completed for passed subjects of earlier semesters.
+    """
+    grade_points = ExpressionWrapper(
+        F('subject__credits') * F('marks_obtained') * GRADE_SCALE / F('marks_possible'),
+        output_field=FloatField(),
+    )
+    current = Q(subject__semester=F('student__current_semester'))
+    completed = Q(
+        subject__semester__lt=F('student__current_semester'),
+        marks_obtained__gte=F('marks_possible') * PASS_FRACTION,
+    )
+    rows = (
+        GradebookEntry.objects
+        .filter(student_id__in=student_ids, marks_possible__gt=0)
+        .values('student_id')
+        .annotate(
+            weighted=Sum(grade_points),
+            credits=Sum('subject__credits'),
+            current_weighted=Sum(grade_points, filter=current),
+            current_credits=Sum('subject__credits', filter=current),
+            completed_credits=Sum('subject__credits', filter=completed, default=0),
+        )
+        .order_by()
+    )
+    return {
+        row['student_id']: (
+            _gpa(row['weighted'], row['credits']),
+            _gpa(row['current_weighted'], row['current_credits']),
+            row['completed_credits'],
+        )
+        for row in rows
+    }
+
+
+def recompute_students(student_ids):
+    """
+    Recompute and write back the GPA fields of ``student_ids``; returns the number of rows written.
+
+    The dirty flags are cleared before the gradebook is read, in the same
+    transaction: a refresh that lands meanwhile either waits for the lock on the
+    profile and marks it dirty again afterwards, or committed first and is read.
+    """
+    student_ids = list(student_ids)
+    with transaction.atomic():
+        StudentProfile.objects.filter(pk__in=student_ids, gpa_dirty=True).update(gpa_dirty=False)
+        results = compute_gpa(student_ids)
+        now = timezone.now()
+        empty = (Decimal("0.00"), Decimal("0.00"), 0)
+        profiles = []
+        for student_id in student_ids:
+            cgpa, sgpa, credits = results.get(student_id, empty)
+            profiles.append(StudentProfile(
+                id=student_id, cgpa=cgpa, sgpa_current=sgpa, total_credits_completed=credits, updated_at=now,
+            ))
+        StudentProfile.objects.bulk_update(profiles, GPA_FIELDS)
+    return len(profiles)
+
+
+def _init_worker():
+    django.setup()
+
+
+def _chunks(iterable, size):
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def recompute_gpa(queryset=None, dirty_only=False, workers=1, chunk_size=1000):
+    """
+    Recompute GPAs for every student in ``queryset`` (all students by default).
+
+    With ``dirty_only`` only students whose gradebook changed since their last
+    recompute are processed. ``workers > 1`` spreads the chunks over a process
+    pool, which is meant for whole-institution runs at semester end.
+    """
+    if queryset is None:
+        queryset = StudentProfile.objects.all()
+    if dirty_only:
+        queryset = queryset.filter(gpa_dirty=True)
+    chunks = _chunks(queryset.values_list('id', flat=True).iterator(chunk_size=chunk_size), chunk_size)
+
+    if workers <= 1:
+        return sum(recompute_students(chunk) for chunk in chunks)
+
+    chunks = list(chunks)
+    # Forked workers must not share the parent's open database connections.
+    connections.close_all()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        return sum(executor.map(recompute_students, chunks))
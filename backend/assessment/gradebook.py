@@ -0,0 +1,125 @@
+from decimal import Decimal
+from itertools import chain
+
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from account.models import StudentProfile
+
+from .archive import is_archiving, submission_sources
+from .models import GradebookEntry
+
+COUNTERS = ('assignment_count', 'quiz_count', 'test_count', 'graded_count', 'marks_obtained', 'marks_possible')
+STORED_FIELDS = COUNTERS + ('average_marks', 'percentage', 'updated_at')
+TWO_PLACES = Decimal("0.01")
+
+
+def aggregate_submissions(queryset):
+    """Group ``queryset`` by (student, subject, section) and total it up in a single query."""
+    graded = Q(is_evaluated=True, obtained_marks__isnull=False) & (Q(quiz__isnull=False) | Q(test__isnull=False))
+    return (
+        queryset
+        .annotate(
+            gradebook_subject=Coalesce('assignment__subject', 'quiz__subject', 'test__subject'),
+            gradebook_section=Coalesce('assignment__section', 'quiz__section', 'test__section', 'student__section'),
+        )
+        .filter(gradebook_subject__isnull=False)
+        # Submissions to a deleted assessment drop out; a missing relation also reads as NULL here.
+        .filter(assignment__deleted_at__isnull=True, quiz__deleted_at__isnull=True, test__deleted_at__isnull=True)
+        .values('student_id', 'gradebook_subject', 'gradebook_section')
+        .annotate(
+            assignment_count=Count('id', filter=Q(assignment__isnull=False)),
+            quiz_count=Count('id', filter=Q(quiz__isnull=False)),
+            test_count=Count('id', filter=Q(test__isnull=False)),
+            graded_count=Count('id', filter=graded),
+            marks_obtained=Sum('obtained_marks', filter=graded, default=0),
+            marks_possible=Sum(Coalesce('quiz__total_marks', 'test__total_marks'), filter=graded, default=0),
+        )
+        .order_by()
+    )
+
+
+def _entry_values(row):
+    values = {name: row[name] for name in COUNTERS}
+    average, percentage = Decimal("0.00"), Decimal("0.00")
+    if row['graded_count']:
+        average = (Decimal(row['marks_obtained']) / row['graded_count']).quantize(TWO_PLACES)
+    if row['marks_possible']:
+        percentage = (Decimal(row['marks_obtained']) * 100 / row['marks_possible']).quantize(TWO_PLACES)
+    values.update(average_marks=average, percentage=percentage)
+    return values
+
+
+def _key(row):
+    return row['student_id'], row['gradebook_subject'], row['gradebook_section']
+
+
+def refresh_students(student_ids):
+    """
+    Recompute the gradebook rows of the given students from their submissions.
+
+    Existing rows are updated in place so their ids stay stable for clients paging
+    through the gradebook; rows that no longer have submissions are removed.
+    Archived years are totalled from the archive. Does nothing while submissions
+    are being archived.
+
+    The students' profile rows are locked before their submissions are read, so
+    concurrent refreshes of a student run one after the other and the last one
+    writes totals that include every committed submission.
+    """
+    student_ids = set(student_ids)
+    if not student_ids or is_archiving():
+        return
+
+    with transaction.atomic():
+        # Lock in pk order so refreshes of overlapping students cannot deadlock.
+        list(StudentProfile.all_objects.select_for_update().filter(pk__in=student_ids).order_by('pk').values_list('pk', flat=True))
+        rows = chain.from_iterable(
+            aggregate_submissions(queryset) for queryset in submission_sources(Q(student_id__in=student_ids))
+        )
+        fresh = {_key(row): _entry_values(row) for row in rows}
+        now = timezone.now()
+
+        existing = GradebookEntry.objects.select_for_update().filter(student_id__in=student_ids)
+        to_update, stale = [], []
+        for entry in existing:
+            values = fresh.pop((entry.student_id, entry.subject_id, entry.section_id), None)
+            if values is None:
+                stale.append(entry.pk)
+                continue
+            for name, value in values.items():
+                setattr(entry, name, value)
+            entry.updated_at = now
+            to_update.append(entry)
+        if stale:
+            GradebookEntry.objects.filter(pk__in=stale).delete()
+        if to_update:
+            GradebookEntry.objects.bulk_update(to_update, STORED_FIELDS)
+        # Upsert in case a row appeared anyway, e.g. on databases without row locks.
+        GradebookEntry.objects.bulk_create([
+            GradebookEntry(student_id=student_id, subject_id=subject_id, section_id=section_id, **values)
+            for (student_id, subject_id, section_id), values in fresh.items()
+        ], update_conflicts=True, unique_fields=['student', 'subject', 'section'], update_fields=STORED_FIELDS)
+        StudentProfile.objects.filter(pk__in=student_ids).update(gpa_dirty=True, updated_at=now)
+
+
+def rebuild_gradebook(chunk_size=2000):
+    """Rebuild the whole gradebook from scratch with one grouped scan over live and archived submissions."""
+    created = 0
+    with transaction.atomic():
+        GradebookEntry.objects.all().delete()
+        batch = []
+        rows = chain.from_iterable(
+            aggregate_submissions(queryset).iterator(chunk_size=chunk_size) for queryset in submission_sources()
+        )
+        for row in rows:
+            student_id, subject_id, section_id = _key(row)
+            batch.append(GradebookEntry(student_id=student_id, subject_id=subject_id, section_id=section_id, **_entry_values(row)))
+            if len(batch) >= chunk_size:
+                created += len(GradebookEntry.objects.bulk_create(batch))
+                batch = []
+        created += len(GradebookEntry.objects.bulk_create(batch))
+        StudentProfile.objects.update(gpa_dirty=True, updated_at=timezone.now())
+    return created
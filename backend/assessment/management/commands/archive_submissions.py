@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from assessment.archive import archive_year, open_sections
+
+
+class Command(BaseCommand):
+    help = (
+        "Move the submissions of closed academic years into the archive table in chunks. "
+        "Safe to interrupt: running it again resumes where it stopped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('academic_years', nargs='+', metavar='academic_year')
+        parser.add_argument('--chunk-size', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        for academic_year in options['academic_years']:
+            if open_sections(academic_year).exists():
+                raise CommandError(f"{academic_year} still has active sections; close them before archiving.")
+        for academic_year in options['academic_years']:
+            counts = dict(archive_year(academic_year, chunk_size=options['chunk_size']))
+            self.stdout.write(self.style.SUCCESS(
+                f"{academic_year}: copied {counts.get('copied', 0)} and removed {counts.get('deleted', 0)} live submissions."
+            ))
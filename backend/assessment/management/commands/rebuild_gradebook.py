@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from assessment.gradebook import rebuild_gradebook
+
+
+class Command(BaseCommand):
+    help = "Rebuild the materialized gradebook from all submissions."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        created = rebuild_gradebook(chunk_size=options['chunk_size'])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt gradebook with {created} entries."))
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from account.models import StudentProfile
+from assessment.gpa import recompute_gpa
+
+
+class Command(BaseCommand):
+    help = "Recompute CGPA, SGPA and completed credits of students from the gradebook."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--section', help="Only students of this section code.")
+        parser.add_argument('--batch-year', type=int, help="Only students of this batch year.")
+        parser.add_argument('--dirty-only', action='store_true', help="Only students whose submissions changed since the last run.")
+        parser.add_argument('--workers', type=int, default=1)
+        parser.add_argument('--chunk-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        queryset = StudentProfile.objects.all()
+        if options['section']:
+            queryset = queryset.filter(section__section_code=options['section'])
+        if options['batch_year']:
+            queryset = queryset.filter(batch_year=options['batch_year'])
+
+        updated = recompute_gpa(
+            queryset,
+            dirty_only=options['dirty_only'],
+            workers=options['workers'],
+            chunk_size=options['chunk_size'],
+        )
+        self.stdout.write(self.style.SUCCESS(f"Recomputed GPA for {updated} students."))
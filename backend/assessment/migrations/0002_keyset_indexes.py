@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-18 18:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0002_keyset_indexes'),
+        ('assessment', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='submission',
+            index=models.Index(fields=['submitted_at', 'id'], name='assessment__submitt_bd7106_idx'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.4 on 2026-10-18 18:02
+
+import django.db.models.deletion
+import uuid
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0002_keyset_indexes'),
+        ('assessment', '0002_keyset_indexes'),
+        ('department', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GradebookEntry',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('assignment_count', models.PositiveIntegerField(default=0)),
+                ('quiz_count', models.PositiveIntegerField(default=0)),
+                ('test_count', models.PositiveIntegerField(default=0)),
+                ('graded_count', models.PositiveIntegerField(default=0)),
+                ('marks_obtained', models.IntegerField(default=0)),
+                ('marks_possible', models.PositiveIntegerField(default=0)),
+                ('average_marks', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=8)),
+                ('percentage', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=6)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('section', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='gradebook_entries', to='department.section')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='gradebook_entries', to='account.studentprofile')),
+                ('subject', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='gradebook_entries', to='department.subject')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['section', 'student', 'subject'], name='assessment__section_58860a_idx')],
+                'unique_together': {('student', 'subject', 'section')},
+            },
+        ),
+    ]
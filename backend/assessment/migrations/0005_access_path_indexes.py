@@ -0,0 +1,208 @@
+# Generated by Django 5.2.4 on 2026-10-18 18:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0004_user_search_index'),
+        ('assessment', '0004_submission_updated_at'),
+        ('department', '0002_section_enrolled_count'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='gradebookentry',
+            name='assessment__section_58860a_idx',
+        ),
+        migrations.AlterField(
+            model_name='assignment',
+            name='section',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to='department.section'),
+        ),
+        migrations.AlterField(
+            model_name='assignment',
+            name='subject',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='department.subject'),
+        ),
+        migrations.AlterField(
+            model_name='assignment',
+            name='teacher',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='account.teacherprofile'),
+        ),
+        migrations.AlterField(
+            model_name='gradebookentry',
+            name='section',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='gradebook_entries', to='department.section'),
+        ),
+        migrations.AlterField(
+            model_name='gradebookentry',
+            name='student',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='gradebook_entries', to='account.studentprofile'),
+        ),
+        migrations.AlterField(
+            model_name='gradebookentry',
+            name='subject',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='gradebook_entries', to='department.subject'),
+        ),
+        migrations.AlterField(
+            model_name='quiz',
+            name='section',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to='department.section'),
+        ),
+        migrations.AlterField(
+            model_name='quiz',
+            name='subject',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='department.subject'),
+        ),
+        migrations.AlterField(
+            model_name='quiz',
+            name='teacher',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='account.teacherprofile'),
+        ),
+        migrations.AlterField(
+            model_name='submission',
+            name='assignment',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to='assessment.assignment'),
+        ),
+        migrations.AlterField(
+            model_name='submission',
+            name='quiz',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to='assessment.quiz'),
+        ),
+        migrations.AlterField(
+            model_name='submission',
+            name='student',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='submissions', to='account.studentprofile'),
+        ),
+        migrations.AlterField(
+            model_name='submission',
+            name='test',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to='assessment.test'),
+        ),
+        migrations.AlterField(
+            model_name='test',
+            name='section',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='tests', to='department.section'),
+        ),
+        migrations.AlterField(
+            model_name='test',
+            name='subject',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='tests', to='department.subject'),
+        ),
+        migrations.AlterField(
+            model_name='test',
+            name='teacher',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='tests', to='account.teacherprofile'),
+        ),
+        migrations.AddIndex(
+            model_name='assignment',
+            index=models.Index(fields=['created_at', 'id'], name='assessment__created_9c62fb_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assignment',
+            index=models.Index(fields=['due_date', 'id'], name='assessment__due_dat_449d3e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assignment',
+            index=models.Index(fields=['teacher', 'created_at', 'id'], name='assessment__teacher_d896c3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assignment',
+            index=models.Index(fields=['subject', 'created_at', 'id'], name='assessment__subject_6c10f1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assignment',
+            index=models.Index(fields=['section', 'created_at', 'id'], name='assessment__section_379733_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assignment',
+            index=models.Index(fields=['section', 'due_date', 'id'], name='assessment__section_3083d0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='gradebookentry',
+            index=models.Index(fields=['student', 'subject', 'id'], name='assessment__student_3053fb_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='gradebookentry',
+            index=models.Index(fields=['section', 'student', 'subject', 'id'], name='assessment__section_a3b36e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='gradebookentry',
+            index=models.Index(fields=['subject', 'student', 'id'], name='assessment__subject_0f9122_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='quiz',
+            index=models.Index(fields=['created_at', 'id'], name='assessment__created_e3aa84_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='quiz',
+            index=models.Index(fields=['total_marks', 'id'], name='assessment__total_m_89d72a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='quiz',
+            index=models.Index(fields=['teacher', 'created_at', 'id'], name='assessment__teacher_faea4f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='quiz',
+            index=models.Index(fields=['subject', 'created_at', 'id'], name='assessment__subject_357b62_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='quiz',
+            index=models.Index(fields=['section', 'created_at', 'id'], name='assessment__section_3b547b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='submission',
+            index=models.Index(fields=['obtained_marks', 'id'], name='assessment__obtaine_35a3ce_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='submission',
+            index=models.Index(fields=['type', 'submitted_at', 'id'], name='assessment__type_21d5f3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='submission',
+            index=models.Index(fields=['student', 'submitted_at', 'id'], name='assessment__student_fe1623_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='submission',
+            index=models.Index(fields=['student', 'obtained_marks', 'id'], name='assessment__student_463a6b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='submission',
+            index=models.Index(condition=models.Q(('assignment__isnull', False)), fields=['assignment', 'submitted_at', 'id'], name='submission_assignment_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='submission',
+            index=models.Index(condition=models.Q(('quiz__isnull', False)), fields=['quiz', 'submitted_at', 'id'], name='submission_quiz_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='submission',
+            index=models.Index(condition=models.Q(('test__isnull', False)), fields=['test', 'submitted_at', 'id'], name='submission_test_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='test',
+            index=models.Index(fields=['created_at', 'id'], name='assessment__created_fa2f1c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='test',
+            index=models.Index(fields=['scheduled_date', 'id'], name='assessment__schedul_f64284_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='test',
+            index=models.Index(fields=['teacher', 'created_at', 'id'], name='assessment__teacher_0e07d8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='test',
+            index=models.Index(fields=['subject', 'created_at', 'id'], name='assessment__subject_53a2b2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='test',
+            index=models.Index(fields=['section', 'created_at', 'id'], name='assessment__section_ae5424_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='test',
+            index=models.Index(fields=['section', 'scheduled_date', 'id'], name='assessment__section_8d59f8_idx'),
+        ),
+    ]
@@ -0,0 +1,240 @@
+# Generated by Django 5.2.4 on 2026-10-18 18:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0005_soft_delete'),
+        ('assessment', '0005_access_path_indexes'),
+        ('department', '0003_soft_delete'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='assignment',
+            name='assessment__created_9c62fb_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='assignment',
+            name='assessment__due_dat_449d3e_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='assignment',
+            name='assessment__teacher_d896c3_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='assignment',
+            name='assessment__subject_6c10f1_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='assignment',
+            name='assessment__section_379733_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='assignment',
+            name='assessment__section_3083d0_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='quiz',
+            name='assessment__created_e3aa84_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='quiz',
+            name='assessment__total_m_89d72a_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='quiz',
+            name='assessment__teacher_faea4f_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='quiz',
+            name='assessment__subject_357b62_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='quiz',
+            name='assessment__section_3b547b_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='submission',
+            name='assessment__submitt_bd7106_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='submission',
+            name='assessment__obtaine_35a3ce_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='submission',
+            name='assessment__type_21d5f3_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='submission',
+            name='assessment__student_fe1623_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='submission',
+            name='assessment__student_463a6b_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='submission',
+            name='submission_assignment_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='submission',
+            name='submission_quiz_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='submission',
+            name='submission_test_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='test',
+            name='assessment__created_fa2f1c_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='test',
+            name='assessment__schedul_f64284_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='test',
+            name='assessment__teacher_0e07d8_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='test',
+            name='assessment__subject_53a2b2_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='test',
+            name='assessment__section_ae5424_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='test',
+            name='assessment__section_8d59f8_idx',
+        ),
+        migrations.AddField(
+            model_name='assignment',
+            name='deleted_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='quiz',
+            name='deleted_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='subjectteachersection',
+            name='deleted_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='submission',
+            name='deleted_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='test',
+            name='deleted_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='assignment',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['created_at', 'id'], name='assignment_live_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assignment',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['due_date', 'id'], name='assignment_live_due_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assignment',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['teacher', 'created_at', 'id'], name='assignment_live_teacher_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assignment',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['subject', 'created_at', 'id'], name='assignment_live_subject_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assignment',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['section', 'created_at', 'id'], name='assignment_live_section_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assignment',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['section', 'due_date', 'id'], name='assignment_live_sec_due_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='quiz',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['created_at', 'id'], name='quiz_live_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='quiz',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['total_marks', 'id'], name='quiz_live_marks_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='quiz',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['teacher', 'created_at', 'id'], name='quiz_live_teacher_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='quiz',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['subject', 'created_at', 'id'], name='quiz_live_subject_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='quiz',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['section', 'created_at', 'id'], name='quiz_live_section_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='submission',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['submitted_at', 'id'], name='submission_live_submitted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='submission',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['obtained_marks', 'id'], name='submission_live_marks_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='submission',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['type', 'submitted_at', 'id'], name='submission_live_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='submission',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['student', 'submitted_at', 'id'], name='submission_live_student_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='submission',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['student', 'obtained_marks', 'id'], name='submission_live_stu_marks_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='submission',
+            index=models.Index(condition=models.Q(('assignment__isnull', False), ('deleted_at__isnull', True)), fields=['assignment', 'submitted_at', 'id'], name='submission_assignment_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='submission',
+            index=models.Index(condition=models.Q(('quiz__isnull', False), ('deleted_at__isnull', True)), fields=['quiz', 'submitted_at', 'id'], name='submission_quiz_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='submission',
+            index=models.Index(condition=models.Q(('test__isnull', False), ('deleted_at__isnull', True)), fields=['test', 'submitted_at', 'id'], name='submission_test_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='test',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['created_at', 'id'], name='test_live_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='test',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['scheduled_date', 'id'], name='test_live_scheduled_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='test',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['teacher', 'created_at', 'id'], name='test_live_teacher_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='test',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['subject', 'created_at', 'id'], name='test_live_subject_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='test',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['section', 'created_at', 'id'], name='test_live_section_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='test',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['section', 'scheduled_date', 'id'], name='test_live_sec_sched_idx'),
+        ),
+    ]
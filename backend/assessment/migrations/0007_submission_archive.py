@@ -0,0 +1,50 @@
+# Generated by Django 5.2.4 on 2026-10-18 18:40
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0005_soft_delete'),
+        ('assessment', '0006_soft_delete'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SubmissionArchive',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('academic_year', models.CharField(max_length=20, unique=True)),
+                ('submission_count', models.PositiveIntegerField(default=0)),
+                ('started_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('copied_at', models.DateTimeField(blank=True, null=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ArchivedSubmission',
+            fields=[
+                ('deleted_at', models.DateTimeField(blank=True, editable=False, null=True)),
+                ('id', models.UUIDField(editable=False, primary_key=True, serialize=False)),
+                ('type', models.CharField(choices=[('ASSIGNMENT', 'assignment'), ('QUIZ', 'quiz'), ('TEST', 'test')], max_length=20)),
+                ('submitted_at', models.DateTimeField()),
+                ('is_evaluated', models.BooleanField(default=True)),
+                ('obtained_marks', models.IntegerField(blank=True, null=True)),
+                ('file_url', models.URLField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField()),
+                ('academic_year', models.CharField(max_length=20)),
+                ('archived_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('assignment', models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='assessment.assignment')),
+                ('quiz', models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='assessment.quiz')),
+                ('student', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='archived_submissions', to='account.studentprofile')),
+                ('test', models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='assessment.test')),
+            ],
+            options={
+                'indexes': [models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['academic_year', 'submitted_at', 'id'], name='archived_live_year_idx'), models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['student', 'submitted_at', 'id'], name='archived_live_student_idx')],
+            },
+        ),
+    ]
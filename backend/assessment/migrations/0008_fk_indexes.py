@@ -0,0 +1,163 @@
+# Generated by Django 5.2.4 on 2026-10-18 19:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0005_soft_delete'),
+        ('assessment', '0007_submission_archive'),
+        ('department', '0003_soft_delete'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='archivedsubmission',
+            name='archived_live_student_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='assignment',
+            name='assignment_live_teacher_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='assignment',
+            name='assignment_live_subject_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='assignment',
+            name='assignment_live_section_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='assignment',
+            name='assignment_live_sec_due_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='quiz',
+            name='quiz_live_teacher_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='quiz',
+            name='quiz_live_subject_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='quiz',
+            name='quiz_live_section_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='submission',
+            name='submission_live_student_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='submission',
+            name='submission_live_stu_marks_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='submission',
+            name='submission_assignment_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='submission',
+            name='submission_quiz_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='submission',
+            name='submission_test_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='test',
+            name='test_live_teacher_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='test',
+            name='test_live_subject_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='test',
+            name='test_live_section_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='test',
+            name='test_live_sec_sched_idx',
+        ),
+        migrations.AddIndex(
+            model_name='archivedsubmission',
+            index=models.Index(fields=['student', 'submitted_at', 'id'], name='archived_student_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='archivedsubmission',
+            index=models.Index(condition=models.Q(('assignment__isnull', False)), fields=['assignment'], name='archived_assignment_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='archivedsubmission',
+            index=models.Index(condition=models.Q(('quiz__isnull', False)), fields=['quiz'], name='archived_quiz_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='archivedsubmission',
+            index=models.Index(condition=models.Q(('test__isnull', False)), fields=['test'], name='archived_test_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assignment',
+            index=models.Index(fields=['teacher', 'created_at', 'id'], name='assignment_teacher_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assignment',
+            index=models.Index(fields=['subject', 'created_at', 'id'], name='assignment_subject_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assignment',
+            index=models.Index(fields=['section', 'created_at', 'id'], name='assignment_section_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assignment',
+            index=models.Index(fields=['section', 'due_date', 'id'], name='assignment_sec_due_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='quiz',
+            index=models.Index(fields=['teacher', 'created_at', 'id'], name='quiz_teacher_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='quiz',
+            index=models.Index(fields=['subject', 'created_at', 'id'], name='quiz_subject_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='quiz',
+            index=models.Index(fields=['section', 'created_at', 'id'], name='quiz_section_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='submission',
+            index=models.Index(fields=['student', 'submitted_at', 'id'], name='submission_student_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='submission',
+            index=models.Index(fields=['student', 'obtained_marks', 'id'], name='submission_stu_marks_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='submission',
+            index=models.Index(condition=models.Q(('assignment__isnull', False)), fields=['assignment', 'submitted_at', 'id'], name='submission_assignment_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='submission',
+            index=models.Index(condition=models.Q(('quiz__isnull', False)), fields=['quiz', 'submitted_at', 'id'], name='submission_quiz_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='submission',
+            index=models.Index(condition=models.Q(('test__isnull', False)), fields=['test', 'submitted_at', 'id'], name='submission_test_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='test',
+            index=models.Index(fields=['teacher', 'created_at', 'id'], name='test_teacher_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='test',
+            index=models.Index(fields=['subject', 'created_at', 'id'], name='test_subject_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='test',
+            index=models.Index(fields=['section', 'created_at', 'id'], name='test_section_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='test',
+            index=models.Index(fields=['section', 'scheduled_date', 'id'], name='test_sec_sched_idx'),
+        ),
+    ]
@@ -1,49 +1,80 @@
 import uuid
 from datetime import datetime
+from decimal import Decimal
 from enum import Enum
 from django.db import models
 from django.utils import timezone
 from django.core.exceptions import ValidationError
+from core.softdelete import SoftDeleteModel, live_index
 from account.models import TeacherProfile, StudentProfile
 from department.models import Subject, Section
 
-class Assignment(models.Model):
+class Assignment(SoftDeleteModel):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     title = models.CharField(max_length=255)
-    subject = models.ForeignKey(Subject, on_delete=models.CASCADE)
-    teacher = models.ForeignKey(TeacherProfile, on_delete=models.CASCADE)
-    section = models.ForeignKey(Section, on_delete=models.SET_NULL, null=True, blank=True)
+    subject = models.ForeignKey(Subject, on_delete=models.CASCADE, db_index=False)
+    teacher = models.ForeignKey(TeacherProfile, on_delete=models.CASCADE, db_index=False)
+    section = models.ForeignKey(Section, on_delete=models.SET_NULL, null=True, blank=True, db_index=False)
     description = models.TextField(blank=True, null=True)
     due_date = models.DateTimeField()
     created_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
     is_active = models.BooleanField(default=True)
 
+    class Meta:
+        indexes = [
+            live_index("created_at", "id", name="assignment_live_created_idx"),
+            live_index("due_date", "id", name="assignment_live_due_idx"),
+            models.Index(fields=["teacher", "created_at", "id"], name="assignment_teacher_idx"),
+            models.Index(fields=["subject", "created_at", "id"], name="assignment_subject_idx"),
+            models.Index(fields=["section", "created_at", "id"], name="assignment_section_idx"),
+            models.Index(fields=["section", "due_date", "id"], name="assignment_sec_due_idx"),
+        ]
+
 
-class Quiz(models.Model):
+class Quiz(SoftDeleteModel):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     title = models.CharField(max_length=255)
-    subject = models.ForeignKey(Subject, on_delete=models.CASCADE)
-    teacher = models.ForeignKey(TeacherProfile, on_delete=models.CASCADE)
-    section = models.ForeignKey(Section, on_delete=models.SET_NULL, null=True, blank=True)
+    subject = models.ForeignKey(Subject, on_delete=models.CASCADE, db_index=False)
+    teacher = models.ForeignKey(TeacherProfile, on_delete=models.CASCADE, db_index=False)
+    section = models.ForeignKey(Section, on_delete=models.SET_NULL, null=True, blank=True, db_index=False)
     total_marks = models.PositiveIntegerField()
     created_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
     is_active = models.BooleanField(default=True)
 
+    class Meta:
+        indexes = [
+            live_index("created_at", "id", name="quiz_live_created_idx"),
+            live_index("total_marks", "id", name="quiz_live_marks_idx"),
+            models.Index(fields=["teacher", "created_at", "id"], name="quiz_teacher_idx"),
+            models.Index(fields=["subject", "created_at", "id"], name="quiz_subject_idx"),
+            models.Index(fields=["section", "created_at", "id"], name="quiz_section_idx"),
+        ]
+
 
-class Test(models.Model):
+class Test(SoftDeleteModel):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     title = models.CharField(max_length=255)
-    subject = models.ForeignKey(Subject, on_delete=models.CASCADE, related_name="tests")
-    teacher = models.ForeignKey(TeacherProfile, on_delete=models.CASCADE, related_name="tests")
-    section = models.ForeignKey(Section, on_delete=models.SET_NULL, null=True, blank=True, related_name="tests")
+    subject = models.ForeignKey(Subject, on_delete=models.CASCADE, related_name="tests", db_index=False)
+    teacher = models.ForeignKey(TeacherProfile, on_delete=models.CASCADE, related_name="tests", db_index=False)
+    section = models.ForeignKey(Section, on_delete=models.SET_NULL, null=True, blank=True, related_name="tests", db_index=False)
     scheduled_date = models.DateTimeField()
     total_marks = models.PositiveIntegerField()
     created_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
     is_active = models.BooleanField(default=True)
 
+    class Meta:
+        indexes = [
+            live_index("created_at", "id", name="test_live_created_idx"),
+            live_index("scheduled_date", "id", name="test_live_scheduled_idx"),
+            models.Index(fields=["teacher", "created_at", "id"], name="test_teacher_idx"),
+            models.Index(fields=["subject", "created_at", "id"], name="test_subject_idx"),
+            models.Index(fields=["section", "created_at", "id"], name="test_section_idx"),
+            models.Index(fields=["section", "scheduled_date", "id"], name="test_sec_sched_idx"),
+        ]
+
 
 class SubmissionType(Enum):
     ASSIGNMENT = "assignment"
@@ -51,17 +82,32 @@ class SubmissionType(Enum):
     TEST = "test"
 
 
-class Submission(models.Model):
+class Submission(SoftDeleteModel):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    assignment = models.ForeignKey(Assignment, on_delete=models.SET_NULL, null=True, blank=True)
-    quiz = models.ForeignKey(Quiz, on_delete=models.SET_NULL, null=True, blank=True)
-    test = models.ForeignKey(Test, on_delete=models.SET_NULL, null=True, blank=True)
-    student = models.ForeignKey(StudentProfile, on_delete=models.CASCADE, related_name="submissions")
+    assignment = models.ForeignKey(Assignment, on_delete=models.SET_NULL, null=True, blank=True, db_index=False)
+    quiz = models.ForeignKey(Quiz, on_delete=models.SET_NULL, null=True, blank=True, db_index=False)
+    test = models.ForeignKey(Test, on_delete=models.SET_NULL, null=True, blank=True, db_index=False)
+    student = models.ForeignKey(StudentProfile, on_delete=models.CASCADE, related_name="submissions", db_index=False)
     type = models.CharField(max_length=20, choices=[(tag.name, tag.value) for tag in SubmissionType])
     submitted_at = models.DateTimeField(default=timezone.now)
     is_evaluated = models.BooleanField(default=True)
     obtained_marks = models.IntegerField(null=True, blank=True)
     file_url = models.URLField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            live_index("submitted_at", "id", name="submission_live_submitted_idx"),
+            live_index("obtained_marks", "id", name="submission_live_marks_idx"),
+            live_index("type", "submitted_at", "id", name="submission_live_type_idx"),
+            # Indexes led by a foreign key stay whole: deletes, cascades and ``all_objects`` look rows up by it.
+            models.Index(fields=["student", "submitted_at", "id"], name="submission_student_idx"),
+            models.Index(fields=["student", "obtained_marks", "id"], name="submission_stu_marks_idx"),
+            # Each submission belongs to exactly one of these, so most rows would be NULL keys.
+            models.Index(fields=["assignment", "submitted_at", "id"], condition=models.Q(assignment__isnull=False), name="submission_assignment_idx"),
+            models.Index(fields=["quiz", "submitted_at", "id"], condition=models.Q(quiz__isnull=False), name="submission_quiz_idx"),
+            models.Index(fields=["test", "submitted_at", "id"], condition=models.Q(test__isnull=False), name="submission_test_idx"),
+        ]
 
     def clean(self):
         filled = [bool(self.assignment), bool(self.quiz), bool(self.test)]
@@ -70,7 +116,53 @@ class Submission(models.Model):
 
 
 
-class SubjectTeacherSection(models.Model):
+class ArchivedSubmission(SoftDeleteModel):
+    """
+    A submission of a closed academic year, moved out of ``Submission`` by
+    ``archive_submissions`` with its id and columns unchanged.
+    """
+    id = models.UUIDField(primary_key=True, editable=False)
+    assignment = models.ForeignKey(Assignment, on_delete=models.SET_NULL, null=True, blank=True, related_name="+", db_index=False)
+    quiz = models.ForeignKey(Quiz, on_delete=models.SET_NULL, null=True, blank=True, related_name="+", db_index=False)
+    test = models.ForeignKey(Test, on_delete=models.SET_NULL, null=True, blank=True, related_name="+", db_index=False)
+    student = models.ForeignKey(StudentProfile, on_delete=models.CASCADE, related_name="archived_submissions", db_index=False)
+    type = models.CharField(max_length=20, choices=[(tag.name, tag.value) for tag in SubmissionType])
+    submitted_at = models.DateTimeField()
+    is_evaluated = models.BooleanField(default=True)
+    obtained_marks = models.IntegerField(null=True, blank=True)
+    file_url = models.URLField(null=True, blank=True)
+    updated_at = models.DateTimeField()
+    academic_year = models.CharField(max_length=20)
+    archived_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            live_index("academic_year", "submitted_at", "id", name="archived_live_year_idx"),
+            models.Index(fields=["student", "submitted_at", "id"], name="archived_student_idx"),
+            models.Index(fields=["assignment"], condition=models.Q(assignment__isnull=False), name="archived_assignment_idx"),
+            models.Index(fields=["quiz"], condition=models.Q(quiz__isnull=False), name="archived_quiz_idx"),
+            models.Index(fields=["test"], condition=models.Q(test__isnull=False), name="archived_test_idx"),
+        ]
+
+
+class SubmissionArchive(models.Model):
+    """
+    Ledger of ``archive_submissions``: one row per academic year. Once
+    ``copied_at`` is set the archive holds the whole year and is what reads of
+    that year use; ``completed_at`` is set once the live rows are gone too.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    academic_year = models.CharField(max_length=20, unique=True)
+    submission_count = models.PositiveIntegerField(default=0)
+    started_at = models.DateTimeField(default=timezone.now)
+    copied_at = models.DateTimeField(null=True, blank=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return self.academic_year
+
+
+class SubjectTeacherSection(SoftDeleteModel):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     subject = models.ForeignKey(Subject, related_name='subject_teacher_sections', on_delete=models.CASCADE)
     teacher = models.ForeignKey('account.TeacherProfile', related_name='subject_teacher_sections', on_delete=models.CASCADE)
@@ -83,4 +175,33 @@ class SubjectTeacherSection(models.Model):
         unique_together = ('subject', 'teacher', 'section')
 
     def __str__(self):
-        return f"{self.subject.subject_code} - {self.teacher.id} - {self.section.section_code}"
+        return f"{self.subject.subject_code} - {self.teacher_id} - {self.section.section_code}"
+
+
+class GradebookEntry(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    student = models.ForeignKey(StudentProfile, related_name='gradebook_entries', on_delete=models.CASCADE, db_index=False)
+    subject = models.ForeignKey(Subject, related_name='gradebook_entries', on_delete=models.CASCADE, db_index=False)
+    section = models.ForeignKey(Section, related_name='gradebook_entries', on_delete=models.CASCADE, db_index=False)
+    assignment_count = models.PositiveIntegerField(default=0)
+    quiz_count = models.PositiveIntegerField(default=0)
+    test_count = models.PositiveIntegerField(default=0)
+    graded_count = models.PositiveIntegerField(default=0)
+    marks_obtained = models.IntegerField(default=0)
+    marks_possible = models.PositiveIntegerField(default=0)
+    average_marks = models.DecimalField(max_digits=8, decimal_places=2, default=Decimal("0.00"))
+    percentage = models.DecimalField(max_digits=6, decimal_places=2, default=Decimal("0.00"))
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ('student', 'subject', 'section')
+        # Each filter column leads an index that then follows the cursor ordering (student, subject, id).
+        indexes = [
+            models.Index(fields=["student", "subject", "id"]),
+            models.Index(fields=["section", "student", "subject", "id"]),
+            models.Index(fields=["subject", "student", "id"]),
+        ]
+
+    def __str__(self):
+        return f"{self.student_id} - {self.subject_id} - {self.percentage}%"
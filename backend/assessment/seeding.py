@@ -0,0 +1,171 @@
+import random
+import uuid
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from functools import partial
+
+import django
+from django.contrib.auth.hashers import make_password
+from django.db import connections, transaction
+
+from account.models import StudentProfile, TeacherProfile, User, UserTypeEnum
+from account.search import get_search_backend
+from department.counters import reconcile_counters
+from department.models import Department, Section, Subject
+
+from .gradebook import rebuild_gradebook
+from .models import Assignment, Quiz, Submission, SubjectTeacherSection, SubmissionType, Test
+
+SEED_PASSWORD = 'seed-password'
+# Assessment and submission dates count back from here, within the seeded 2025-2026 academic year.
+SEED_EPOCH = datetime(2026, 3, 1, tzinfo=dt_timezone.utc)
+
+
+def _uuid(rng):
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def seed_password(seed=0):
+    # A fixed salt keeps the hash reproducible; the seed password is public anyway.
+    return make_password(SEED_PASSWORD, salt=f'seed{seed}')
+
+
+def seed_department(index, sections_per_department=2, students_per_section=30, teachers_per_department=4,
+                    subjects_per_department=4, assessments_per_subject=2, prefix='', seed=0, batch_size=1000,
+                    password=None):
+    """
+    Insert one department and everything under it in a single transaction, and
+    return the number of rows created per model.
+
+    Every section studies each subject of the department with one teacher, and
+    every student submits every assignment, quiz and test set for their section.
+    The random stream is derived from ``prefix``, ``seed`` and ``index`` alone, so
+    the result does not depend on which process seeds which department. Primary
+    keys are drawn from it and dates count back from ``SEED_EPOCH``, so the same
+    arguments insert the same rows; only the ``auto_now`` bookkeeping columns
+    record when they were inserted.
+    """
+    rng = random.Random(f'{prefix}{seed}-{index}')
+    password = password or seed_password(seed)
+    rows = Counter()
+
+    def create(model, objects):
+        model.objects.bulk_create(objects, batch_size=batch_size)
+        rows[model.__name__] += len(objects)
+        return objects
+
+    with transaction.atomic():
+        code = f'{prefix}D{index}'
+        department = create(Department, [
+            Department(id=_uuid(rng), department_code=code, department_name=f'{prefix}Department {index}', total_student_capacity=500)
+        ])[0]
+        sections = create(Section, [
+            Section(
+                id=_uuid(rng), section_code=f'{code}S{s}', section_name=f'Section {s}', department=department,
+                academic_year='2025-2026', batch_year=2025, capacity=students_per_section, max_capacity=students_per_section,
+            )
+            for s in range(sections_per_department)
+        ])
+        subjects = create(Subject, [
+            Subject(id=_uuid(rng), subject_code=f'{code}SUB{k}', subject_name=f'Subject {k}', department=department, semester=1 + k % 8, credits=rng.choice((2, 3, 4)))
+            for k in range(subjects_per_department)
+        ])
+
+        users, teachers, students = [], [], []
+        for t in range(teachers_per_department):
+            user = User(
+                id=_uuid(rng), date_joined=SEED_EPOCH, username=f'{code}-teacher{t}', email=f'{code}-teacher{t}@seed.example.com'.lower(), password=password,
+                first_name=f'Teacher{t}', last_name=code, user_type=UserTypeEnum.TEACHER,
+            )
+            users.append(user)
+            teachers.append(TeacherProfile(
+                id=_uuid(rng), user=user, department=department, employee_id=f'{code}-E{t}',
+                designation='Assistant Professor', qualification='PhD', experience_years=rng.randint(1, 25),
+            ))
+        for section in sections:
+            for n in range(students_per_section):
+                user = User(
+                    id=_uuid(rng), date_joined=SEED_EPOCH, username=f'{section.section_code}-{n}', email=f'{section.section_code}-{n}@seed.example.com'.lower(),
+                    password=password, first_name=f'Student{n}', last_name=section.section_code, user_type=UserTypeEnum.STUDENT,
+                )
+                users.append(user)
+                students.append(StudentProfile(
+                    id=_uuid(rng), user=user, section=section, registration_number=f'{section.section_code}-{n}',
+                    admission_year=2025, batch_year=2025, date_of_birth=date(2005, 1, 1) + timedelta(days=rng.randint(0, 700)),
+                ))
+        create(User, users)
+        create(TeacherProfile, teachers)
+        create(StudentProfile, students)
+
+        mappings, assessments = [], {}
+        for section in sections:
+            for subject in subjects:
+                teacher = rng.choice(teachers)
+                mappings.append(SubjectTeacherSection(id=_uuid(rng), subject=subject, teacher=teacher, section=section))
+                for k in range(assessments_per_subject):
+                    created_at = SEED_EPOCH - timedelta(days=rng.randint(1, 120), minutes=rng.randint(0, 1440))
+                    common = dict(subject=subject, teacher=teacher, section=section, created_at=created_at)
+                    assessments.setdefault(section.pk, []).extend([
+                        ('assignment', Assignment(id=_uuid(rng), title=f'Assignment {k}', due_date=created_at + timedelta(days=7), **common)),
+                        ('quiz', Quiz(id=_uuid(rng), title=f'Quiz {k}', total_marks=10, **common)),
+                        ('test', Test(id=_uuid(rng), title=f'Test {k}', total_marks=50, scheduled_date=created_at + timedelta(days=14), **common)),
+                    ])
+        create(SubjectTeacherSection, mappings)
+        for kind, model in (('assignment', Assignment), ('quiz', Quiz), ('test', Test)):
+            create(model, [obj for pairs in assessments.values() for obj_kind, obj in pairs if obj_kind == kind])
+
+        # Stream submissions out in batches; they dominate the row count.
+        submissions = []
+        for student in students:
+            for kind, obj in assessments.get(student.section_id, ()):
+                graded = kind != 'assignment' or rng.random() < 0.7
+                # Raw ids skip the related-object bookkeeping, which dominates at this volume.
+                submissions.append(Submission(
+                    id=_uuid(rng), student_id=student.pk, type=SubmissionType[kind.upper()].name, **{f'{kind}_id': obj.pk},
+                    submitted_at=obj.created_at + timedelta(hours=rng.randint(1, 72)),
+                    is_evaluated=graded,
+                    obtained_marks=rng.randint(0, getattr(obj, 'total_marks', 10)) if graded else None,
+                ))
+                if len(submissions) >= batch_size:
+                    create(Submission, submissions)
+                    submissions = []
+        create(Submission, submissions)
+    return rows
+
+
+def _init_worker():
+    django.setup()
+
+
+def seed_dataset(departments=2, prefix='', seed=0, workers=1, finalize=True, **sizes):
+    """
+    Seed ``departments`` departments (see ``seed_department`` for ``sizes``) and
+    return the total rows created per model.
+
+    ``workers > 1`` seeds departments on a process pool; each one commits on its
+    own. ``finalize`` rebuilds what ``bulk_create`` bypasses: headcount
+    counters, the gradebook and the search index.
+    """
+    seed_one = partial(seed_department, prefix=prefix, seed=seed, password=seed_password(seed), **sizes)
+    indexes = range(departments)
+    rows = Counter()
+    if workers <= 1:
+        for index in indexes:
+            rows.update(seed_one(index))
+    else:
+        # Forked workers must not share the parent's open database connections.
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            for created in executor.map(seed_one, indexes):
+                rows.update(created)
+    if finalize:
+        finalize_seed()
+    return dict(rows)
+
+
+def finalize_seed():
+    """Rebuild the derived data that bulk inserts leave stale."""
+    reconcile_counters()
+    rebuild_gradebook()
+    get_search_backend().rebuild()
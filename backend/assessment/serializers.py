@@ -1,10 +1,11 @@
 # serializers.py
 from rest_framework import serializers
-from .models import Assignment, Quiz, Test, Submission,SubjectTeacherSection
+from .models import Assignment, Quiz, Test, Submission,SubjectTeacherSection, GradebookEntry, ArchivedSubmission
 from account.serializers import  StudentProfileSerializer, TeacherProfileSerializer
 from department.serializers import SubjectSerializer, SectionSerializer
+from core.serializers import SparseFieldsMixin
 
-class AssignmentSerializer(serializers.ModelSerializer):
+class AssignmentSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     subject = SubjectSerializer(read_only=True)
     teacher = TeacherProfileSerializer(read_only=True)
     section = SectionSerializer(read_only=True)
@@ -13,7 +14,7 @@ class AssignmentSerializer(serializers.ModelSerializer):
         model = Assignment
         fields = '__all__'
 
-class QuizSerializer(serializers.ModelSerializer):
+class QuizSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     subject = SubjectSerializer(read_only=True)
     teacher = TeacherProfileSerializer(read_only=True)
     section = SectionSerializer(read_only=True)
@@ -22,7 +23,7 @@ class QuizSerializer(serializers.ModelSerializer):
         model = Quiz
         fields = '__all__'
 
-class TestSerializer(serializers.ModelSerializer):
+class TestSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     subject = SubjectSerializer(read_only=True)
     teacher = TeacherProfileSerializer(read_only=True)
     section = SectionSerializer(read_only=True)
@@ -31,7 +32,7 @@ class TestSerializer(serializers.ModelSerializer):
         model = Test
         fields = '__all__'
 
-class SubmissionSerializer(serializers.ModelSerializer):
+class SubmissionSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     assignment = AssignmentSerializer(read_only=True)
     quiz = QuizSerializer(read_only=True)
     test = TestSerializer(read_only=True)
@@ -42,7 +43,27 @@ class SubmissionSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 
-class SubjectTeacherSectionSerializer(serializers.ModelSerializer):
+class ArchivedSubmissionSerializer(SubmissionSerializer):
+    # Same fields in the same order as SubmissionSerializer, so archived years read alike.
+    class Meta:
+        model = ArchivedSubmission
+        fields = ['id', 'assignment', 'quiz', 'test', 'student', 'deleted_at', 'type', 'submitted_at',
+                  'is_evaluated', 'obtained_marks', 'file_url', 'updated_at']
+
+
+class BulkGradeItemSerializer(serializers.Serializer):
+    id = serializers.UUIDField()
+    obtained_marks = serializers.IntegerField(min_value=0, allow_null=True)
+    is_evaluated = serializers.BooleanField(default=True)
+
+
+class SubjectTeacherSectionSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = SubjectTeacherSection
         fields = '__all__'
+
+
+class GradebookEntrySerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    class Meta:
+        model = GradebookEntry
+        fields = '__all__'
@@ -0,0 +1,47 @@
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .archive import submission_sources
+from .feed import invalidate_feed
+from .gradebook import refresh_students
+from .models import Assignment, Quiz, Submission, SubjectTeacherSection, Test
+
+
+@receiver(post_save, sender=Submission)
+@receiver(post_delete, sender=Submission)
+def refresh_gradebook_for_submission(sender, instance, **kwargs):
+    refresh_students([instance.student_id])
+
+
+@receiver(post_save, sender=Assignment)
+@receiver(post_save, sender=Quiz)
+@receiver(post_save, sender=Test)
+def refresh_gradebook_for_assessment(sender, instance, created, **kwargs):
+    # Subject, section or total_marks may have changed under existing submissions.
+    if created:
+        return
+    condition = Q(**{sender._meta.model_name: instance})
+    refresh_students({
+        student_id for queryset in submission_sources(condition)
+        for student_id in queryset.values_list('student_id', flat=True).distinct()
+    })
+
+
+@receiver(pre_save, sender=Assignment)
+@receiver(pre_save, sender=Test)
+@receiver(pre_save, sender=SubjectTeacherSection)
+def remember_feed_section(sender, instance, **kwargs):
+    instance._previous_section_id = None
+    if not instance._state.adding:
+        instance._previous_section_id = sender.all_objects.filter(pk=instance.pk).values_list('section_id', flat=True).first()
+
+
+@receiver(post_save, sender=Assignment)
+@receiver(post_delete, sender=Assignment)
+@receiver(post_save, sender=Test)
+@receiver(post_delete, sender=Test)
+@receiver(post_save, sender=SubjectTeacherSection)
+@receiver(post_delete, sender=SubjectTeacherSection)
+def invalidate_feed_for_assessment(sender, instance, **kwargs):
+    invalidate_feed(instance.section_id, getattr(instance, '_previous_section_id', None))
@@ -1,3 +1,738 @@
-from django.test import TestCase
+import csv
+import datetime
+import decimal
+import gzip
+import io
+import json
+import time
+import uuid
+from unittest import skipUnless
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
 
-# Create your tests here.
+from django.apps import apps
+from django.contrib import admin
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import connection, transaction
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import http_date
+from django.utils.translation import gettext_lazy
+from rest_framework import serializers
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from account.models import StudentProfile, User
+from account.serializers import StudentProfileSerializer
+from core.benchmark import endpoints, list_serializers, measure_serializer
+from core.compiled import FastListMixin, compile_serializer
+from core.renderers import FastJSONParser, FastJSONRenderer
+from department.models import Department, Section, Subject
+from department.serializers import SectionSerializer
+
+from .archive import archive_year, archived_years
+from .gpa import compute_gpa, recompute_gpa
+from .gradebook import COUNTERS, rebuild_gradebook
+from .models import ArchivedSubmission, Assignment, GradebookEntry, Quiz, Submission, SubjectTeacherSection, SubmissionArchive, Test
+from .seeding import seed_dataset
+from .serializers import SubmissionSerializer
+
+
+@skipUnless(connection.vendor == 'sqlite', "Plan assertions are written against SQLite's EXPLAIN QUERY PLAN output.")
+class QueryPlanTests(TestCase):
+    """
+    Run EXPLAIN QUERY PLAN over the page queries each filtered or ordered list
+    endpoint issues, and fail when one scans a table without an index or sorts
+    in a temporary b-tree instead of reading rows in index order.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_dataset(departments=2, sections_per_department=3, students_per_section=25, subjects_per_department=4)
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+        cls.admin = User.objects.create_superuser(username='plan-admin', email='plan-admin@example.com', password='x', user_type='Admin')
+        cls.submission = Submission.objects.filter(assignment__isnull=False).first()
+        cls.assessment = Assignment.objects.first()
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def explain(self, sql):
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+            return [row[-1] for row in cursor.fetchall()]
+
+    def assertIndexedPlans(self, url, pages=2):
+        for _ in range(pages):
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, 200, url)
+            # Only the page query is paginated; validators and prefetches are bounded by it or by an index.
+            page_queries = [query['sql'] for query in ctx.captured_queries if ' LIMIT ' in query['sql']]
+            self.assertTrue(page_queries, url)
+            for sql in page_queries:
+                for detail in self.explain(sql):
+                    with self.subTest(url=url, step=detail):
+                        self.assertFalse(detail.startswith('SCAN ') and 'INDEX' not in detail, f'full scan: {detail}\n{sql}')
+                        self.assertNotIn('TEMP B-TREE', detail, f'sort without index: {detail}\n{sql}')
+            url = response.json()['next']
+            if url is None:
+                break
+
+    def test_submission_plans(self):
+        submission = self.submission
+        for query in (
+            '', f'?student={submission.student_id}', '?type=QUIZ',
+            f'?assignment={submission.assignment_id}', f'?quiz={Quiz.objects.first().pk}', f'?test={Test.objects.first().pk}',
+            '?ordering=submitted_at', '?ordering=-obtained_marks', '?ordering=obtained_marks',
+            f'?student={submission.student_id}&ordering=-obtained_marks',
+        ):
+            self.assertIndexedPlans(f'/api/submissions/{query}')
+
+    def test_assessment_plans(self):
+        assessment = self.assessment
+        filters = ('', f'?teacher={assessment.teacher_id}', f'?subject={assessment.subject_id}', f'?section={assessment.section_id}')
+        orderings = {
+            'assignments': ('due_date', '-due_date', 'created_at'),
+            'quizzes': ('created_at', '-total_marks'),
+            'tests': ('scheduled_date', '-scheduled_date'),
+        }
+        for resource, fields in orderings.items():
+            for query in filters:
+                self.assertIndexedPlans(f'/api/{resource}/{query}')
+            for field in fields:
+                self.assertIndexedPlans(f'/api/{resource}/?ordering={field}')
+            self.assertIndexedPlans(f'/api/{resource}/?section={assessment.section_id}&ordering={fields[0]}')
+
+    def test_foreign_key_plans(self):
+        # Cascades, SET_NULL updates and ``all_objects`` history all look rows up by foreign key, deleted or not.
+        for model in apps.get_app_config('assessment').get_models():
+            for field in model._meta.concrete_fields:
+                if not field.is_relation:
+                    continue
+                queryset = model._base_manager.filter(**{f'{field.attname}__in': [uuid.uuid4(), uuid.uuid4()]})
+                sql, params = queryset.query.sql_with_params()
+                with connection.cursor() as cursor:
+                    cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+                    plan = [row[-1] for row in cursor.fetchall()]
+                with self.subTest(field=f'{model._meta.label}.{field.name}'):
+                    self.assertFalse(any(detail.startswith('SCAN ') for detail in plan), plan)
+
+    def test_gradebook_plans(self):
+        entry_filters = (f'?student={self.submission.student_id}', f'?section={self.assessment.section_id}', f'?subject={self.assessment.subject_id}')
+        for query in ('',) + entry_filters:
+            self.assertIndexedPlans(f'/api/gradebook/{query}')
+
+
+@override_settings(NPLUSONE_MODE='raise', NPLUSONE_THRESHOLD=5)
+class NPlusOneTests(TestCase):
+    """Every admin changelist and API endpoint renders a page of rows without a query per row."""
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_dataset(departments=1, sections_per_department=2, students_per_section=12, subjects_per_department=3)
+        rebuild_gradebook()
+        cls.admin = User.objects.create_superuser(username='nplusone-admin', email='nplusone-admin@example.com', password='x', user_type='Admin')
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def test_admin_changelists(self):
+        for model in admin.site._registry:
+            url = reverse(f'admin:{model._meta.app_label}_{model._meta.model_name}_changelist')
+            with self.subTest(url=url):
+                self.assertEqual(self.client.get(url).status_code, 200)
+
+    def test_api_endpoints(self):
+        client = APIClient()
+        client.force_authenticate(self.admin)
+        client.force_login(self.admin)
+        # The dashboard counts on worker-thread connections, which cannot see the test transaction.
+        skipped = ('api-dashboard-summary',)
+        for name, url in endpoints():
+            if name in skipped:
+                continue
+            with self.subTest(url=url):
+                self.assertIn(client.get(url).status_code, (200, 404))
+
+
+class ConditionalGetTests(TestCase):
+    """Conditional requests are answered from timestamps and counts before anything is serialized."""
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_dataset(departments=1, sections_per_department=1, students_per_section=2, subjects_per_department=1)
+        cls.admin = User.objects.create_superuser(username='etag-admin', email='etag-admin@example.com', password='x', user_type='Admin')
+        cls.assignment = Assignment.objects.first()
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def test_detail(self):
+        url = f'/api/assignments/{self.assignment.pk}/'
+        response = self.client.get(url)
+        self.assertIn('Last-Modified', response)
+        with self.assertNumQueries(1):
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag']).status_code, 304)
+        self.assertEqual(self.client.get(url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified']).status_code, 304)
+
+        Assignment.objects.filter(pk=self.assignment.pk).update(updated_at=timezone.now() + datetime.timedelta(seconds=1))
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag']).status_code, 200)
+
+    def test_nested_parent_change(self):
+        # The subject is rendered inside the assignment, so its edits change the assignment's validators.
+        url = f'/api/assignments/{self.assignment.pk}/'
+        response = self.client.get(url)
+        not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified['ETag'], response['ETag'])
+
+        Subject.objects.filter(pk=self.assignment.subject_id).update(updated_at=timezone.now() + datetime.timedelta(seconds=1))
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag']).status_code, 200)
+
+    def test_list(self):
+        url = '/api/assignments/?ordering=due_date'
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertNotIn('ETag', response)
+        self.assertFalse([query['sql'] for query in queries.captured_queries if 'MAX(' in query['sql']])
+
+        # Revalidating by date hands out the ETag; both answer with the aggregate alone.
+        with self.assertNumQueries(1):
+            response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=http_date(time.time() + 60))
+        self.assertEqual(response.status_code, 304)
+        etag = response['ETag']
+        with self.assertNumQueries(1):
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        self.assertEqual(self.client.get(url + '&page_size=1', HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+        # A delete lowers the count even when no remaining row is newer.
+        Assignment.objects.exclude(pk=self.assignment.pk).first().delete()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertIn('Last-Modified', response)
+
+
+class CompiledSerializerTests(TestCase):
+    """The compiled list path renders exactly what the DRF serializers render."""
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_dataset(departments=1, sections_per_department=2, students_per_section=6, subjects_per_department=2)
+        rebuild_gradebook()
+
+    def test_list_serializers(self):
+        for name, serializer_class in list_serializers():
+            with self.subTest(serializer=serializer_class.__name__):
+                metrics = measure_serializer(serializer_class, rows=50, repeat=1)
+                self.assertIsNotNone(metrics['compiled_ms'], f"{serializer_class.__name__} does not compile")
+                self.assertTrue(metrics['identical'])
+
+    def test_narrow_projection(self):
+        # String and property sources project only the columns their models declare.
+        for serializer_class in (SubmissionSerializer, StudentProfileSerializer, SectionSerializer):
+            with self.subTest(serializer=serializer_class.__name__):
+                columns = compile_serializer(serializer_class).columns
+                self.assertFalse([column for column in columns if column.endswith('password')], columns)
+        self.assertIn('max_capacity', compile_serializer(SectionSerializer).columns)
+
+    def test_undeclared_attribute(self):
+        class StudentNameSerializer(serializers.ModelSerializer):
+            user = serializers.StringRelatedField()
+
+            class Meta:
+                model = StudentProfile
+                fields = ['id', 'user']
+
+        # Without a declaration the columns __str__ reads are unknown, so the list uses the serializer.
+        with patch.object(User, 'attribute_fields', {}):
+            self.assertIsNone(compile_serializer(StudentNameSerializer))
+
+
+class RendererTests(SimpleTestCase):
+    """``FastJSONRenderer`` and ``FastJSONParser`` agree byte for byte with DRF's, on either backend."""
+    data = [{
+        'id': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+        'at': datetime.datetime(2025, 1, 2, 3, 4, 5, 678901, tzinfo=datetime.timezone.utc),
+        'local': datetime.datetime(2025, 7, 1, 9, 30, tzinfo=ZoneInfo('Asia/Kolkata')),
+        'naive': datetime.datetime(2025, 1, 2, 3, 4),
+        'day': datetime.date(2025, 1, 2),
+        'cgpa': decimal.Decimal('8.75'),
+        'label': gettext_lazy('Student'),
+        'text': 'caf\u00e9 \u2028 \u2029 "quoted"',
+        'big': 2 ** 70,
+        'nested': ({1: 'int key'}, [None, True, 1.5]),
+    }]
+
+    def test_renderer(self):
+        expected = JSONRenderer().render(self.data)
+        for backend in ('stdlib', 'orjson'):
+            with self.subTest(backend=backend), override_settings(JSON_BACKEND=backend):
+                self.assertEqual(FastJSONRenderer().render(self.data), expected)
+                self.assertEqual(FastJSONRenderer().render(self.data[0]['nested']), JSONRenderer().render(self.data[0]['nested']))
+                self.assertEqual(
+                    FastJSONRenderer().render(self.data, 'application/json; indent=2'),
+                    JSONRenderer().render(self.data, 'application/json; indent=2'),
+                )
+
+    def test_parser(self):
+        body = '{"name": "caf\u00e9", "marks": [1, 2.5, null], "big": 123456789012345678901234567890}'.encode()
+        for backend in ('stdlib', 'orjson'):
+            with self.subTest(backend=backend), override_settings(JSON_BACKEND=backend):
+                self.assertEqual(FastJSONParser().parse(io.BytesIO(body)), JSONParser().parse(io.BytesIO(body)))
+                errors = []
+                for parser in (FastJSONParser(), JSONParser()):
+                    with self.assertRaises(ParseError) as caught:
+                        parser.parse(io.BytesIO(b'{"a": NaN}'))
+                    errors.append(str(caught.exception))
+                self.assertEqual(errors[0], errors[1])
+
+
+class SparseFieldsTests(TestCase):
+    """``?fields=`` and ``?expand=`` narrow the payload and the SQL behind it."""
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_dataset(departments=1, sections_per_department=1, students_per_section=4, subjects_per_department=2)
+        cls.admin = User.objects.create_superuser(username='sparse-admin', email='sparse-admin@example.com', password='x', user_type='Admin')
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def get(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, response.content)
+        page_sql = [query['sql'] for query in queries.captured_queries if ' LIMIT ' in query['sql']]
+        return response.json(), page_sql[0]
+
+    def test_fields(self):
+        data, sql = self.get('/api/assignments/?fields=id,title,subject.subject_name')
+        self.assertEqual(data['results'][0].keys(), {'id', 'title', 'subject'})
+        self.assertEqual(data['results'][0]['subject'].keys(), {'subject_name'})
+        self.assertNotIn('description', sql)
+        self.assertNotIn('account_teacherprofile', sql)
+        self.assertNotIn('subject_code', sql)
+
+    def test_expand(self):
+        data, sql = self.get('/api/submissions/?expand=assignment.subject&fields=id,assignment,student')
+        row = next(row for row in data['results'] if row['assignment'] is not None)
+        self.assertIsInstance(row['student'], str)
+        self.assertIsInstance(row['assignment']['subject'], dict)
+        self.assertIsInstance(row['assignment']['teacher'], str)
+        self.assertNotIn('account_studentprofile', sql)
+        self.assertNotIn('account_teacherprofile', sql)
+
+    def test_compiled_and_serializer_paths_agree(self):
+        url = '/api/submissions/?fields=id,obtained_marks,student.registration_number,student.user&page_size=5'
+        fast = self.client.get(url).content
+        with patch.object(FastListMixin, 'fast_list', False):
+            self.assertEqual(self.client.get(url).content, fast)
+
+    def test_detail(self):
+        assignment = Assignment.objects.first()
+        data, _ = self.get(f'/api/assignments/{assignment.pk}/?fields=title,teacher.employee_id')
+        self.assertEqual(data, {'title': assignment.title, 'teacher': {'employee_id': assignment.teacher.employee_id}})
+
+    def test_invalid_selection(self):
+        for url in ('/api/assignments/?fields=nope', '/api/assignments/?expand=title', '/api/assignments/?fields=title.x'):
+            with self.subTest(url=url):
+                self.assertEqual(self.client.get(url).status_code, 400)
+
+
+class StudentFeedTests(TestCase):
+    """The student feed costs a fixed number of queries and follows assessment writes."""
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_dataset(departments=1, sections_per_department=1, students_per_section=3, subjects_per_department=2)
+        cls.students = list(StudentProfile.objects.select_related('user'))
+        cls.mapping = SubjectTeacherSection.objects.first()
+        # Seeded work is all past due; give the section something upcoming.
+        common = dict(subject=cls.mapping.subject, teacher=cls.mapping.teacher, section=cls.mapping.section)
+        cls.upcoming = Test.objects.create(title='Midterm', total_marks=50, scheduled_date=timezone.now() + datetime.timedelta(days=7), **common)
+        Submission.objects.create(student=cls.students[0], test=cls.upcoming, type='TEST', obtained_marks=40)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.students[0].user)
+
+    def feed(self, queries):
+        with self.assertNumQueries(queries):
+            response = self.client.get('/api/student-profiles/me/feed/')
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_queries(self):
+        # Role, assignments, tests and the student's submissions; then the section feed is cached.
+        self.feed(4)
+        self.feed(1)
+        self.client.force_authenticate(self.students[1].user)
+        self.feed(2)
+
+    def test_invalidated_on_write(self):
+        self.feed(4)
+        assignment = Assignment.objects.create(
+            title='Due tomorrow', subject=self.mapping.subject, teacher=self.mapping.teacher,
+            section=self.mapping.section, due_date=timezone.now() + datetime.timedelta(days=1),
+        )
+        data = self.feed(3)
+        self.assertEqual(data['assignments'][0]['id'], str(assignment.pk))
+        self.assertIsNone(data['assignments'][0]['submission'])
+        self.assertEqual(data['tests'][0]['submission']['obtained_marks'], 40)
+
+    def test_not_a_student(self):
+        admin = User.objects.create_superuser(username='feed-admin', email='feed-admin@example.com', password='x', user_type='Admin')
+        self.client.force_authenticate(admin)
+        self.assertEqual(self.client.get('/api/student-profiles/me/feed/').status_code, 404)
+
+
+class GradebookTests(TestCase):
+    """The gradebook kept up to date from submission writes matches a full rebuild."""
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_dataset(departments=1, sections_per_department=1, students_per_section=3, subjects_per_department=2)
+        cls.admin = User.objects.create_superuser(username='grade-admin', email='grade-admin@example.com', password='x', user_type='Admin')
+
+    def gradebook(self):
+        return sorted(GradebookEntry.objects.values_list('student_id', 'subject_id', 'section_id', *COUNTERS, 'average_marks', 'percentage'))
+
+    def test_maintained_on_write(self):
+        quiz_submission = Submission.objects.filter(quiz__isnull=False).first()
+        quiz_submission.obtained_marks, quiz_submission.is_evaluated = 0, True
+        quiz_submission.save()
+        Submission.objects.filter(test__isnull=False).first().delete()
+        test = Test.objects.filter(submission__is_evaluated=True).first()
+        test.total_marks *= 2
+        test.save()
+        Assignment.objects.first().delete()
+
+        maintained = self.gradebook()
+        rebuild_gradebook()
+        self.assertEqual(self.gradebook(), maintained)
+
+    def test_command(self):
+        expected = self.gradebook()
+        out = io.StringIO()
+        call_command('rebuild_gradebook', chunk_size=5, stdout=out)
+        self.assertEqual(out.getvalue().strip(), f'Rebuilt gradebook with {len(expected)} entries.')
+        self.assertEqual(self.gradebook(), expected)
+
+    def test_endpoint(self):
+        client = APIClient()
+        client.force_authenticate(self.admin)
+        student = StudentProfile.objects.first()
+        response = client.get(f'/api/gradebook/?student={student.pk}')
+        self.assertEqual(response.status_code, 200)
+        entries = {str(entry.pk): entry for entry in GradebookEntry.objects.filter(student=student)}
+        self.assertTrue(entries)
+        self.assertEqual({row['id'] for row in response.json()['results']}, set(entries))
+        for row in response.json()['results']:
+            entry = entries[row['id']]
+            self.assertEqual((row['graded_count'], decimal.Decimal(row['percentage'])), (entry.graded_count, entry.percentage))
+
+
+class SeedingTests(TestCase):
+    """The same seed inserts the same rows."""
+
+    def seeded(self, seed):
+        sid = transaction.savepoint()
+        seed_dataset(departments=1, seed=seed, finalize=False, sections_per_department=1, students_per_section=3, subjects_per_department=2)
+        rows = (
+            list(User.objects.order_by('pk').values_list('pk', 'username', 'password', 'date_joined')),
+            list(Assignment.all_objects.order_by('pk').values_list('pk', 'title', 'due_date', 'created_at')),
+            list(Submission.objects.order_by('pk').values_list('pk', 'submitted_at', 'obtained_marks')),
+        )
+        transaction.savepoint_rollback(sid)
+        return rows
+
+    def test_reproducible(self):
+        first = self.seeded(seed=7)
+        self.assertTrue(all(first))
+        self.assertEqual(self.seeded(seed=7), first)
+        self.assertFalse({pk for pk, *_ in first[0]} & {pk for pk, *_ in self.seeded(seed=8)[0]})
+
+
+class SoftDeleteTests(TestCase):
+    """Deleted assessments stay in ``all_objects`` but drop out of derived data."""
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_dataset(departments=1, sections_per_department=1, students_per_section=3, subjects_per_department=2)
+
+    def test_queryset_delete(self):
+        test = Test.objects.filter(submission__isnull=False).first()
+        student_id = Submission.objects.filter(test=test).values_list('student_id', flat=True).first()
+        tests = Submission.objects.filter(student_id=student_id, test__isnull=False).count()
+        self.assertEqual(Test.objects.filter(pk=test.pk).delete(), (1, {'assessment.Test': 1}))
+        self.assertTrue(Test.all_objects.dead().filter(pk=test.pk).exists())
+        # Submissions to the deleted test drop out of the gradebook.
+        counted = sum(GradebookEntry.objects.filter(student_id=student_id).values_list('test_count', flat=True))
+        self.assertEqual(counted, tests - Submission.objects.filter(student_id=student_id, test=test).count())
+
+
+class ArchiveTests(TestCase):
+    """Archiving a closed year moves its submissions without changing what reads return."""
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_dataset(departments=1, sections_per_department=1, students_per_section=3, subjects_per_department=2)
+        cls.admin = User.objects.create_superuser(username='archive-admin', email='archive-admin@example.com', password='x', user_type='Admin')
+        cls.year = Section.objects.values_list('academic_year', flat=True).first()
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def gradebook(self):
+        return sorted(GradebookEntry.objects.values_list('student_id', 'subject_id', 'section_id', *COUNTERS, 'percentage'))
+
+    def submissions(self):
+        response = self.client.get(f'/api/submissions/?academic_year={self.year}')
+        self.assertEqual(response.status_code, 200)
+        return sorted(response.json()['results'], key=lambda row: row['id'])
+
+    def test_open_year_refused(self):
+        with self.assertRaises(CommandError):
+            call_command('archive_submissions', self.year)
+        self.assertFalse(ArchivedSubmission.all_objects.exists())
+
+    def test_years_follow_ledger(self):
+        self.assertEqual(archived_years(), frozenset())
+        # Another process's archive run, which fires no signals here.
+        SubmissionArchive.objects.bulk_create([SubmissionArchive(academic_year=self.year, copied_at=timezone.now())])
+        self.assertEqual(archived_years(), {self.year})
+
+    def test_resumable_archive(self):
+        Section.objects.update(academic_status='closed')
+        total = Submission.objects.count()
+        gradebook, submissions = self.gradebook(), self.submissions()
+
+        run = archive_year(self.year, chunk_size=5)
+        self.assertEqual(next(run), ('copied', 5))
+        run.close()
+        # An interrupted copy leaves reads on the live table.
+        self.assertEqual(Submission.objects.count(), total)
+        self.assertEqual(self.submissions(), submissions)
+
+        phases = list(archive_year(self.year, chunk_size=5))
+        self.assertEqual(phases[-1], ('deleted', total))
+        self.assertFalse(Submission.all_objects.exists())
+        self.assertEqual(ArchivedSubmission.objects.count(), total)
+        self.assertIsNotNone(SubmissionArchive.objects.get(academic_year=self.year).completed_at)
+
+        self.assertEqual(self.submissions(), submissions)
+        self.assertEqual(self.gradebook(), gradebook)
+        rebuild_gradebook()
+        self.assertEqual(self.gradebook(), gradebook)
+
+
+class BulkGradeTests(TestCase):
+    """Teachers and admins grade a batch of submissions all at once or not at all."""
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_dataset(departments=1, sections_per_department=1, students_per_section=2, subjects_per_department=1)
+        cls.submission = Submission.objects.filter(quiz__isnull=False).select_related('student__user').first()
+        cls.quiz_submissions = list(Submission.objects.filter(quiz__isnull=False).select_related('quiz').order_by('pk'))
+        cls.teacher = User.objects.filter(user_type='Teacher').first()
+
+    def grade(self, user=None, payload=None):
+        client = APIClient()
+        if user is not None:
+            client.force_authenticate(user)
+        if payload is None:
+            payload = [{'id': str(self.submission.pk), 'obtained_marks': 0, 'is_evaluated': True}]
+        return client.post('/api/submissions/bulk-grade/', payload, format='json')
+
+    def grades(self):
+        return list(Submission.objects.order_by('pk').values_list('pk', 'obtained_marks', 'is_evaluated'))
+
+    def gradebook(self):
+        return sorted(GradebookEntry.objects.values_list('student_id', 'subject_id', *COUNTERS, 'percentage'))
+
+    def test_grades_batch(self):
+        payload = [
+            {'id': str(submission.pk), 'obtained_marks': submission.quiz.total_marks, 'is_evaluated': True}
+            for submission in self.quiz_submissions
+        ]
+        payload[0].update(obtained_marks=None, is_evaluated=False)
+        response = self.grade(self.teacher, payload)
+        self.assertEqual((response.status_code, response.json()), (200, {'updated': len(payload)}))
+        graded = {pk: (marks, evaluated) for pk, marks, evaluated in self.grades()}
+        self.assertEqual(graded[self.quiz_submissions[0].pk], (None, False))
+        for submission in self.quiz_submissions[1:]:
+            self.assertEqual(graded[submission.pk], (submission.quiz.total_marks, True))
+
+        # bulk_update sends no signals; the view refreshes the gradebook itself.
+        maintained = self.gradebook()
+        rebuild_gradebook()
+        self.assertEqual(self.gradebook(), maintained)
+
+    def test_over_total_rejects_batch(self):
+        before, gradebook = self.grades(), self.gradebook()
+        over = self.quiz_submissions[-1]
+        payload = [
+            {'id': str(submission.pk), 'obtained_marks': 0, 'is_evaluated': True} for submission in self.quiz_submissions
+        ]
+        payload[-1]['obtained_marks'] = over.quiz.total_marks + 1
+        response = self.grade(self.teacher, payload)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(list(response.json()['errors']), [str(over.pk)])
+        self.assertEqual(self.grades(), before)
+        self.assertEqual(self.gradebook(), gradebook)
+
+    def test_unknown_and_duplicate_ids(self):
+        before = self.grades()
+        unknown = str(uuid.uuid4())
+        response = self.grade(self.teacher, [
+            {'id': str(self.submission.pk), 'obtained_marks': 0}, {'id': unknown, 'obtained_marks': 0},
+        ])
+        self.assertEqual((response.status_code, response.json()), (400, {'errors': {unknown: 'Submission not found'}}))
+
+        item = {'id': str(self.submission.pk), 'obtained_marks': 0}
+        self.assertEqual(self.grade(self.teacher, [item, item]).status_code, 400)
+        self.assertEqual(self.grades(), before)
+
+    def test_malformed_body(self):
+        before = self.grades()
+        for payload in ({'id': str(self.submission.pk), 'obtained_marks': 0}, [{'id': 'nope', 'obtained_marks': -1}]):
+            with self.subTest(payload=payload):
+                self.assertEqual(self.grade(self.teacher, payload).status_code, 400)
+        self.assertEqual(self.grades(), before)
+
+    def test_permissions(self):
+        self.assertIn(self.grade().status_code, (401, 403))
+        self.assertEqual(self.grade(self.submission.student.user).status_code, 403)
+        self.submission.refresh_from_db()
+        self.assertNotEqual(self.submission.obtained_marks, 0)
+
+        self.assertEqual(self.grade(self.teacher).json(), {'updated': 1})
+        self.submission.refresh_from_db()
+        self.assertEqual(self.submission.obtained_marks, 0)
+
+
+class GpaTests(TestCase):
+    """GPAs are credit-weighted grades on a ten point scale read off the gradebook."""
+
+    @classmethod
+    def setUpTestData(cls):
+        department = Department.objects.create(department_code='GPA', department_name='Grading')
+        cls.section = Section.objects.create(section_code='GPA-A', section_name='A', department=department, academic_year='2025-2026', batch_year=2025)
+        cls.students = [
+            StudentProfile.objects.create(
+                user=User.objects.create_user(username=f'gpa{number}', email=f'gpa{number}@example.com', password='x', user_type='Student'),
+                section=cls.section, admission_year=2025, batch_year=2025, current_semester=2, date_of_birth=datetime.date(2007, 1, 1),
+            )
+            for number in range(2)
+        ]
+        subjects = [
+            Subject.objects.create(subject_code=f'GPA{semester}{credits}', subject_name='Subject', department=department, semester=semester, credits=credits)
+            for semester, credits in ((1, 4), (1, 2), (2, 3))
+        ]
+        # 8.0 and passed, 3.0 and failed in the first semester; 9.0 in the current one.
+        GradebookEntry.objects.bulk_create([
+            GradebookEntry(student=cls.students[0], subject=subject, section=cls.section, marks_obtained=obtained, marks_possible=possible)
+            for subject, (obtained, possible) in zip(subjects, ((80, 100), (30, 100), (45, 50)))
+        ])
+
+    def gpas(self):
+        return [
+            (student.cgpa, student.sgpa_current, student.total_credits_completed, student.gpa_dirty)
+            for student in StudentProfile.objects.filter(pk__in=[student.pk for student in self.students]).order_by('user__username')
+        ]
+
+    def test_recompute(self):
+        self.assertEqual(recompute_gpa(StudentProfile.objects.filter(section=self.section)), 2)
+        self.assertEqual(self.gpas(), [
+            (decimal.Decimal('7.22'), decimal.Decimal('9.00'), 4, False),
+            (decimal.Decimal('0.00'), decimal.Decimal('0.00'), 0, False),
+        ])
+
+    def test_dirtied_during_recompute(self):
+        student = self.students[0]
+
+        def refresh_meanwhile(student_ids):
+            # A gradebook refresh committing while the GPAs are computed.
+            StudentProfile.objects.filter(pk=student.pk).update(gpa_dirty=True)
+            return compute_gpa(student_ids)
+
+        with patch('assessment.gpa.compute_gpa', side_effect=refresh_meanwhile):
+            recompute_gpa(StudentProfile.objects.filter(section=self.section))
+        self.assertEqual([row[3] for row in self.gpas()], [True, False])
+        self.assertEqual(recompute_gpa(StudentProfile.objects.filter(section=self.section), dirty_only=True), 1)
+
+    def test_dirty_flag_read_only(self):
+        admin = User.objects.create_superuser(username='gpa-admin', email='gpa-admin@example.com', password='x', user_type='Admin')
+        client = APIClient()
+        client.force_authenticate(admin)
+        response = client.patch(f'/api/student-profiles/{self.students[0].pk}/', {'gpa_dirty': False}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['gpa_dirty'])
+        self.assertTrue(self.gpas()[0][3])
+
+    def test_dirty_only(self):
+        recompute_gpa(StudentProfile.objects.filter(section=self.section))
+        GradebookEntry.objects.filter(student=self.students[0]).update(marks_obtained=0)
+        self.assertEqual(recompute_gpa(StudentProfile.objects.filter(section=self.section), dirty_only=True), 0)
+        self.assertEqual(self.gpas()[0][0], decimal.Decimal('7.22'))
+
+        StudentProfile.objects.filter(pk=self.students[0].pk).update(gpa_dirty=True)
+        self.assertEqual(recompute_gpa(StudentProfile.objects.filter(section=self.section), dirty_only=True), 1)
+        self.assertEqual(self.gpas()[0], (decimal.Decimal('0.00'), decimal.Decimal('0.00'), 0, False))
+
+
+class ExportTests(TestCase):
+    """Exports stream the filtered rows as CSV, NDJSON or gzip to admins only."""
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_dataset(departments=1, sections_per_department=1, students_per_section=3, subjects_per_department=1)
+        cls.admin = User.objects.create_superuser(username='export-admin', email='export-admin@example.com', password='x', user_type='Admin')
+        cls.student = StudentProfile.objects.select_related('user').first()
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def export(self, query=''):
+        response = self.client.get(f'/api/submissions/export/{query}')
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_csv(self):
+        response = self.export(f'?student={self.student.pk}')
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="submission.csv"')
+        rows = list(csv.DictReader(io.StringIO(b''.join(response.streaming_content).decode())))
+        expected = Submission.objects.filter(student=self.student)
+        self.assertEqual(sorted(row['id'] for row in rows), sorted(str(pk) for pk in expected.values_list('pk', flat=True)))
+        self.assertEqual({row['student__user__email'] for row in rows}, {self.student.user.email})
+
+    def test_ndjson_gzip(self):
+        response = self.export('?type=QUIZ&export_format=ndjson&compress=gzip')
+        self.assertEqual(response['Content-Type'], 'application/gzip')
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="submission.ndjson.gz"')
+        rows = [json.loads(line) for line in gzip.decompress(b''.join(response.streaming_content)).splitlines()]
+        self.assertEqual(len(rows), Submission.objects.filter(type='QUIZ').count())
+        self.assertEqual({row['type'] for row in rows}, {'QUIZ'})
+        self.assertIsNone(rows[0]['assignment_id'])
+
+    def test_rejected(self):
+        self.assertEqual(self.client.get('/api/submissions/export/?export_format=xml').status_code, 400)
+        self.client.force_authenticate(self.student.user)
+        self.assertEqual(self.client.get('/api/submissions/export/').status_code, 403)
@@ -2,7 +2,7 @@
 # urls.py
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import AssignmentViewSet, QuizViewSet, TestViewSet, SubmissionViewSet,SubjectTeacherSectionViewSet
+from .views import AssignmentViewSet, QuizViewSet, TestViewSet, SubmissionViewSet,SubjectTeacherSectionViewSet, GradebookEntryViewSet
 
 router = DefaultRouter()
 router.register(r'assignments', AssignmentViewSet)
@@ -10,6 +10,7 @@ router.register(r'quizzes', QuizViewSet)
 router.register(r'tests', TestViewSet)
 router.register(r'submissions', SubmissionViewSet)
 router.register(r'subject-teacher-sections', SubjectTeacherSectionViewSet)
+router.register(r'gradebook', GradebookEntryViewSet)
 
 urlpatterns = [
     path('', include(router.urls)),
@@ -1,11 +1,23 @@
 
 # views.py
-from rest_framework import viewsets, filters
-from .models import Assignment, Quiz, Test, Submission,SubjectTeacherSection
-from .serializers import AssignmentSerializer, QuizSerializer, TestSerializer, SubmissionSerializer, SubjectTeacherSectionSerializer
+from django.db import transaction
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from rest_framework import viewsets, filters, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from .models import Assignment, Quiz, Test, Submission,SubjectTeacherSection, GradebookEntry
+from .serializers import AssignmentSerializer, QuizSerializer, TestSerializer, SubmissionSerializer, SubjectTeacherSectionSerializer, GradebookEntrySerializer
+from .serializers import ArchivedSubmissionSerializer, BulkGradeItemSerializer
+from .archive import ArchiveFallbackMixin
+from .gradebook import refresh_students
 from django_filters.rest_framework import DjangoFilterBackend
+from core.mixins import ConditionalGetMixin, RelatedPlanMixin
+from core.compiled import FastListMixin
+from core.exports import StreamingExportMixin
+from account.permissions import IsAdminUser, IsTeacher
 
-class AssignmentViewSet(viewsets.ModelViewSet):
+class AssignmentViewSet(ConditionalGetMixin, FastListMixin, RelatedPlanMixin, viewsets.ModelViewSet):
     queryset = Assignment.objects.all()
     serializer_class = AssignmentSerializer
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
@@ -13,7 +25,7 @@ class AssignmentViewSet(viewsets.ModelViewSet):
     search_fields = ['title', 'description']
     ordering_fields = ['due_date', 'created_at']
 
-class QuizViewSet(viewsets.ModelViewSet):
+class QuizViewSet(ConditionalGetMixin, FastListMixin, RelatedPlanMixin, viewsets.ModelViewSet):
     queryset = Quiz.objects.all()
     serializer_class = QuizSerializer
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
@@ -21,7 +33,7 @@ class QuizViewSet(viewsets.ModelViewSet):
     search_fields = ['title']
     ordering_fields = ['created_at', 'total_marks']
 
-class TestViewSet(viewsets.ModelViewSet):
+class TestViewSet(ConditionalGetMixin, FastListMixin, RelatedPlanMixin, viewsets.ModelViewSet):
     queryset = Test.objects.all()
     serializer_class = TestSerializer
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
@@ -29,14 +41,61 @@ class TestViewSet(viewsets.ModelViewSet):
     search_fields = ['title']
     ordering_fields = ['scheduled_date']
 
-class SubmissionViewSet(viewsets.ModelViewSet):
+class SubmissionViewSet(ConditionalGetMixin, StreamingExportMixin, FastListMixin, RelatedPlanMixin, ArchiveFallbackMixin, viewsets.ModelViewSet):
     queryset = Submission.objects.all()
     serializer_class = SubmissionSerializer
+    archive_serializer_class = ArchivedSubmissionSerializer
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ['student', 'type', 'assignment', 'quiz', 'test']
     ordering_fields = ['submitted_at', 'obtained_marks']
+    cursor_ordering = ('-submitted_at', '-id')
+    export_fields = (
+        'id', 'type', 'student_id', 'student__registration_number', 'student__user__email',
+        'assignment_id', 'quiz_id', 'test_id', 'submitted_at', 'is_evaluated', 'obtained_marks', 'file_url',
+    )
+    export_permission_classes = [IsAdminUser]
 
+    @action(detail=False, methods=['post'], url_path='bulk-grade', permission_classes=[IsTeacher | IsAdminUser])
+    def bulk_grade(self, request):
+        items = BulkGradeItemSerializer(data=request.data, many=True)
+        items.is_valid(raise_exception=True)
+        grades = {item['id']: item for item in items.validated_data}
+        if len(grades) != len(items.validated_data):
+            return Response({"detail": "Each submission may only be graded once per request"}, status=status.HTTP_400_BAD_REQUEST)
 
-class SubjectTeacherSectionViewSet(viewsets.ModelViewSet):
+        submissions = list(
+            Submission.objects.filter(pk__in=grades)
+            .annotate(total_marks=Coalesce('quiz__total_marks', 'test__total_marks'))
+            .only('id', 'student_id', 'obtained_marks', 'is_evaluated', 'updated_at')
+        )
+        now = timezone.now()
+        errors = {str(pk): "Submission not found" for pk in grades.keys() - {submission.pk for submission in submissions}}
+        for submission in submissions:
+            grade = grades[submission.pk]
+            marks = grade['obtained_marks']
+            if marks is not None and submission.total_marks is not None and marks > submission.total_marks:
+                errors[str(submission.pk)] = f"obtained_marks cannot exceed total_marks ({submission.total_marks})"
+            submission.obtained_marks = marks
+            submission.is_evaluated = grade['is_evaluated']
+            submission.updated_at = now
+        if errors:
+            return Response({"errors": errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        with transaction.atomic():
+            Submission.objects.bulk_update(submissions, ['obtained_marks', 'is_evaluated', 'updated_at'])
+            refresh_students({submission.student_id for submission in submissions})
+        return Response({"updated": len(submissions)}, status=status.HTTP_200_OK)
+
+
+class SubjectTeacherSectionViewSet(ConditionalGetMixin, FastListMixin, RelatedPlanMixin, viewsets.ModelViewSet):
     queryset = SubjectTeacherSection.objects.all()
     serializer_class = SubjectTeacherSectionSerializer
+
+
+class GradebookEntryViewSet(ConditionalGetMixin, FastListMixin, RelatedPlanMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = GradebookEntry.objects.all()
+    serializer_class = GradebookEntrySerializer
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
+    filterset_fields = ['student', 'subject', 'section']
+    ordering_fields = ['percentage', 'marks_obtained']
+    cursor_ordering = ('student', 'subject', 'id')
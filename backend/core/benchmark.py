@@ -0,0 +1,223 @@
+import statistics
+import time
+from contextlib import contextmanager
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import (
+    override_settings, setup_databases, setup_test_environment, teardown_databases, teardown_test_environment,
+)
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from account.models import StudentProfile, User
+from account.serializers import UserResponseSerializer
+from account.urls import router as account_router
+from assessment.models import Submission
+from assessment.seeding import seed_dataset
+from assessment.serializers import SubmissionSerializer
+from assessment.urls import router as assessment_router
+from department.urls import router as department_router
+
+from .compiled import compile_serializer
+from .mixins import plan_related
+from .renderers import FastJSONRenderer, orjson
+
+ROUTERS = (department_router, account_router, assessment_router)
+EXTRA_ENDPOINTS = ('/api/dashboard/summary/',)
+
+
+@contextmanager
+def throwaway_database():
+    """Run the block against freshly created test databases, destroyed afterwards."""
+    setup_test_environment()
+    old_config = setup_databases(verbosity=0, interactive=False)
+    try:
+        yield
+    finally:
+        teardown_databases(old_config, verbosity=0)
+        teardown_test_environment()
+
+
+def endpoints():
+    """``(name, url)`` for the list and a detail route of every registered viewset, plus the plain views."""
+    for router in ROUTERS:
+        for prefix, viewset, _ in router.registry:
+            yield f'{prefix}-list', f'/api/{prefix}/'
+            obj = viewset.queryset.order_by('pk').first()
+            if obj is not None:
+                yield f'{prefix}-detail', f'/api/{prefix}/{obj.pk}/'
+    for url in EXTRA_ENDPOINTS:
+        yield url.strip('/').replace('/', '-'), url
+
+
+class QueryTimer:
+    """``execute_wrapper`` that counts queries and times them with ``perf_counter`` resolution."""
+
+    def __init__(self):
+        self.queries = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.seconds += time.perf_counter() - started
+            self.queries += 1
+
+
+def measure(client, url, repeat):
+    """
+    Median wall-clock and SQL time over ``repeat`` cold requests, and the query
+    count of the first. Only queries on the request thread are seen, so views
+    that fan out to worker threads report their wall time alone.
+    """
+    walls, sql_times, queries, status = [], [], None, None
+    for _ in range(repeat):
+        # Measure the database path rather than response-cache hits.
+        cache.clear()
+        timer = QueryTimer()
+        with connection.execute_wrapper(timer):
+            started = time.perf_counter()
+            response = client.get(url)
+            if response.streaming:
+                b''.join(response.streaming_content)
+            walls.append((time.perf_counter() - started) * 1000)
+        sql_times.append(timer.seconds * 1000)
+        if queries is None:
+            queries, status = timer.queries, response.status_code
+    return {
+        'status': status,
+        'queries': queries,
+        'sql_ms': round(statistics.median(sql_times), 2),
+        'wall_ms': round(statistics.median(walls), 2),
+    }
+
+
+def run_benchmark(sizes, repeat=5):
+    """
+    Seed a dataset per size (students per section) and measure every endpoint against it.
+
+    The database is flushed before each size, so sizes do not stack; it must be
+    a throwaway test database. Returns ``{size: {endpoint: metrics}}``.
+    """
+    results = {}
+    for size in sizes:
+        call_command('flush', interactive=False, verbosity=0)
+        seed_dataset(departments=2, sections_per_department=3, students_per_section=size, teachers_per_department=5)
+        admin = User.objects.create_superuser(username='benchmark-admin', email='benchmark-admin@example.com', password='x', user_type='Admin')
+        client = APIClient()
+        client.raise_request_exception = False
+        client.force_authenticate(admin)
+        client.force_login(admin)
+        results[str(size)] = {name: measure(client, url, repeat) for name, url in endpoints()}
+    return results
+
+
+def compare(results, baseline, threshold=0.25, noise_ms=5.0):
+    """
+    List regressions against ``baseline``: any increase in query count, and wall
+    time more than ``threshold`` slower once past a ``noise_ms`` floor.
+    """
+    regressions = []
+    for size, measured in results.items():
+        for name, metrics in measured.items():
+            previous = baseline.get(size, {}).get(name)
+            if previous is None:
+                continue
+            if metrics['queries'] > previous['queries']:
+                regressions.append(f"{name} @ {size}: {previous['queries']} -> {metrics['queries']} queries")
+            slower = metrics['wall_ms'] - previous['wall_ms']
+            if slower > noise_ms and metrics['wall_ms'] > previous['wall_ms'] * (1 + threshold):
+                regressions.append(f"{name} @ {size}: {previous['wall_ms']} -> {metrics['wall_ms']} ms")
+    return regressions
+
+
+def list_serializers():
+    """``(basename, serializer_class)`` for the list serializer of every registered viewset."""
+    for router in ROUTERS:
+        for prefix, viewset, _ in router.registry:
+            yield prefix, viewset(action='list', request=None, format_kwarg=None).get_serializer_class()
+
+
+def measure_serializer(serializer_class, rows=200, repeat=5):
+    """
+    Median time to fetch and serialize ``rows`` rows with the DRF serializer and
+    with its compiled form, and whether both render the same JSON.
+    """
+    model = serializer_class.Meta.model
+    select, prefetch = plan_related(serializer_class())
+    queryset = model._default_manager.select_related(*select).prefetch_related(*prefetch).order_by('pk')
+    compiled = compile_serializer(serializer_class)
+    drf_times, fast_times, identical = [], [], None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        expected = serializer_class(list(queryset[:rows]), many=True).data
+        drf_times.append((time.perf_counter() - started) * 1000)
+        if compiled is None:
+            continue
+        started = time.perf_counter()
+        projected = compiled.project(queryset)
+        data = compiled.render(projected[:rows], projected.db)
+        fast_times.append((time.perf_counter() - started) * 1000)
+        identical = JSONRenderer().render(data) == JSONRenderer().render(expected)
+    return {
+        'rows': len(expected),
+        'drf_ms': round(statistics.median(drf_times), 2),
+        'compiled_ms': round(statistics.median(fast_times), 2) if fast_times else None,
+        'identical': identical,
+    }
+
+
+def run_serializer_benchmark(size, rows=200, repeat=5):
+    """Seed one dataset (``size`` students per section) and measure every list serializer against it."""
+    call_command('flush', interactive=False, verbosity=0)
+    seed_dataset(departments=2, sections_per_department=3, students_per_section=size, teachers_per_department=5)
+    return {name: measure_serializer(serializer_class, rows, repeat) for name, serializer_class in list_serializers()}
+
+
+def render_payloads(rows=1000):
+    """
+    Large list payloads as views hand them to the renderer: serializer output,
+    which still carries raw UUID keys, and ``.values()`` rows with UUIDs,
+    datetimes and decimals left to the encoder.
+    """
+    for name, serializer_class in (('submissions', SubmissionSerializer), ('users', UserResponseSerializer)):
+        model = serializer_class.Meta.model
+        select, prefetch = plan_related(serializer_class())
+        queryset = model._default_manager.select_related(*select).prefetch_related(*prefetch).order_by('pk')
+        yield name, serializer_class(list(queryset[:rows]), many=True).data
+    for name, model in (('submissions', Submission), ('users', User), ('student-profiles', StudentProfile)):
+        yield f'{name}-values', list(model._default_manager.order_by('pk').values()[:rows])
+
+
+def _render_time(renderer, data, repeat):
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        content = renderer.render(data)
+        times.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(times), 2), content
+
+
+def measure_renderers(data, repeat=5):
+    """Median render time of ``data`` with DRF's renderer and each backend of ``FastJSONRenderer``."""
+    drf_ms, expected = _render_time(JSONRenderer(), data, repeat)
+    metrics = {'bytes': len(expected), 'drf_ms': drf_ms, 'identical': True}
+    for backend in ('stdlib', 'orjson'):
+        if backend == 'orjson' and orjson is None:
+            metrics['orjson_ms'] = None
+            continue
+        with override_settings(JSON_BACKEND=backend):
+            metrics[f'{backend}_ms'], content = _render_time(FastJSONRenderer(), data, repeat)
+        metrics['identical'] = metrics['identical'] and content == expected
+    return metrics
+
+
+def run_renderer_benchmark(size, rows=1000, repeat=5):
+    """Seed one dataset (``size`` students per section) and measure every renderer on its large payloads."""
+    call_command('flush', interactive=False, verbosity=0)
+    seed_dataset(departments=2, sections_per_department=3, students_per_section=size, teachers_per_department=5)
+    return {name: measure_renderers(data, repeat) for name, data in render_payloads(rows)}
@@ -0,0 +1,70 @@
+import hashlib
+import time
+
+from django.core.cache import cache
+from rest_framework.response import Response
+
+from .db_router import primary_reads
+
+
+def _version_key(model):
+    return f'cache-version:{model._meta.label_lower}'
+
+
+def get_cache_versions(models):
+    keys = [_version_key(model) for model in models]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            # Seed from the clock so an evicted counter never reissues an old version.
+            cache.add(key, int(time.time() * 1000), None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def bump_cache_version(model):
+    """Invalidate every cached response built from ``model``."""
+    key = _version_key(model)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, int(time.time() * 1000), None)
+
+
+class VersionedCacheMixin:
+    """
+    Caches list and retrieve payloads under a key that embeds a version counter
+    per model in ``cache_models`` (the queryset model by default).
+
+    Writes bump the counter from post_save/post_delete, which orphans every
+    cached payload for that model at once instead of deleting keys one by one.
+    Misses are built from the primary, so a lagging replica cannot cache stale
+    rows under the new version.
+    """
+    cache_models = None
+    cache_timeout = 60 * 60
+
+    def get_cache_models(self):
+        return self.cache_models or [self.queryset.model]
+
+    def get_cache_key(self, request):
+        versions = get_cache_versions(self.get_cache_models())
+        url = hashlib.md5(request.build_absolute_uri().encode('utf-8')).hexdigest()
+        return f'view-cache:{self.basename}:{self.action}:{":".join(map(str, versions))}:{url}'
+
+    def _cached_response(self, handler, request, *args, **kwargs):
+        key = self.get_cache_key(request)
+        data = cache.get(key)
+        if data is not None:
+            return Response(data)
+        with primary_reads():
+            response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            cache.set(key, response.data, self.cache_timeout)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self._cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._cached_response(super().retrieve, request, *args, **kwargs)
@@ -0,0 +1,201 @@
+from functools import lru_cache
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.fields import SkipField
+from rest_framework.relations import ManyRelatedField, PrimaryKeyRelatedField, SlugRelatedField, StringRelatedField
+from rest_framework.response import Response
+
+from .serializers import get_field_selection
+
+# DRF fields whose to_representation is a no-op on the value the database driver returns.
+_PASSTHROUGH = {
+    serializers.CharField, serializers.EmailField, serializers.SlugField, serializers.URLField,
+    serializers.IntegerField, serializers.BooleanField, serializers.FloatField,
+}
+# Fields that read the request from their context or render more than one row.
+_UNSUPPORTED = (serializers.FileField, serializers.ListSerializer, ManyRelatedField, serializers.HyperlinkedRelatedField)
+
+COLUMN, NESTED, RELATED, ATTRIBUTE = range(4)
+
+
+class NotCompilable(Exception):
+    pass
+
+
+def _converter(field):
+    if type(field) in _PASSTHROUGH:
+        return None
+    if type(field) is serializers.UUIDField and field.uuid_format == 'hex_verbose':
+        return str
+    return field.to_representation
+
+
+def _model_field(model, name):
+    try:
+        return model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return None
+
+
+class CompiledSerializer:
+    """
+    A read-only ``ModelSerializer`` flattened into a ``.values()`` projection and
+    a row-to-dict function producing the same output as ``serializer.data``.
+
+    Columns are rendered straight from the row, nested serializers on forward
+    relations read the joined columns under their prefix, and ``StringRelatedField``
+    or property sources get a deferred model instance built from the row with
+    ``from_db``, holding only the columns the model lists for them in
+    ``attribute_fields``. Raises ``NotCompilable`` for anything else (undeclared
+    attributes, many-valued or context-dependent fields), and the view falls back
+    to the regular serializer.
+    """
+
+    def __init__(self, serializer):
+        self.columns = {}
+        self._render = self._compile(serializer, '')
+
+    def project(self, queryset, keys=()):
+        """``queryset`` as dict rows carrying the serializer's columns and ``keys``."""
+        columns = dict.fromkeys(keys)
+        columns.update(self.columns)
+        return queryset.prefetch_related(None).values(*columns)
+
+    def render(self, rows, db):
+        render = self._render
+        return [render(row, db) for row in rows]
+
+    def _column(self, lookup):
+        self.columns[lookup] = None
+        return lookup
+
+    def _builder(self, model, prefix, names):
+        """Build a deferred ``model`` instance from the primary key and the ``names`` columns."""
+        wanted = {model._meta.pk.attname, *(model._meta.get_field(name).attname for name in names)}
+        # from_db() takes a partial row in concrete field order.
+        attnames = [field.attname for field in model._meta.concrete_fields if field.attname in wanted]
+        keys = [self._column(prefix + attname) for attname in attnames]
+
+        def build(row, db):
+            return model.from_db(db, attnames, [row[key] for key in keys])
+        return build
+
+    def _attribute_builder(self, model, prefix, attributes):
+        """A ``_builder`` for the columns ``model.attribute_fields`` declares ``attributes`` to read."""
+        declared = getattr(model, 'attribute_fields', {})
+        names = []
+        for attribute in attributes:
+            if attribute not in declared:
+                raise NotCompilable(f'{model.__name__}.{attribute}')
+            names.extend(declared[attribute])
+        return self._builder(model, prefix, names)
+
+    def _compile(self, serializer, prefix):
+        model = serializer.Meta.model
+        steps, attributes = [], []
+        for field in serializer.fields.values():
+            if field.write_only:
+                continue
+            if field.source == '*' or isinstance(field, _UNSUPPORTED):
+                raise NotCompilable(f'{type(serializer).__name__}.{field.field_name}')
+            attr = field.source_attrs[0]
+            model_field = _model_field(model, attr) if len(field.source_attrs) == 1 else None
+
+            if model_field is None:
+                if isinstance(field, (serializers.RelatedField, serializers.BaseSerializer)):
+                    raise NotCompilable(f'{type(serializer).__name__}.{field.field_name}')
+                attributes.append(attr)
+                steps.append((ATTRIBUTE, field.field_name, None, field))
+            elif not model_field.is_relation:
+                steps.append((COLUMN, field.field_name, self._column(prefix + attr), _converter(field)))
+            elif model_field.many_to_one or (model_field.one_to_one and model_field.concrete):
+                key = self._column(prefix + attr)
+                if isinstance(field, PrimaryKeyRelatedField) and field.pk_field is None:
+                    steps.append((COLUMN, field.field_name, key, None))
+                elif isinstance(field, serializers.ModelSerializer):
+                    steps.append((NESTED, field.field_name, key, self._compile(field, f'{prefix}{attr}__')))
+                elif isinstance(field, StringRelatedField):
+                    related = self._attribute_builder(model_field.related_model, f'{prefix}{attr}__', ['__str__'])
+                    steps.append((RELATED, field.field_name, key, (related, field.to_representation)))
+                elif isinstance(field, SlugRelatedField):
+                    related = self._builder(model_field.related_model, f'{prefix}{attr}__', [field.slug_field])
+                    steps.append((RELATED, field.field_name, key, (related, field.to_representation)))
+                else:
+                    raise NotCompilable(f'{type(serializer).__name__}.{field.field_name}')
+            else:
+                raise NotCompilable(f'{type(serializer).__name__}.{field.field_name}')
+
+        build = self._attribute_builder(model, prefix, attributes) if attributes else None
+
+        def render(row, db):
+            instance = build(row, db) if build is not None else None
+            data = {}
+            for kind, name, key, extra in steps:
+                if kind == COLUMN:
+                    value = row[key]
+                    data[name] = value if value is None or extra is None else extra(value)
+                elif kind == NESTED:
+                    data[name] = None if row[key] is None else extra(row, db)
+                elif kind == RELATED:
+                    data[name] = None if row[key] is None else extra[1](extra[0](row, db))
+                else:
+                    try:
+                        value = extra.get_attribute(instance)
+                    except SkipField:
+                        continue
+                    data[name] = None if value is None else extra.to_representation(value)
+            return data
+        return render
+
+
+@lru_cache(maxsize=512)
+def compile_serializer(serializer_class, selection=None):
+    """
+    The ``CompiledSerializer`` for ``serializer_class`` narrowed by a ``FieldSelection``,
+    or ``None`` if it cannot be compiled.
+    """
+    context = {} if selection is None else {'field_selection': selection}
+    try:
+        return CompiledSerializer(serializer_class(context=context))
+    except NotCompilable:
+        return None
+
+
+class FastListMixin:
+    """
+    Serves list actions through the compiled form of the list serializer, skipping
+    model instances and DRF's per-field machinery. The paginator's ordering keys
+    are projected as well so keyset cursors can be built from the dict rows.
+
+    Serializers that cannot be compiled fall back to the regular path.
+    """
+    fast_list = True
+
+    def get_compiled_serializer(self):
+        if not self.fast_list:
+            return None
+        return compile_serializer(self.get_serializer_class(), get_field_selection(self))
+
+    def list(self, request, *args, **kwargs):
+        return self.list_response(self.filter_queryset(self.get_queryset()))
+
+    def list_response(self, queryset):
+        compiled = self.get_compiled_serializer()
+        if compiled is None:
+            page = self.paginate_queryset(queryset)
+            if page is not None:
+                return self.get_paginated_response(self.get_serializer(page, many=True).data)
+            return Response(self.get_serializer(queryset, many=True).data)
+
+        rows = compiled.project(queryset, self.get_ordering_columns(queryset))
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(compiled.render(page, rows.db))
+        return Response(compiled.render(rows, rows.db))
+
+    def get_ordering_columns(self, queryset):
+        paginator = self.paginator
+        if paginator is None or not hasattr(paginator, 'get_ordering'):
+            return ()
+        return [key.lstrip('-') for key in paginator.get_ordering(self.request, queryset, self)]
@@ -0,0 +1,63 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+
+_use_replicas = ContextVar('use_replicas', default=False)
+
+
+@contextmanager
+def replica_reads():
+    """Let reads inside the block go to a replica until the first write pins them back to the primary."""
+    token = _use_replicas.set(True)
+    try:
+        yield
+    finally:
+        _use_replicas.reset(token)
+
+
+def pin_to_primary():
+    _use_replicas.set(False)
+
+
+@contextmanager
+def primary_reads():
+    """
+    Read from the primary inside the block. For reads that fill a cache: a lagging
+    replica would store pre-write rows under the version a write just bumped,
+    where they would stay for the cache's whole timeout.
+    """
+    token = _use_replicas.set(False)
+    try:
+        yield
+    finally:
+        _use_replicas.reset(token)
+
+
+class PrimaryReplicaRouter:
+    """
+    Sends reads to a random replica while replica reads are enabled (safe requests,
+    see ``ReplicaRoutingMiddleware``) and everything else to ``default``.
+
+    The first write routed in a request pins the rest of it to the primary, so a
+    request always reads its own writes; ``primary_reads`` does the same for one
+    block, around reads that fill a cache. Management commands and shells never
+    enable replica reads and always use the primary.
+    """
+
+    def db_for_read(self, model, **hints):
+        if _use_replicas.get() and settings.REPLICA_DATABASES:
+            return random.choice(settings.REPLICA_DATABASES)
+        return 'default'
+
+    def db_for_write(self, model, **hints):
+        pin_to_primary()
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == 'default'
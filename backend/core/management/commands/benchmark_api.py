@@ -0,0 +1,43 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.benchmark import compare, run_benchmark, throwaway_database
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a throwaway test database at several sizes and record query count, SQL time and "
+        "wall-clock latency for every API endpoint; fail on regressions against a baseline."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default='10,50', help="Comma separated students per section to benchmark at.")
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--output', help="Write the results as JSON to this path.")
+        parser.add_argument('--baseline', help="Compare against a JSON file written by --output.")
+        parser.add_argument('--threshold', type=float, default=0.25, help="Allowed relative slowdown in wall time.")
+        parser.add_argument('--noise-ms', type=float, default=5.0, help="Slowdowns below this many milliseconds are ignored.")
+
+    def handle(self, *args, **options):
+        sizes = [int(size) for size in options['sizes'].split(',')]
+        with throwaway_database():
+            results = run_benchmark(sizes, repeat=options['repeat'])
+
+        for size, measured in results.items():
+            self.stdout.write(f"students per section: {size}")
+            for name, metrics in measured.items():
+                self.stdout.write(
+                    f"  {name:<40} {metrics['status']:>3} {metrics['queries']:>4} queries "
+                    f"{metrics['sql_ms']:>9.2f} ms sql {metrics['wall_ms']:>9.2f} ms wall"
+                )
+        if options['output']:
+            with open(options['output'], 'w') as output:
+                json.dump(results, output, indent=2, sort_keys=True)
+
+        if options['baseline']:
+            with open(options['baseline']) as baseline:
+                regressions = compare(results, json.load(baseline), options['threshold'], options['noise_ms'])
+            if regressions:
+                raise CommandError("Performance regressions:\n" + "\n".join(regressions))
+            self.stdout.write(self.style.SUCCESS("No regressions against the baseline."))
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.benchmark import run_renderer_benchmark, throwaway_database
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a throwaway test database and time DRF's JSONRenderer against each backend of "
+        "core.renderers.FastJSONRenderer on large Submission, User and StudentProfile payloads."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--size', type=int, default=50, help="Students per section to seed.")
+        parser.add_argument('--rows', type=int, default=1000, help="Rows per payload.")
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        with throwaway_database():
+            results = run_renderer_benchmark(options['size'], rows=options['rows'], repeat=options['repeat'])
+
+        mismatched = []
+        for name, metrics in results.items():
+            orjson_ms = 'n/a' if metrics['orjson_ms'] is None else f"{metrics['orjson_ms']:.2f} ms"
+            self.stdout.write(
+                f"  {name:<24} {metrics['bytes']:>9} bytes {metrics['drf_ms']:>9.2f} ms drf "
+                f"{metrics['stdlib_ms']:>9.2f} ms stdlib {orjson_ms:>11} orjson"
+            )
+            if not metrics['identical']:
+                mismatched.append(name)
+        if mismatched:
+            raise CommandError("FastJSONRenderer output differs from JSONRenderer for: " + ", ".join(mismatched))
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.benchmark import run_serializer_benchmark, throwaway_database
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a throwaway test database and time every list serializer against its compiled "
+        "form on the same rows; fail if the two render different JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--size', type=int, default=50, help="Students per section to seed.")
+        parser.add_argument('--rows', type=int, default=200, help="Rows serialized per measurement.")
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        with throwaway_database():
+            results = run_serializer_benchmark(options['size'], rows=options['rows'], repeat=options['repeat'])
+
+        mismatched = []
+        for name, metrics in results.items():
+            if metrics['compiled_ms'] is None:
+                self.stdout.write(f"  {name:<28} {metrics['rows']:>4} rows {metrics['drf_ms']:>9.2f} ms drf    not compilable")
+                continue
+            speedup = metrics['drf_ms'] / metrics['compiled_ms'] if metrics['compiled_ms'] else float('inf')
+            self.stdout.write(
+                f"  {name:<28} {metrics['rows']:>4} rows {metrics['drf_ms']:>9.2f} ms drf "
+                f"{metrics['compiled_ms']:>9.2f} ms compiled {speedup:>6.1f}x"
+            )
+            if not metrics['identical']:
+                mismatched.append(name)
+        if mismatched:
+            raise CommandError("Compiled output differs from the serializer for: " + ", ".join(mismatched))
@@ -0,0 +1,245 @@
+import hashlib
+from functools import lru_cache
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Count, Max, Prefetch
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework import serializers
+from rest_framework.relations import ManyRelatedField, RelatedField
+
+from .cache import get_cache_versions
+from .compiled import compile_serializer
+from .serializers import get_field_selection
+
+
+def _relation_path(model, attrs):
+    """Walk ``attrs`` through ``model`` and return the relational prefix as (lookup, many, related_model)."""
+    path, many = [], False
+    for attr in attrs:
+        try:
+            model_field = model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            break
+        if not model_field.is_relation:
+            break
+        path.append(attr)
+        many = many or model_field.many_to_many or model_field.one_to_many
+        model = model_field.related_model
+    return '__'.join(path), many, model
+
+
+def _needs_object(field):
+    # PrimaryKeyRelatedField and friends read the raw ``<name>_id`` column and never touch the row.
+    if isinstance(field, ManyRelatedField):
+        return not field.child_relation.use_pk_only_optimization()
+    if isinstance(field, RelatedField):
+        return not field.use_pk_only_optimization()
+    return isinstance(field, serializers.BaseSerializer)
+
+
+def plan_related(serializer):
+    """Return the ``(select_related, prefetch_related)`` lookups needed to render ``serializer``."""
+    select, prefetch = [], []
+    model = serializer.Meta.model
+    for field in serializer.fields.values():
+        if field.write_only or field.source == '*':
+            continue
+        lookup, many, related_model = _relation_path(model, field.source_attrs)
+        if not lookup:
+            continue
+        relation_is_leaf = lookup.count('__') + 1 == len(field.source_attrs)
+        if relation_is_leaf and not _needs_object(field) and not many:
+            # The relation itself is the field, rendered by pk only.
+            if '__' not in lookup:
+                continue
+            lookup = lookup.rsplit('__', 1)[0]
+
+        nested = field.child if isinstance(field, serializers.ListSerializer) else field
+        if not isinstance(nested, serializers.ModelSerializer) or not relation_is_leaf:
+            (prefetch if many else select).append(lookup)
+            continue
+
+        child_select, child_prefetch = plan_related(nested)
+        if many:
+            queryset = related_model._default_manager.select_related(*child_select)
+            prefetch.append(Prefetch(lookup, queryset=queryset.prefetch_related(*child_prefetch)))
+        else:
+            select.append(lookup)
+            select.extend(f'{lookup}__{path}' for path in child_select)
+            prefetch.extend(_prefixed(lookup, path) for path in child_prefetch)
+    return select, prefetch
+
+
+def _prefixed(prefix, lookup):
+    if isinstance(lookup, Prefetch):
+        return Prefetch(f'{prefix}__{lookup.prefetch_through}', queryset=lookup.queryset)
+    return f'{prefix}__{lookup}'
+
+
+@lru_cache(maxsize=512)
+def related_plan(serializer_class, selection=None):
+    """``plan_related`` for ``serializer_class`` narrowed by a ``FieldSelection``, cached."""
+    context = {} if selection is None else {'field_selection': selection}
+    return plan_related(serializer_class(context=context))
+
+
+class RelatedPlanMixin:
+    """
+    Applies the select_related/prefetch_related plan derived from the serializer
+    of the current action, so nested serializers never fetch their parents row by row.
+
+    With ``?fields=``/``?expand=`` the plan follows the narrowed serializer, and
+    the rows are loaded with ``.only()`` the columns it renders.
+    """
+
+    def get_related_plan(self):
+        return related_plan(self.get_serializer_class(), get_field_selection(self))
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['field_selection'] = get_field_selection(self)
+        return context
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        select, prefetch = self.get_related_plan()
+        selection = get_field_selection(self)
+        compiled = compile_serializer(self.get_serializer_class(), selection) if selection is not None else None
+        if compiled is not None:
+            # The narrowed plan replaces whatever joins the base queryset declares.
+            queryset = queryset.select_related(None).only(*compiled.columns, *self._ordering_fields(queryset))
+        if select:
+            queryset = queryset.select_related(*select)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        return queryset
+
+    def _ordering_fields(self, queryset):
+        # Keyset cursors read the ordering columns off the boundary rows.
+        paginator = self.paginator
+        if paginator is None or not hasattr(paginator, 'get_ordering'):
+            return ()
+        keys = (key.lstrip('-') for key in paginator.get_ordering(self.request, queryset, self))
+        return [key for key in keys if _has_field(queryset.model, key)]
+
+
+def _timestamp_lookups(model, select):
+    """``updated_at`` lookups for the model and every select_related parent that has one."""
+    lookups = []
+    if _has_field(model, 'updated_at'):
+        lookups.append('updated_at')
+    for path in select:
+        related_model = _relation_path(model, path.split('__'))[2]
+        if _has_field(related_model, 'updated_at'):
+            lookups.append(f'{path}__updated_at')
+    return lookups
+
+
+def _has_field(model, name):
+    try:
+        model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return False
+    return True
+
+
+class ConditionalGetMixin:
+    """
+    Answers ``If-None-Match``/``If-Modified-Since`` on list and retrieve with a 304
+    before anything is paginated or serialized.
+
+    Views with a ``VersionedCacheMixin`` derive their ETag from the cache version
+    counters, so validating costs no query. Otherwise the validators come from the
+    newest ``updated_at`` of the rows and of the parents the serializer renders,
+    plus the row count on lists so deletes change them too. A plain retrieve reads
+    them off the fetched row; conditional requests get them from one aggregate
+    over the filtered queryset. Plain list requests skip the aggregate and send no
+    validator: a client revalidates with ``If-Modified-Since`` first and gets the
+    ETag with that answer.
+    """
+
+    def _etag(self, state):
+        request = self.request
+        state = repr((request.user.pk, request.accepted_renderer.format, request.get_full_path(), state))
+        return f'W/"{hashlib.md5(state.encode("utf-8")).hexdigest()}"'
+
+    def _timestamp_lookups(self, queryset):
+        select = self.get_related_plan()[0] if hasattr(self, 'get_related_plan') else []
+        return _timestamp_lookups(queryset.model, select)
+
+    def _detail_validators(self, values):
+        if not values or values[0] is None:
+            return None
+        last_modified = int(max(value for value in values if value is not None).timestamp())
+        return self._etag(values), last_modified
+
+    def _list_validators(self, values, count):
+        present = [value for value in values if value is not None]
+        last_modified = int(max(present).timestamp()) if present else None
+        return self._etag((values, count)), last_modified
+
+    def is_conditional(self):
+        headers = self.request.headers
+        return 'If-None-Match' in headers or 'If-Modified-Since' in headers
+
+    def check_not_modified(self, queryset, detail=False):
+        """Return a 304 response if the client's copy is current, else remember the validators for the response."""
+        self._validators = None
+        if hasattr(self, 'get_cache_models'):
+            self._validators = self._etag(get_cache_versions(self.get_cache_models())), None
+        elif self.is_conditional():
+            lookups = self._timestamp_lookups(queryset)
+            if not lookups:
+                return None
+            aggregates = {f'v{i}': Max(lookup) for i, lookup in enumerate(lookups)}
+            if not detail:
+                aggregates['count'] = Count('pk')
+            row = queryset.order_by().aggregate(**aggregates)
+            values = [row[f'v{i}'] for i in range(len(lookups))]
+            self._validators = self._detail_validators(values) if detail else self._list_validators(values, row['count'])
+        if self._validators is None:
+            return None
+        etag, last_modified = self._validators
+        return get_conditional_response(self.request, etag=etag, last_modified=last_modified)
+
+    def get_object(self):
+        instance = super().get_object()
+        if self.action == 'retrieve' and getattr(self, '_validators', None) is None:
+            # The same validators the aggregate would give, read off the fetched row.
+            values = []
+            for lookup in self._timestamp_lookups(self.get_queryset()):
+                value = instance
+                for attr in lookup.split('__'):
+                    value = getattr(value, attr, None) if value is not None else None
+                values.append(value)
+            self._validators = self._detail_validators(values)
+        return instance
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        validators = getattr(self, '_validators', None)
+        if validators and response.status_code in (200, 304):
+            etag, last_modified = validators
+            response.headers.setdefault('ETag', etag)
+            if last_modified is not None:
+                response.headers.setdefault('Last-Modified', http_date(last_modified))
+        return response
+
+    def list(self, request, *args, **kwargs):
+        not_modified = self.check_not_modified(self.filter_queryset(self.get_queryset()))
+        if not_modified is not None:
+            return not_modified
+        return super().list(request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(self.get_queryset())
+        try:
+            not_modified = self.check_not_modified(queryset.filter(**{self.lookup_field: kwargs[lookup_url_kwarg]}), detail=True)
+        except (TypeError, ValueError, ValidationError):
+            # A malformed lookup value; let get_object() turn it into a 404.
+            not_modified = None
+        if not_modified is not None:
+            return not_modified
+        return super().retrieve(request, *args, **kwargs)
@@ -0,0 +1,105 @@
+import logging
+import os
+import re
+import traceback
+from collections import Counter
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from . import middleware, profiling
+from .profiling import collect_queries
+
+logger = logging.getLogger(__name__)
+
+_PLACEHOLDER_LIST = re.compile(r'\((?:\s*%s\s*,)+\s*%s\s*\)')
+# Middleware frames sit on every query's stack; they are never the call site.
+_MIDDLEWARE_FILES = {os.path.abspath(module.__file__) for module in (middleware, profiling)} | {os.path.abspath(__file__)}
+
+
+class NPlusOneError(Exception):
+    pass
+
+
+def sql_template(sql):
+    """Collapse ``IN (%s, %s, ...)`` so batches of different sizes share a template."""
+    return _PLACEHOLDER_LIST.sub('(...)', sql)
+
+
+def _call_site():
+    """
+    The innermost frame outside the ORM: the ``__str__`` or serializer field doing
+    the lookup, or the admin template tag rendering the column.
+    """
+    orm = f'django{os.sep}db{os.sep}'
+    for frame in reversed(traceback.extract_stack()):
+        if orm not in frame.filename and frame.filename not in _MIDDLEWARE_FILES:
+            return f'{frame.filename}:{frame.lineno} in {frame.name}'
+    return 'unknown'
+
+
+class QueryTemplateCounter:
+    """Query collector counting SELECT templates, remembering where each first crossed the threshold."""
+
+    def __init__(self, threshold):
+        self.threshold = threshold
+        self.counts = Counter()
+        self.call_sites = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        if sql.lstrip()[:6].upper() == 'SELECT':
+            template = sql_template(sql)
+            self.counts[template] += 1
+            if self.counts[template] == self.threshold + 1:
+                self.call_sites[template] = _call_site()
+        return execute(sql, params, many, context)
+
+    def repeated(self):
+        return [(template, self.counts[template], call_site) for template, call_site in self.call_sites.items()]
+
+
+class NPlusOneMiddleware:
+    """
+    Flags SELECT templates that run more than ``NPLUSONE_THRESHOLD`` times in one
+    request, the signature of a lookup per row. ``NPLUSONE_MODE`` is ``log``,
+    ``raise`` (for tests and CI) or ``off``.
+
+    Sync and async capable; queries reach it through ``collect_queries``.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        mode = settings.NPLUSONE_MODE
+        if mode == 'off':
+            return self.get_response(request)
+        counter = QueryTemplateCounter(settings.NPLUSONE_THRESHOLD)
+        with collect_queries(counter):
+            response = self.get_response(request)
+        return self._report(request, mode, counter, response)
+
+    async def __acall__(self, request):
+        mode = settings.NPLUSONE_MODE
+        if mode == 'off':
+            return await self.get_response(request)
+        counter = QueryTemplateCounter(settings.NPLUSONE_THRESHOLD)
+        with collect_queries(counter):
+            response = await self.get_response(request)
+        return self._report(request, mode, counter, response)
+
+    def _report(self, request, mode, counter, response):
+        repeated = counter.repeated()
+        if repeated:
+            report = '\n'.join(f'  {count}x at {call_site}: {template}' for template, count, call_site in repeated)
+            message = f'Repeated queries in {request.method} {request.path}:\n{report}'
+            if mode == 'raise':
+                raise NPlusOneError(message)
+            logger.warning(message)
+        return response
@@ -0,0 +1,163 @@
+import binascii
+import datetime
+import json
+import operator
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections.abc import Mapping
+from functools import reduce
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Cursor pagination that seeks on the full ordering key instead of an offset.
+
+    The cursor carries the values of every ordering column of the boundary row,
+    and the next page is fetched with ``(a, b, id) > (x, y, z)`` style predicates,
+    so deep pages cost the same as the first one as long as the ordering is indexed.
+    The primary key is always appended to the ordering to keep it unique.
+
+    Views may declare ``cursor_ordering`` to pick their key; an ``OrderingFilter``
+    on the view still takes precedence when the client asks for an ordering.
+    """
+    ordering = ('-created_at', '-id')
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.model = queryset.model
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+        reverse = self.cursor is not None and self.cursor[1]
+
+        queryset = queryset.order_by(*(self._order_by(key, reverse) for key in self.ordering))
+        if self.cursor is not None:
+            queryset = queryset.filter(self._seek(self.cursor[0], reverse))
+
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        self.page = results[:self.page_size]
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, self.cursor is not None
+        return self.page
+
+    def get_ordering(self, request, queryset, view):
+        ordering = getattr(view, 'cursor_ordering', self.ordering)
+        for backend in getattr(view, 'filter_backends', ()):
+            if hasattr(backend, 'get_ordering'):
+                ordering = backend().get_ordering(request, queryset, view) or ordering
+                break
+        if isinstance(ordering, str):
+            ordering = (ordering,)
+        ordering = tuple(ordering)
+
+        pk_name = queryset.model._meta.pk.name
+        if not any(key.lstrip('-') in (pk_name, 'pk') for key in ordering):
+            ordering += ('-' + pk_name if ordering[-1].startswith('-') else pk_name,)
+        return ordering
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor((self._position(self.page[-1]), False))
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor((self._position(self.page[0]), True))
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+        try:
+            payload = json.loads(urlsafe_b64decode(encoded.encode('ascii')))
+            values = payload['p']
+            if len(values) != len(self.ordering):
+                raise ValueError
+            position = [self._to_python(key, value) for key, value in zip(self.ordering, values)]
+            return position, bool(payload.get('r'))
+        except (TypeError, ValueError, KeyError, binascii.Error, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, cursor):
+        position, reverse = cursor
+        payload = json.dumps({'p': [_encode(value) for value in position], 'r': int(reverse)}, separators=(',', ':'))
+        encoded = urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def _field(self, key):
+        try:
+            return self.model._meta.get_field(key.lstrip('-'))
+        except FieldDoesNotExist:
+            # Annotations are ordered on as-is.
+            return None
+
+    def _to_python(self, key, value):
+        field = self._field(key)
+        if value is None or field is None:
+            return value
+        return field.to_python(value)
+
+    def _position(self, row):
+        position = []
+        for key in self.ordering:
+            name = key.lstrip('-')
+            if isinstance(row, Mapping):
+                position.append(row[name])
+            else:
+                field = self._field(key)
+                position.append(getattr(row, field.attname if field is not None else name))
+        return position
+
+    def _order_by(self, key, reverse):
+        name, descending = key.lstrip('-'), key.startswith('-')
+        nulls = {}
+        field = self._field(key)
+        if field is not None and field.null:
+            # NULLs sort last in the forward direction on every backend, so the seek predicates below hold.
+            nulls = {'nulls_first': True} if reverse else {'nulls_last': True}
+        if descending != reverse:
+            return F(name).desc(**nulls)
+        return F(name).asc(**nulls)
+
+    def _seek(self, position, reverse):
+        """Rows strictly after ``position`` in the traversal order."""
+        branches, equal = [], Q()
+        for key, value in zip(self.ordering, position):
+            name, descending = key.lstrip('-'), key.startswith('-')
+            field = self._field(key)
+            if reverse:
+                if value is None:
+                    branches.append(equal & Q(**{f'{name}__isnull': False}))
+                else:
+                    branches.append(equal & Q(**{f'{name}__gt' if descending else f'{name}__lt': value}))
+            elif value is not None:
+                beyond = Q(**{f'{name}__lt' if descending else f'{name}__gt': value})
+                if field is not None and field.null:
+                    beyond |= Q(**{f'{name}__isnull': True})
+                branches.append(equal & beyond)
+            equal &= Q(**{f'{name}__isnull': True}) if value is None else Q(**{name: value})
+        return reduce(operator.or_, branches, Q(pk__in=[]))
+
+
+def _encode(value):
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    return str(value)
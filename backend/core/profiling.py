@@ -0,0 +1,205 @@
+import json
+import logging
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
+from time import perf_counter
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.signals import request_started
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+logger = logging.getLogger(__name__)
+
+
+class RequestProfile:
+    """
+    Phase timings for one request, fed by ``collect_queries``. SQL text is only
+    kept when the request is sampled.
+    """
+
+    def __init__(self, sample=False):
+        self.sample = sample
+        self.started = perf_counter()
+        self.finished = None
+        self.queries = 0
+        self.db_time = 0.0
+        self.statements = []
+        self._view = None
+        self._render = None
+        self.view_time = None
+        self.render_time = None
+
+    def __call__(self, execute, sql, params, many, context):
+        started = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = perf_counter() - started
+            self.queries += 1
+            self.db_time += elapsed
+            if self.sample:
+                self.statements.append((elapsed, sql))
+
+    def enter_view(self):
+        self._view = (perf_counter(), self.db_time)
+
+    def leave_view(self):
+        if self._view is not None and self.view_time is None:
+            started, db_time = self._view
+            # DRF serializes inside the view; SQL issued meanwhile is reported under db.
+            self.view_time = (perf_counter() - started) - (self.db_time - db_time)
+
+    def enter_render(self):
+        self.leave_view()
+        self._render = perf_counter()
+
+    def leave_render(self):
+        if self._render is not None:
+            self.render_time = perf_counter() - self._render
+
+    def finish(self):
+        self.leave_view()
+        self.finished = perf_counter()
+
+    def server_timing(self):
+        metrics = [f'db;dur={self.db_time * 1000:.1f};desc="{self.queries} queries"']
+        if self.view_time is not None:
+            metrics.append(f'view;dur={self.view_time * 1000:.1f};desc="view and serializer"')
+        if self.render_time is not None:
+            metrics.append(f'render;dur={self.render_time * 1000:.1f}')
+        metrics.append(f'total;dur={(self.finished - self.started) * 1000:.1f}')
+        return ', '.join(metrics)
+
+    def as_log(self, request, response):
+        slowest = sorted(self.statements, key=lambda statement: statement[0], reverse=True)
+        return {
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            'total_ms': round((self.finished - self.started) * 1000, 2),
+            'db_ms': round(self.db_time * 1000, 2),
+            'queries': self.queries,
+            'view_ms': None if self.view_time is None else round(self.view_time * 1000, 2),
+            'render_ms': None if self.render_time is None else round(self.render_time * 1000, 2),
+            'slowest_sql': [
+                {'ms': round(elapsed * 1000, 2), 'sql': sql}
+                for elapsed, sql in slowest[:settings.PROFILING_SLOWEST_QUERIES]
+            ],
+        }
+
+
+_collectors = ContextVar('query_collectors', default=())
+
+
+def _run_collectors(execute, sql, params, many, context):
+    for collector in reversed(_collectors.get()):
+        execute = partial(collector, execute)
+    return execute(sql, params, many, context)
+
+
+def _install(connection):
+    # First in line, so execute_wrapper() blocks that are open meanwhile still pop their own wrapper.
+    if _run_collectors not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, _run_collectors)
+
+
+@receiver(connection_created)
+def install_on_connect(sender, connection, **kwargs):
+    _install(connection)
+
+
+@receiver(request_started)
+def install_on_request(sender, **kwargs):
+    # Sent on the thread that runs sync views, under ASGI as well.
+    for alias in connections:
+        _install(connections[alias])
+
+
+@contextmanager
+def collect_queries(collector):
+    """
+    Pass every query run in the current context through ``collector``, an
+    ``execute_wrapper`` callable.
+
+    Database connections belong to one thread, so a plain ``execute_wrapper``
+    set up in an async middleware never sees the queries of sync views, which
+    run on another thread. The collectors live in a context variable instead,
+    which ``sync_to_async`` copies to that thread, and to the dashboard's
+    ``thread_sensitive=False`` workers too; their queries overlap, so their
+    times add up to more than the wall clock.
+    """
+    for alias in connections:
+        _install(connections[alias])
+    token = _collectors.set(_collectors.get() + (collector,))
+    try:
+        yield
+    finally:
+        _collectors.reset(token)
+
+
+class ProfilingMiddleware:
+    """
+    Adds a ``Server-Timing`` header (db, view, render and total) to every response
+    and logs ``PROFILING_SAMPLE_RATE`` of requests as JSON with their slowest SQL;
+    the rate is 0, so nothing is logged, unless the environment sets it.
+
+    Place it first in ``MIDDLEWARE`` so the total covers the whole stack. It is
+    sync and async capable, so it keeps an ASGI stack async.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+            # Async hooks, so Django does not adapt them through a thread per request.
+            self.process_view = self._aprocess_view
+            self.process_template_response = self._aprocess_template_response
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        profile = self._start(request)
+        with collect_queries(profile):
+            response = self.get_response(request)
+        return self._finish(request, profile, response)
+
+    async def __acall__(self, request):
+        profile = self._start(request)
+        with collect_queries(profile):
+            response = await self.get_response(request)
+        return self._finish(request, profile, response)
+
+    def _start(self, request):
+        rate = settings.PROFILING_SAMPLE_RATE
+        profile = RequestProfile(sample=rate >= 1 or (rate > 0 and random.random() < rate))
+        request._profile = profile
+        return profile
+
+    def _finish(self, request, profile, response):
+        profile.finish()
+        response.headers['Server-Timing'] = profile.server_timing()
+        if profile.sample:
+            logger.info(json.dumps(profile.as_log(request, response)))
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request._profile.enter_view()
+
+    def process_template_response(self, request, response):
+        # Runs last among template response hooks, right before the response is rendered.
+        request._profile.enter_render()
+        response.add_post_render_callback(lambda rendered: request._profile.leave_render())
+        return response
+
+    async def _aprocess_view(self, request, view_func, view_args, view_kwargs):
+        return ProfilingMiddleware.process_view(self, request, view_func, view_args, view_kwargs)
+
+    async def _aprocess_template_response(self, request, response):
+        return ProfilingMiddleware.process_template_response(self, request, response)
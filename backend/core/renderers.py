@@ -0,0 +1,116 @@
+import datetime
+import decimal
+import io
+import re
+import uuid
+
+from django.conf import settings
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils import encoders
+from rest_framework.compat import SHORT_SEPARATORS
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _datetime(value):
+    representation = value.isoformat()
+    if representation.endswith('+00:00'):
+        representation = representation[:-6] + 'Z'
+    return representation
+
+
+# Exact-type dispatch for the values DRF hands the encoder most often: raw UUID
+# primary keys, model timestamps and decimals. Anything else takes DRF's isinstance chain.
+_ENCODERS = {
+    uuid.UUID: str,
+    datetime.datetime: _datetime,
+    datetime.date: datetime.date.isoformat,
+    decimal.Decimal: float,
+    datetime.timedelta: lambda value: str(value.total_seconds()),
+}
+_fallback = encoders.JSONEncoder()
+# orjson reads integers wider than 64 bits as floats; bodies that may hold one take the stdlib path.
+_LONG_NUMBER = re.compile(rb'\d{19}')
+
+
+def encode_default(value):
+    encode = _ENCODERS.get(type(value))
+    if encode is not None:
+        return encode(value)
+    return _fallback.default(value)
+
+
+class DispatchJSONEncoder(encoders.JSONEncoder):
+    def default(self, obj):
+        return encode_default(obj)
+
+
+def json_backend():
+    """``orjson`` when it is installed and ``JSON_BACKEND`` allows it, else ``stdlib``."""
+    if orjson is not None and settings.JSON_BACKEND in ('auto', 'orjson'):
+        return 'orjson'
+    return 'stdlib'
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    ``JSONRenderer`` producing the same bytes through a faster path: ``orjson`` when
+    available, else a reused stdlib encoder whose ``default`` dispatches on the exact
+    type. Indented output (the browsable API) and anything orjson rejects, such as
+    integers beyond 64 bits, go through the regular renderer.
+    """
+    encoder_class = DispatchJSONEncoder
+
+    def __init__(self):
+        self._encoder = self.encoder_class(
+            ensure_ascii=self.ensure_ascii, allow_nan=not self.strict, separators=SHORT_SEPARATORS,
+        )
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if not self.compact or self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if json_backend() == 'orjson' and not self.ensure_ascii and self.strict:
+            try:
+                ret = orjson.dumps(
+                    data, default=encode_default,
+                    option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+                )
+            except orjson.JSONEncodeError:
+                pass
+            else:
+                if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+                    ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+                return ret
+
+        ret = self._encoder.encode(data)
+        # Escape \u2028 and \u2029 like JSONRenderer, keeping the output a strict JavaScript subset.
+        ret = ret.replace('\u2028', '\\u2028').replace('\u2029', '\\u2029')
+        return ret.encode()
+
+
+class FastJSONParser(JSONParser):
+    """
+    ``JSONParser`` decoding UTF-8 bodies with ``orjson`` when available. Bodies it
+    rejects or might read differently are parsed by ``JSONParser`` instead.
+    """
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        if json_backend() != 'orjson' or not self.strict or encoding.lower().replace('_', '-') != 'utf-8':
+            return super().parse(stream, media_type, parser_context)
+        body = stream.read()
+        if _LONG_NUMBER.search(body):
+            return super().parse(io.BytesIO(body), media_type, parser_context)
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            return super().parse(io.BytesIO(body), media_type, parser_context)
@@ -0,0 +1,103 @@
+from dataclasses import dataclass
+
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.relations import PrimaryKeyRelatedField
+
+
+@dataclass(frozen=True)
+class FieldSelection:
+    """
+    The ``?fields=`` and ``?expand=`` of a request, normalised so it can key caches.
+
+    ``fields`` keeps only the named fields, with dotted paths reaching into nested
+    objects (``subject.subject_name``). ``expand`` names the nested relations to
+    embed (``assignment.subject``); once it is given, every other nested relation
+    collapses to its id. ``None`` leaves that side as the serializer declares it.
+    """
+    fields: tuple | None = None
+    expand: tuple | None = None
+
+    @classmethod
+    def from_request(cls, request):
+        params = request.query_params
+        if 'fields' not in params and 'expand' not in params:
+            return None
+        return cls(_paths(params.get('fields')), _paths(params.get('expand')))
+
+
+def _paths(value):
+    if value is None:
+        return None
+    return tuple(sorted({path.strip() for path in value.split(',') if path.strip()}))
+
+
+def _tree(paths):
+    tree = {}
+    for path in paths:
+        node = tree
+        for name in path.split('.'):
+            node = node.setdefault(name, {})
+    return tree
+
+
+def apply_selection(declared, fields=None, expand=None, path=''):
+    """
+    Prune the ``declared`` fields mapping in place. ``fields`` and ``expand`` are
+    trees of names (``None`` for no restriction); nested serializers are pruned
+    through their own ``fields``.
+    """
+    nested = {name for name, field in declared.items() if isinstance(field, serializers.Serializer)}
+    errors = {}
+    unknown = sorted(set(fields or ()) - set(declared))
+    flat = sorted(name for name, inner in (fields or {}).items() if inner and name in declared and name not in nested)
+    if unknown or flat:
+        errors['fields'] = [f"Unknown field '{path}{name}'." for name in unknown]
+        errors['fields'] += [f"'{path}{name}' has no fields to select." for name in flat]
+    unexpandable = sorted(set(expand or ()) - nested)
+    if unexpandable:
+        errors['expand'] = [f"'{path}{name}' cannot be expanded." for name in unexpandable]
+    if errors:
+        raise serializers.ValidationError(errors)
+
+    for name in list(declared):
+        if fields and name not in fields:
+            del declared[name]
+        elif name in nested:
+            field = declared[name]
+            only = (fields or {}).get(name) or None
+            if expand is not None and name not in expand and only is None:
+                source = {} if field.source in (None, name) else {'source': field.source}
+                declared[name] = PrimaryKeyRelatedField(read_only=True, **source)
+                continue
+            # Relations inside an expanded one are embedded only when named too.
+            inner = None if expand is None else expand.get(name, {})
+            apply_selection(field.fields, only, inner, f'{path}{name}.')
+
+
+class SparseFieldsMixin:
+    """
+    Serializer honouring a ``FieldSelection`` passed as ``field_selection`` in its
+    own context. Nested serializers are pruned by the outermost one.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        selection = self._context.get('field_selection')
+        if selection is not None:
+            apply_selection(
+                fields,
+                _tree(selection.fields) if selection.fields is not None else None,
+                _tree(selection.expand) if selection.expand is not None else None,
+            )
+        return fields
+
+
+def get_field_selection(view):
+    """The ``FieldSelection`` of a read request whose serializer supports one, else ``None``."""
+    if not hasattr(view, '_field_selection'):
+        view._field_selection = None
+        request = getattr(view, 'request', None)
+        if request is not None and request.method in SAFE_METHODS and issubclass(view.get_serializer_class(), SparseFieldsMixin):
+            view._field_selection = FieldSelection.from_request(request)
+    return view._field_selection
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -41,12 +42,16 @@ INSTALLED_APPS = [
     "department",
     "account",
     "assessment",
-    
+    # For its management commands.
+    "core",
 ]
 
 MIDDLEWARE = [
+    'core.profiling.ProfilingMiddleware',
+    'core.nplusone.NPlusOneMiddleware',
     "corsheaders.middleware.CorsMiddleware",
     'django.middleware.security.SecurityMiddleware',
+    'core.middleware.ReplicaRoutingMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -81,13 +86,83 @@ WSGI_APPLICATION = 'core.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
-DATABASES = {
+# Configured from the environment; the defaults are the SQLite development database.
+# DB_REPLICAS lists read replicas as comma separated hosts (or database files for SQLite).
+_db_engine = os.environ.get('DB_ENGINE', 'django.db.backends.sqlite3')
+_primary = {
+    'ENGINE': _db_engine,
+    'NAME': os.environ.get('DB_NAME', BASE_DIR / 'db.sqlite3'),
+    'USER': os.environ.get('DB_USER', ''),
+    'PASSWORD': os.environ.get('DB_PASSWORD', ''),
+    'HOST': os.environ.get('DB_HOST', ''),
+    'PORT': os.environ.get('DB_PORT', ''),
+    # Persistent connections, checked before reuse so a dropped one is replaced transparently.
+    'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', 60)),
+    'CONN_HEALTH_CHECKS': os.environ.get('DB_CONN_HEALTH_CHECKS', 'true').lower() == 'true',
+}
+DATABASES = {'default': _primary}
+for _index, _replica in enumerate(filter(None, os.environ.get('DB_REPLICAS', '').split(',')), start=1):
+    _location = {'NAME': _replica.strip()} if _db_engine.endswith('sqlite3') else {'HOST': _replica.strip()}
+    DATABASES[f'replica_{_index}'] = {**_primary, **_location, 'TEST': {'MIRROR': 'default'}}
+
+REPLICA_DATABASES = [alias for alias in DATABASES if alias != 'default']
+DATABASE_ROUTERS = ['core.db_router.PrimaryReplicaRouter']
+
+# Local memory in development; set REDIS_URL to share the cache between processes.
+CACHES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+if os.environ.get('REDIS_URL'):
+    CACHES['default'] = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.environ['REDIS_URL'],
     }
+
+REST_FRAMEWORK = {
+    'DEFAULT_PAGINATION_CLASS': 'core.pagination.KeysetPagination',
+    'PAGE_SIZE': 50,
+    'DEFAULT_RENDERER_CLASSES': [
+        'core.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'core.renderers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
 }
 
+# JSON encoder behind core.renderers: 'auto' uses orjson when it is installed, 'stdlib' never does.
+JSON_BACKEND = os.environ.get('JSON_BACKEND', 'auto')
+
+# Fraction of requests logged with their slowest SQL by core.profiling.ProfilingMiddleware; off unless set.
+PROFILING_SAMPLE_RATE = float(os.environ.get('PROFILING_SAMPLE_RATE', 0))
+PROFILING_SLOWEST_QUERIES = 5
+
+# Report SELECTs repeated more than NPLUSONE_THRESHOLD times in a request: 'log', 'raise' or 'off'.
+NPLUSONE_MODE = os.environ.get('NPLUSONE_MODE', 'log')
+NPLUSONE_THRESHOLD = int(os.environ.get('NPLUSONE_THRESHOLD', 5))
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'core.profiling': {'handlers': ['console'], 'level': 'INFO', 'propagate': False},
+        'core.nplusone': {'handlers': ['console'], 'level': 'WARNING', 'propagate': False},
+    },
+}
+
+# Best matches a user search keeps (account.search.apply_search); paging through a search ends there.
+SEARCH_RESULT_LIMIT = int(os.environ.get('SEARCH_RESULT_LIMIT', 500))
+
+# Processes used to hash passwords during bulk user imports.
+BULK_IMPORT_WORKERS = 2
+
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:3000",
     # add other allowed domains here
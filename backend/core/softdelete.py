@@ -0,0 +1,131 @@
+from collections import Counter
+
+from django.db import models, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+LIVE = Q(deleted_at__isnull=True)
+
+
+class SoftDeleteQuerySet(models.QuerySet):
+    def alive(self):
+        return self.filter(LIVE)
+
+    def dead(self):
+        return self.filter(deleted_at__isnull=False)
+
+    def delete(self):
+        """
+        Soft delete every row through ``Model.delete()`` so post_save receivers
+        (caches, counters, search, gradebook) see each one. Returns the same
+        ``(total, {label: count})`` pair as ``QuerySet.delete()``.
+        """
+        counts = Counter()
+        with transaction.atomic(using=self.db):
+            for instance in self.alive():
+                counts.update(instance.delete()[1])
+        return sum(counts.values()), dict(counts)
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
+    def hard_delete(self):
+        return super().delete()
+
+    hard_delete.alters_data = True
+    hard_delete.queryset_only = True
+
+    def restore(self):
+        restored = 0
+        with transaction.atomic(using=self.db):
+            for instance in self.dead():
+                instance.restore()
+                restored += 1
+        return restored
+
+    restore.alters_data = True
+    restore.queryset_only = True
+
+
+class SoftDeleteManager(models.Manager.from_queryset(SoftDeleteQuerySet)):
+    """Manager over live rows only; ``all_objects`` on the model reaches deleted ones too."""
+
+    def get_queryset(self):
+        return super().get_queryset().filter(LIVE)
+
+
+def live_index(*fields, name):
+    """An index over live rows only, for the lists served through ``objects``."""
+    return models.Index(fields=list(fields), condition=LIVE, name=name)
+
+
+class SoftDeleteModel(models.Model):
+    """
+    Base for models whose rows are hidden rather than removed.
+
+    ``objects`` is the default manager and sees live rows only, so viewsets,
+    admin, reverse relations and prefetches skip deleted ones; ``all_objects``
+    keeps the history queryable. Forward relations still resolve to a deleted
+    row, and cascades only happen on ``hard_delete()``, except along the
+    reverse relations named in ``soft_delete_cascade``: their rows are soft
+    deleted with this one and restored with it.
+    """
+    deleted_at = models.DateTimeField(blank=True, null=True, editable=False)
+
+    objects = SoftDeleteManager()
+    all_objects = SoftDeleteQuerySet.as_manager()
+
+    soft_delete_cascade = ()
+
+    class Meta:
+        abstract = True
+
+    @property
+    def is_deleted(self):
+        return self.deleted_at is not None
+
+    def _save_deleted_at(self, value, using=None):
+        self.deleted_at = value
+        # Touch auto_now columns too so conditional GETs see the change.
+        touched = [field.name for field in self._meta.concrete_fields if getattr(field, 'auto_now', False)]
+        self.save(using=using, update_fields=['deleted_at', *touched])
+
+    def _cascaded(self, using=None):
+        for name in self.soft_delete_cascade:
+            relation = self._meta.get_field(name)
+            yield relation.related_model.all_objects.using(using or self._state.db).filter(**{relation.field.name: self})
+
+    def _soft_delete(self, when, using, counts):
+        for related in self._cascaded(using):
+            for instance in related.alive():
+                instance._soft_delete(when, using, counts)
+        self._save_deleted_at(when, using)
+        counts[self._meta.label] += 1
+
+    def delete(self, using=None, keep_parents=False):
+        if self.deleted_at is not None:
+            return 0, {}
+        counts = Counter()
+        with transaction.atomic(using=using or self._state.db):
+            self._soft_delete(timezone.now(), using, counts)
+        return sum(counts.values()), dict(counts)
+
+    delete.alters_data = True
+
+    def hard_delete(self, using=None, keep_parents=False):
+        return super().delete(using=using, keep_parents=keep_parents)
+
+    hard_delete.alters_data = True
+
+    def restore(self, using=None):
+        if self.deleted_at is None:
+            return
+        when = self.deleted_at
+        with transaction.atomic(using=using or self._state.db):
+            self._save_deleted_at(None, using)
+            # Only rows deleted along with this one; ones deleted on their own stay deleted.
+            for related in self._cascaded(using):
+                for instance in related.filter(deleted_at=when):
+                    instance.restore(using)
+
+    restore.alters_data = True
@@ -0,0 +1,190 @@
+import json
+from types import SimpleNamespace
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.core.handlers.asgi import ASGIHandler
+from django.db import router
+from django.db.models import F
+from django.test import RequestFactory, TestCase, TransactionTestCase, override_settings
+
+from rest_framework.test import APIClient
+
+from account.models import User
+from account.roles import get_role
+from assessment.feed import get_section_feed
+from assessment.models import Submission
+from assessment.seeding import seed_dataset
+from department.models import Department, Section
+
+from .db_router import primary_reads, replica_reads
+from .middleware import ReplicaRoutingMiddleware
+from .profiling import collect_queries
+from .views import SUMMARY_QUERIES
+
+
+class AsyncMiddlewareTests(TestCase):
+    """The middleware stack stays async under ASGI and still profiles the request; only sampled requests are logged."""
+
+    @classmethod
+    def setUpTestData(cls):
+        Department.objects.create(department_code='ASY', department_name='Async')
+
+    def setUp(self):
+        # Reference data lists are cached, and a hit runs no queries to time.
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    @override_settings(DEBUG=True)
+    def test_no_adapted_middleware(self):
+        # With DEBUG on, Django logs "Asynchronous handler adapted for middleware ..." for each sync-only one.
+        with self.assertNoLogs('django.request', 'DEBUG'):
+            ASGIHandler()
+
+    def test_sampling(self):
+        with self.assertNoLogs('core.profiling'):
+            self.client.get('/api/departments/')
+        with override_settings(PROFILING_SAMPLE_RATE=1), self.assertLogs('core.profiling') as logs:
+            self.client.get('/api/departments/')
+        self.assertEqual(json.loads(logs.records[0].getMessage())['path'], '/api/departments/')
+
+    async def test_server_timing(self):
+        response = await self.async_client.get('/api/departments/')
+        self.assertEqual(response.status_code, 200)
+        self.assertRegex(response['Server-Timing'], r'db;dur=[\d.]+;desc="[1-9]\d* queries"')
+
+
+# An alias with no connection behind it: any read routed there raises.
+@override_settings(REPLICA_DATABASES=['replica_1'])
+class ReplicaRoutingTests(TestCase):
+    """Safe requests read from a replica until a write, and caches are always filled from the primary."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.department = Department.objects.create(department_code='RPL', department_name='Replica')
+        cls.user = User.objects.create_user(username='replica', email='replica@example.com', password='x', user_type='Admin')
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def test_routing(self):
+        self.assertEqual(router.db_for_read(Department), 'default')
+        with replica_reads():
+            self.assertEqual(router.db_for_read(Department), 'replica_1')
+            with primary_reads():
+                self.assertEqual(router.db_for_read(Department), 'default')
+            self.assertEqual(router.db_for_read(Department), 'replica_1')
+            self.assertEqual(router.db_for_write(Department), 'default')
+            self.assertEqual(router.db_for_read(Department), 'default')
+        self.assertEqual(router.db_for_read(Department), 'default')
+
+    def test_middleware(self):
+        middleware = ReplicaRoutingMiddleware(lambda request: router.db_for_read(Department))
+        factory = RequestFactory()
+        self.assertEqual(middleware(factory.get('/')), 'replica_1')
+        self.assertEqual(middleware(factory.head('/')), 'replica_1')
+        self.assertEqual(middleware(factory.post('/')), 'default')
+        self.assertEqual(middleware(factory.delete('/')), 'default')
+        self.assertEqual(router.db_for_read(Department), 'default')
+
+    def test_cache_filled_from_primary(self):
+        response = self.client.get('/api/departments/')
+        self.assertEqual(response.status_code, 200)
+        with replica_reads():
+            self.assertEqual(get_role(SimpleNamespace(user=self.user)).user_type, 'Admin')
+            self.assertEqual(get_section_feed(uuid4()), {'assignments': [], 'tests': []})
+
+
+class KeysetPaginationTests(TestCase):
+    """Walking the cursor links visits every row once, in order, in both directions."""
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_dataset(departments=1, sections_per_department=1, students_per_section=4, subjects_per_department=2)
+        pks = list(Submission.objects.order_by('pk').values_list('pk', flat=True))
+        # Ties and NULLs in the sort key, which the cursor must step over by id.
+        Submission.objects.filter(pk__in=pks[::3]).update(obtained_marks=None)
+        Submission.objects.filter(pk__in=pks[1::3]).update(obtained_marks=7)
+        cls.admin = User.objects.create_superuser(username='page-admin', email='page-admin@example.com', password='x', user_type='Admin')
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def walk(self, url, link):
+        """The ids of each page reached by following ``link`` from ``url``, and the last page's body."""
+        pages = []
+        while True:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            body = response.json()
+            self.assertLessEqual(len(body['results']), 5)
+            pages.append([row['id'] for row in body['results']])
+            if body[link] is None:
+                return pages, body
+            url = body[link]
+
+    def assertWalks(self, query, *order_by):
+        expected = [str(pk) for pk in Submission.objects.order_by(*order_by).values_list('pk', flat=True)]
+        forward, last = self.walk(f'/api/submissions/?page_size=5{query}', 'next')
+        self.assertGreater(len(forward), 2)
+        self.assertEqual([pk for page in forward for pk in page], expected)
+
+        backward, first = self.walk(last['previous'], 'previous')
+        self.assertEqual(backward, forward[-2::-1])
+        self.assertIsNone(first['previous'])
+
+    def test_nullable_ascending(self):
+        self.assertWalks('&ordering=obtained_marks', F('obtained_marks').asc(nulls_last=True), 'id')
+
+    def test_nullable_descending(self):
+        self.assertWalks('&ordering=-obtained_marks', F('obtained_marks').desc(nulls_last=True), '-id')
+
+    def test_default_ordering(self):
+        self.assertWalks('', '-submitted_at', '-id')
+
+    def test_invalid_cursor(self):
+        self.assertEqual(self.client.get('/api/submissions/?cursor=bm90LWpzb24').status_code, 404)
+
+
+# The counts run on worker threads with their own connections, which only see committed rows.
+class DashboardSummaryTests(TransactionTestCase):
+    """The dashboard runs one count per figure, concurrently, and serves them from the cache after."""
+
+    def setUp(self):
+        department = Department.objects.create(department_code='DSH', department_name='Dashboard', is_active=False)
+        Section.objects.create(section_code='DSH-A', section_name='A', department=department, academic_year='2025-2026', batch_year=2025)
+        self.admin = User.objects.create_superuser(username='dash-admin', email='dash-admin@example.com', password='x', user_type='Admin')
+        self.user = User.objects.create_user(username='dash-user', email='dash-user@example.com', password='x', user_type='Student')
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    async def get_summary(self):
+        statements = []
+
+        def collect(execute, sql, params, many, context):
+            statements.append(sql)
+            return execute(sql, params, many, context)
+
+        with collect_queries(collect):
+            response = await self.async_client.get('/api/dashboard/summary/')
+        return response, [sql for sql in statements if 'COUNT(' in sql]
+
+    async def test_summary(self):
+        await self.async_client.aforce_login(self.admin)
+        response, counts = await self.get_summary()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(counts), len(SUMMARY_QUERIES))
+        summary = response.json()
+        self.assertEqual(set(summary), set(SUMMARY_QUERIES))
+        self.assertEqual((summary['departments'], summary['active_departments'], summary['sections'], summary['students']), (1, 0, 1, 0))
+
+        response, counts = await self.get_summary()
+        self.assertEqual(response.json(), summary)
+        self.assertEqual(counts, [])
+
+    async def test_permissions(self):
+        self.assertEqual((await self.async_client.get('/api/dashboard/summary/')).status_code, 401)
+        await self.async_client.aforce_login(self.user)
+        self.assertEqual((await self.async_client.get('/api/dashboard/summary/')).status_code, 403)
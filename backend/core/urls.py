@@ -16,6 +16,7 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path,include
+from .views import dashboard_summary
 
 
 
@@ -24,5 +25,6 @@ urlpatterns = [
     path('api/', include('department.urls')),   
     path('api/', include('account.urls')),
     path('api/', include('assessment.urls')),
+    path('api/dashboard/summary/', dashboard_summary),
 
 ]
@@ -0,0 +1,60 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.db import close_old_connections
+from django.http import JsonResponse
+from django.views.decorators.http import require_GET
+
+from account.models import StudentProfile, TeacherProfile
+from assessment.models import Assignment, Quiz, Submission, Test
+from department.models import Department, Section, Subject
+
+SUMMARY_CACHE_KEY = 'dashboard:summary'
+SUMMARY_TIMEOUT = 30
+
+SUMMARY_QUERIES = {
+    'departments': lambda: Department.objects.count(),
+    'active_departments': lambda: Department.objects.filter(is_active=True).count(),
+    'sections': lambda: Section.objects.count(),
+    'subjects': lambda: Subject.objects.count(),
+    'teachers': lambda: TeacherProfile.objects.count(),
+    'students': lambda: StudentProfile.objects.count(),
+    'assignments': lambda: Assignment.objects.count(),
+    'quizzes': lambda: Quiz.objects.count(),
+    'tests': lambda: Test.objects.count(),
+    'submissions': lambda: Submission.objects.count(),
+    'pending_submissions': lambda: Submission.objects.filter(is_evaluated=False).count(),
+}
+
+
+def _run(query):
+    try:
+        return query()
+    finally:
+        # Worker threads outlive the request, so honour CONN_MAX_AGE for their connections here.
+        close_old_connections()
+
+
+async def _summary():
+    # thread_sensitive=False runs each count on its own thread and connection, so they overlap.
+    counts = await asyncio.gather(*(
+        sync_to_async(_run, thread_sensitive=False)(query) for query in SUMMARY_QUERIES.values()
+    ))
+    return dict(zip(SUMMARY_QUERIES, counts))
+
+
+@require_GET
+async def dashboard_summary(request):
+    """Admin dashboard counts in one payload, cached for ``SUMMARY_TIMEOUT`` seconds."""
+    user = await request.auser()
+    if not user.is_authenticated:
+        return JsonResponse({"detail": "Authentication credentials were not provided."}, status=401)
+    if not (user.is_staff or user.is_superuser):
+        return JsonResponse({"detail": "You do not have permission to perform this action."}, status=403)
+
+    summary = await cache.aget(SUMMARY_CACHE_KEY)
+    if summary is None:
+        summary = await _summary()
+        await cache.aset(SUMMARY_CACHE_KEY, summary, SUMMARY_TIMEOUT)
+    return JsonResponse(summary)
@@ -10,10 +10,11 @@ class DepartmentAdmin(admin.ModelAdmin):
 
 @admin.register(Section)
 class SectionAdmin(admin.ModelAdmin):
-    list_display = ('section_code', 'section_name', 'department', 'current_semester', 'academic_year', 'batch_year', 'capacity', 'is_active')
+    list_display = ('section_code', 'section_name', 'department', 'current_semester', 'academic_year', 'batch_year', 'capacity', 'enrolled_count', 'is_active')
     list_filter = ('academic_year', 'current_semester', 'is_active', 'department')
     search_fields = ('section_code', 'section_name')
     autocomplete_fields = ['department']
+    list_select_related = ('department',)
     list_per_page = 25  # Pagination
 
 @admin.register(Subject)
@@ -22,4 +23,5 @@ class SubjectAdmin(admin.ModelAdmin):
     list_filter = ('is_open_elective', 'semester', 'is_active', 'department')
     search_fields = ('subject_code', 'subject_name')
     autocomplete_fields = ['department']
+    list_select_related = ('department',)
     list_per_page = 25  # Pagination
@@ -0,0 +1,72 @@
+from django.db import transaction
+from django.db.models import Count, F, IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from account.models import StudentProfile, TeacherProfile
+from core.cache import bump_cache_version
+
+from .models import Department, Section
+
+
+def _apply(queryset, **deltas):
+    deltas = {name: delta for name, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    # update() skips auto_now and post_save, so refresh updated_at and the cache version by hand.
+    queryset.update(updated_at=timezone.now(), **{name: F(name) + delta for name, delta in deltas.items()})
+    bump_cache_version(queryset.model)
+
+
+def adjust_faculty(department_id, delta):
+    if department_id is not None:
+        _apply(Department.objects.filter(pk=department_id), total_faculty_count=delta)
+
+
+def adjust_enrollment(section_id, delta):
+    """Move ``delta`` students into a section, counting them against its department as well."""
+    if section_id is None:
+        return
+    with transaction.atomic():
+        _apply(Section.objects.filter(pk=section_id), enrolled_count=delta)
+        _apply(Department.objects.filter(sections=section_id), current_student_count=delta)
+
+
+def move_section_students(section_id, old_department_id, new_department_id):
+    """Carry a section's enrolled students over when it changes department."""
+    enrolled = Section.objects.filter(pk=section_id).values_list('enrolled_count', flat=True).first() or 0
+    with transaction.atomic():
+        _apply(Department.objects.filter(pk=old_department_id), current_student_count=-enrolled)
+        _apply(Department.objects.filter(pk=new_department_id), current_student_count=enrolled)
+
+
+def _count(queryset, group_by):
+    rows = queryset.filter(**{group_by: OuterRef('pk')}).order_by().values(group_by).annotate(total=Count('pk')).values('total')
+    return Coalesce(Subquery(rows), Value(0), output_field=IntegerField())
+
+
+def reconcile_counters():
+    """
+    Recompute every counter from the profile tables in one UPDATE per model.
+
+    Only rows that drifted are written, so their ``updated_at`` and cached
+    responses stay valid otherwise. Returns ``(sections, departments)`` fixed.
+    """
+    now = timezone.now()
+    enrolled = _count(StudentProfile.objects, 'section')
+    students = _count(StudentProfile.objects, 'section__department')
+    faculty = _count(TeacherProfile.objects, 'department')
+    with transaction.atomic():
+        sections = (
+            Section.objects.exclude(enrolled_count=enrolled)
+            .update(enrolled_count=enrolled, updated_at=now)
+        )
+        departments = (
+            Department.objects.filter(~Q(current_student_count=students) | ~Q(total_faculty_count=faculty))
+            .update(current_student_count=students, total_faculty_count=faculty, updated_at=now)
+        )
+    if sections:
+        bump_cache_version(Section)
+    if departments:
+        bump_cache_version(Department)
+    return sections, departments
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from department.counters import reconcile_counters
+
+
+class Command(BaseCommand):
+    help = "Recompute department and section headcount counters from the profile tables."
+
+    def handle(self, *args, **options):
+        sections, departments = reconcile_counters()
+        self.stdout.write(self.style.SUCCESS(f"Fixed counters on {sections} sections and {departments} departments."))
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.4 on 2026-10-18 18:12
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def _count(queryset, group_by):
+    rows = queryset.filter(**{group_by: OuterRef('pk')}).order_by().values(group_by).annotate(total=Count('pk')).values('total')
+    return Coalesce(Subquery(rows), Value(0), output_field=IntegerField())
+
+
+def populate_counters(apps, schema_editor):
+    Department = apps.get_model('department', 'Department')
+    Section = apps.get_model('department', 'Section')
+    StudentProfile = apps.get_model('account', 'StudentProfile')
+    TeacherProfile = apps.get_model('account', 'TeacherProfile')
+    Section.objects.update(enrolled_count=_count(StudentProfile.objects, 'section'))
+    Department.objects.update(
+        current_student_count=_count(StudentProfile.objects, 'section__department'),
+        total_faculty_count=_count(TeacherProfile.objects, 'department'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0004_user_search_index'),
+        ('department', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='section',
+            name='enrolled_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
@@ -1,7 +1,27 @@
 import uuid
 from django.db import models
 
-class Department(models.Model):
+from core.softdelete import SoftDeleteModel
+
+
+class CounterModel(models.Model):
+    """Base for models with counters that are only ever changed by ``F()`` updates."""
+    counter_fields = ()
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        # A full save would write back the counters as they were when the row was loaded.
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.counter_fields
+            ]
+        super().save(*args, **kwargs)
+
+
+class Department(CounterModel, SoftDeleteModel):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     department_code = models.CharField(max_length=10, unique=True, db_index=True)
     department_name = models.CharField(max_length=100, db_index=True)
@@ -13,13 +33,16 @@ class Department(models.Model):
     is_active = models.BooleanField(default=True, db_index=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    deleted_at = models.DateTimeField(blank=True, null=True)
+
+    counter_fields = ('total_faculty_count', 'current_student_count')
+    # Columns read by __str__ and properties; compiled serializers project only these (see core.compiled).
+    attribute_fields = {'__str__': ('department_name',)}
 
     def __str__(self):
         return self.department_name
 
 
-class Section(models.Model):
+class Section(CounterModel, SoftDeleteModel):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     section_code = models.CharField(max_length=10, unique=True)
     section_name = models.CharField(max_length=100)
@@ -29,16 +52,24 @@ class Section(models.Model):
     batch_year = models.IntegerField()
     capacity = models.IntegerField(default=60)
     max_capacity = models.IntegerField(default=60)
+    enrolled_count = models.IntegerField(default=0)
     academic_status = models.CharField(max_length=20, default='active')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     is_active = models.BooleanField(default=True)
 
+    counter_fields = ('enrolled_count',)
+    attribute_fields = {'__str__': ('section_code',), 'seats_available': ('max_capacity', 'enrolled_count')}
+
     def __str__(self):
         return self.section_code
 
+    @property
+    def seats_available(self):
+        return self.max_capacity - self.enrolled_count
 
-class Subject(models.Model):
+
+class Subject(SoftDeleteModel):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     is_open_elective = models.BooleanField(default=False)
     subject_code = models.CharField(max_length=20, unique=True)
@@ -51,6 +82,8 @@ class Subject(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    attribute_fields = {'__str__': ('subject_name',)}
+
     def __str__(self):
         return self.subject_name
 
@@ -5,11 +5,15 @@ class DepartmentSerializer(serializers.ModelSerializer):
     class Meta:
         model = Department
         fields = '__all__'
+        read_only_fields = Department.counter_fields
 
 class SectionSerializer(serializers.ModelSerializer):
+    seats_available = serializers.IntegerField(read_only=True)
+
     class Meta:
         model = Section
         fields = '__all__'
+        read_only_fields = Section.counter_fields
 
 class SubjectSerializer(serializers.ModelSerializer):
     class Meta:
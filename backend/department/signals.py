@@ -0,0 +1,31 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from core.cache import bump_cache_version
+
+from .counters import move_section_students
+from .models import Department, Section, Subject
+
+
+@receiver(post_save, sender=Department)
+@receiver(post_delete, sender=Department)
+@receiver(post_save, sender=Section)
+@receiver(post_delete, sender=Section)
+@receiver(post_save, sender=Subject)
+@receiver(post_delete, sender=Subject)
+def bump_reference_data_version(sender, **kwargs):
+    bump_cache_version(sender)
+
+
+@receiver(pre_save, sender=Section)
+def remember_section_department(sender, instance, **kwargs):
+    instance._previous_department_id = None
+    if not instance._state.adding:
+        instance._previous_department_id = Section.all_objects.filter(pk=instance.pk).values_list('department_id', flat=True).first()
+
+
+@receiver(post_save, sender=Section)
+def move_section_headcount(sender, instance, created, **kwargs):
+    previous = getattr(instance, '_previous_department_id', None)
+    if not created and previous is not None and previous != instance.department_id:
+        move_section_students(instance.pk, previous, instance.department_id)
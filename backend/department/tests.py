@@ -1,3 +1,191 @@
+import datetime
+
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from account.models import StudentProfile, TeacherProfile, User
+
+from .counters import reconcile_counters
+from .models import Department, Section, Subject
+
+
+class ReferenceDataTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.department = Department.objects.create(department_code='CSE', department_name='Computer Science')
+        cls.section = Section.objects.create(section_code='CSE-A', section_name='A', department=cls.department, academic_year='2025-2026', batch_year=2025)
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.client = APIClient()
+
+    def create_student(self, username, section):
+        user = User.objects.create_user(username=username, email=f'{username}@example.com', password='x', user_type='Student')
+        return StudentProfile.objects.create(
+            user=user, section=section, admission_year=2025, batch_year=2025, date_of_birth=datetime.date(2007, 1, 1),
+        )
+
+    def create_teacher(self, username, department):
+        user = User.objects.create_user(username=username, email=f'{username}@example.com', password='x', user_type='Teacher')
+        return TeacherProfile.objects.create(user=user, department=department, designation='Lecturer', qualification='MSc')
+
+
+class ConditionalGetTests(ReferenceDataTestCase):
+    """Cached reference data is validated from its cache version, without touching the database."""
+
+    def test_not_modified(self):
+        response = self.client.get('/api/departments/')
+        etag = response['ETag']
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get('/api/departments/', HTTP_IF_NONE_MATCH=etag).status_code, 304)
+            self.assertEqual(self.client.get('/api/departments/')['ETag'], etag)
+
+        self.department.short_name = 'CS'
+        self.department.save()
+        response = self.client.get('/api/departments/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+
+class VersionedCacheTests(ReferenceDataTestCase):
+    """List and detail payloads are served from the cache until a write to their model."""
+
+    def test_hit(self):
+        for url in ('/api/departments/', f'/api/sections/{self.section.pk}/'):
+            with self.subTest(url=url):
+                data = self.client.get(url).json()
+                with self.assertNumQueries(0):
+                    self.assertEqual(self.client.get(url).json(), data)
+
+    def test_invalidated_on_write(self):
+        url = f'/api/sections/{self.section.pk}/'
+        self.assertEqual(self.client.get(url).json()['section_name'], 'A')
+        self.section.section_name = 'B'
+        self.section.save()
+        self.assertEqual(self.client.get(url).json()['section_name'], 'B')
+
+        self.assertEqual(len(self.client.get('/api/departments/').json()['results']), 1)
+        Department.objects.create(department_code='EEE', department_name='Electrical Engineering')
+        self.assertEqual(len(self.client.get('/api/departments/').json()['results']), 2)
+        self.department.delete()
+        self.assertEqual([row['department_code'] for row in self.client.get('/api/departments/').json()['results']], ['EEE'])
+
+
+class CounterTests(ReferenceDataTestCase):
+    """Headcounts follow profile creates, transfers and soft deletes without recounting."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.other_department = Department.objects.create(department_code='EEE', department_name='Electrical Engineering')
+        cls.other_section = Section.objects.create(section_code='EEE-A', section_name='A', department=cls.other_department, academic_year='2025-2026', batch_year=2025)
+
+    def counts(self):
+        sections = Section.objects.filter(pk__in=[self.section.pk, self.other_section.pk]).order_by('section_code')
+        departments = Department.objects.filter(pk__in=[self.department.pk, self.other_department.pk]).order_by('department_code')
+        return (
+            [section.enrolled_count for section in sections],
+            [(department.current_student_count, department.total_faculty_count) for department in departments],
+        )
+
+    def test_students(self):
+        student = self.create_student('counted', self.section)
+        self.create_student('other', self.section)
+        self.assertEqual(self.counts(), ([2, 0], [(2, 0), (0, 0)]))
+
+        student.section = self.other_section
+        student.save()
+        self.assertEqual(self.counts(), ([1, 1], [(1, 0), (1, 0)]))
+
+        student.delete()
+        self.assertEqual(self.counts(), ([1, 0], [(1, 0), (0, 0)]))
+        student.restore()
+        self.assertEqual(self.counts(), ([1, 1], [(1, 0), (1, 0)]))
+
+    def test_teachers(self):
+        teacher = self.create_teacher('counted', self.department)
+        self.assertEqual(self.counts(), ([0, 0], [(0, 1), (0, 0)]))
+
+        teacher.department = self.other_department
+        teacher.save()
+        self.assertEqual(self.counts(), ([0, 0], [(0, 0), (0, 1)]))
+
+        teacher.delete()
+        self.assertEqual(self.counts(), ([0, 0], [(0, 0), (0, 0)]))
+
+    def test_section_changes_department(self):
+        self.create_student('moved', self.section)
+        self.section.department = self.other_department
+        self.section.save()
+        self.assertEqual(self.counts(), ([1, 0], [(0, 0), (1, 0)]))
+
+    def test_stale_save_keeps_counters(self):
+        stale = Section.objects.get(pk=self.section.pk)
+        self.create_student('counted', self.section)
+        stale.section_name = 'Renamed'
+        stale.save()
+        self.assertEqual(self.counts(), ([1, 0], [(1, 0), (0, 0)]))
+
+    def test_visible_through_the_cache(self):
+        url = f'/api/sections/{self.section.pk}/'
+        self.assertEqual(self.client.get(url).json()['enrolled_count'], 0)
+        self.create_student('counted', self.section)
+        self.assertEqual(self.client.get(url).json()['enrolled_count'], 1)
+
+    def test_reconcile(self):
+        self.create_student('counted', self.section)
+        self.create_teacher('teacher', self.department)
+        Section.objects.update(enrolled_count=5)
+        Department.objects.filter(pk=self.other_department.pk).update(total_faculty_count=3)
+        self.assertEqual(reconcile_counters(), (2, 1))
+        self.assertEqual(self.counts(), ([1, 0], [(1, 1), (0, 0)]))
+        self.assertEqual(reconcile_counters(), (0, 0))
+
+
+class SoftDeleteTests(ReferenceDataTestCase):
+    """Deleted reference data leaves the cached lists, stays in ``all_objects`` and keeps its counters."""
+
+    def codes(self, resource, field):
+        return [row[field] for row in self.client.get(f'/api/{resource}/').json()['results']]
+
+    def test_delete_and_restore(self):
+        subject = Subject.objects.create(subject_code='CS101', subject_name='Programming', department=self.department, semester=1)
+        for resource, field, instance in (
+            ('subjects', 'subject_code', subject),
+            ('sections', 'section_code', self.section),
+            ('departments', 'department_code', self.department),
+        ):
+            with self.subTest(resource=resource):
+                code = getattr(instance, field)
+                self.assertEqual(self.codes(resource, field), [code])
+                self.assertEqual(instance.delete(), (1, {instance._meta.label: 1}))
+                self.assertEqual(self.codes(resource, field), [])
+                self.assertTrue(type(instance).all_objects.dead().filter(pk=instance.pk).exists())
+                instance.restore()
+                self.assertEqual(self.codes(resource, field), [code])
+
+    def test_queryset_delete(self):
+        Subject.objects.bulk_create([
+            Subject(subject_code=f'CS10{number}', subject_name='Subject', department=self.department, semester=1)
+            for number in range(3)
+        ])
+        self.client.get('/api/subjects/')
+        self.assertEqual(Subject.objects.filter(subject_code__in=['CS100', 'CS101']).delete(), (2, {'department.Subject': 2}))
+        self.assertEqual(self.codes('subjects', 'subject_code'), ['CS102'])
+        self.assertEqual(Subject.all_objects.count(), 3)
 
-# Create your tests here.
+    def test_counters_kept(self):
+        self.create_student('student', self.section)
+        self.create_teacher('teacher', self.department)
+        self.section.delete()
+        self.department.delete()
+        department = Department.all_objects.get(pk=self.department.pk)
+        self.assertEqual((department.current_student_count, department.total_faculty_count), (1, 1))
+        self.assertEqual(Section.all_objects.get(pk=self.section.pk).enrolled_count, 1)
+        # The profiles still point at the deleted rows, so a recount agrees.
+        self.assertEqual(reconcile_counters(), (0, 0))
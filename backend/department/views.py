@@ -1,15 +1,18 @@
 from rest_framework import viewsets
 from .models import Department, Section, Subject
 from .serializers import DepartmentSerializer, SectionSerializer, SubjectSerializer
+from core.mixins import ConditionalGetMixin, RelatedPlanMixin
+from core.compiled import FastListMixin
+from core.cache import VersionedCacheMixin
 
-class DepartmentViewSet(viewsets.ModelViewSet):
+class DepartmentViewSet(ConditionalGetMixin, VersionedCacheMixin, FastListMixin, RelatedPlanMixin, viewsets.ModelViewSet):
     queryset = Department.objects.all()
     serializer_class = DepartmentSerializer
 
-class SectionViewSet(viewsets.ModelViewSet):
+class SectionViewSet(ConditionalGetMixin, VersionedCacheMixin, FastListMixin, RelatedPlanMixin, viewsets.ModelViewSet):
     queryset = Section.objects.all()
     serializer_class = SectionSerializer
 
-class SubjectViewSet(viewsets.ModelViewSet):
+class SubjectViewSet(ConditionalGetMixin, VersionedCacheMixin, FastListMixin, RelatedPlanMixin, viewsets.ModelViewSet):
     queryset = Subject.objects.all()
     serializer_class = SubjectSerializer